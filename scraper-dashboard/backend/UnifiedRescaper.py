@@ -3,7 +3,7 @@ import requests
 import re
 import pandas as pd
 from supabase import create_client, Client
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 from urllib.parse import urlparse
 import mimetypes
@@ -11,7 +11,9 @@ import time
 import statistics
 from tqdm import tqdm
 import asyncio
+import heapq
 import io
+from collections import Counter, deque
 from PIL import Image
 import pillow_heif
 import aiohttp
@@ -19,7 +21,8 @@ from concurrent.futures import ThreadPoolExecutor
 import ssl
 import traceback
 import signal
-from functools import wraps
+from functools import partial, wraps
+import contextvars
 import sys
 
 # Add current directory to path for API reliability fix
@@ -27,7 +30,13 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from api_reliability_fix import make_instagram_api_call, make_tiktok_api_call, format_error_summary
+from api_reliability_fix import (
+    make_instagram_api_call, make_tiktok_api_call, format_error_summary, api_call_scope,
+    MAX_REQUEUES, requeue_delay
+)
+from adaptive_concurrency import AIMDController
+from tombstones import find_tombstone, bury_handle, tombstone_message
+from rescrape_tiers import plan_rescrape, follower_move_needs_full, record_rescrape, RESCRAPE_FULL_FOLLOWER_CHANGE
 
 # ==================== TIMEOUT PROTECTION ====================
 # Using asyncio-based timeouts instead of signal-based ones for better compatibility
@@ -61,9 +70,29 @@ TABLE_NAME = "creatordata"
 MAX_RECENT_POSTS = 4
 
 # ==================== CONCURRENT PROCESSING CONFIGURATION ====================
-CLEANUP_BATCH_SIZE = 2      # Reduced from 3 to 2 for more reliable API calls
-NEW_CREATOR_BATCH_SIZE = 1  # Reduced from 2 to 1 for more reliable API calls
-BATCH_DELAY = 2.0           # Increased from 1s to 2s to be more respectful to API
+# Creators in flight are set by an AIMD controller (see adaptive_concurrency.py)
+CREATOR_TIMEOUT = 120       # Seconds allowed per creator before it is failed
+STOP_CHECK_INTERVAL = 15    # Seconds between should_stop checks while creators are in flight
+SPECULATIVE_FOLLOWER_MARGIN = 0.2  # Fetch Instagram profile+posts in parallel when stored followers are 20% inside 10k–350k
+
+# Rescrape pipeline: API fetches (AIMD window) feed compute, media and DB stages through bounded queues
+RESCRAPE_QUEUE_SIZE = int(os.getenv("RESCRAPE_QUEUE_SIZE", "8"))              # Creators buffered in front of each stage
+RESCRAPE_COMPUTE_WORKERS = int(os.getenv("RESCRAPE_COMPUTE_WORKERS", "2"))    # Validation / buzz score workers
+RESCRAPE_MEDIA_WORKERS = int(os.getenv("RESCRAPE_MEDIA_WORKERS", "6"))        # Creators re-hosting media at once
+RESCRAPE_DB_WORKERS = int(os.getenv("RESCRAPE_DB_WORKERS", "2"))              # Concurrent Supabase writes
+PIPELINE_REPORT_INTERVAL = 30  # Seconds between pipeline throughput reports
+# Blocking Supabase calls (storage list/remove/upload, table writes) run on a dedicated thread pool,
+# one thread per media and DB worker by default, so the event loop only coordinates
+RESCRAPE_BLOCKING_WORKERS = int(os.getenv("RESCRAPE_BLOCKING_WORKERS", str(RESCRAPE_MEDIA_WORKERS + RESCRAPE_DB_WORKERS)))
+# The DB stage buffers finished updates and writes them as multi-row updates on id (bulk_update_creators.sql)
+RESCRAPE_WRITE_BATCH = int(os.getenv("RESCRAPE_WRITE_BATCH", "50"))           # Rows per bulk update
+RESCRAPE_WRITE_INTERVAL = float(os.getenv("RESCRAPE_WRITE_INTERVAL", "5"))    # Max seconds a row waits in the buffer
+# Creators are streamed from creatordata in keyset pages of only the columns a rescrape reads
+RESCRAPE_PAGE_SIZE = int(os.getenv("RESCRAPE_PAGE_SIZE", "500"))              # Creator rows per page
+RESCRAPE_TARGET_NICHES = ['Trading', 'Crypto', 'Finance']
+# Full rescrapes with the same newest posts and follower / engagement / views movement under this
+# percent only refresh counters (no media re-upload, no post rewrite)
+RESCRAPE_UNCHANGED_MOVEMENT = float(os.getenv("RESCRAPE_UNCHANGED_MOVEMENT", "2"))
 
 # ==================== TEST MODE CONFIGURATION ====================
 TEST_MODE = False
@@ -80,6 +109,14 @@ if len(sys.argv) > 1:
 
 # ==================== HELPER FUNCTIONS ====================
 
+blocking_executor = ThreadPoolExecutor(max_workers=RESCRAPE_BLOCKING_WORKERS, thread_name_prefix="rescrape-blocking")
+
+async def run_blocking_call(func, *args, **kwargs):
+    """Run a blocking call on the rescraper's executor (with the caller's context) and await its result."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(blocking_executor, partial(context.run, func, *args, **kwargs))
+
 def create_ssl_session():
     """Create an aiohttp session with SSL context for macOS compatibility."""
     ssl_context = ssl.create_default_context()
@@ -270,24 +307,33 @@ def calculate_buzz_score(new_data, existing_data):
 
 # ==================== MEDIA PROCESSING FUNCTIONS ====================
 
+# Keep-alive session for media downloads, shared by every creator of a job (set by RescrapePipeline)
+media_session_var = contextvars.ContextVar('media_session', default=None)
+MEDIA_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
 async def download_file(url: str) -> bytes:
     """Download file from URL and return its content as bytes."""
     try:
         print(f"⬇️ Downloading: {url[:50]}...")
         
-        # Use aiohttp with proper timeout
-        timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                content = await response.read()
-                print(f"✅ Downloaded {len(content)} bytes")
-                return content
+        session = media_session_var.get()
+        if session is None:
+            # No job-wide session (single-creator callers) - use a one-off one
+            async with aiohttp.ClientSession(timeout=MEDIA_DOWNLOAD_TIMEOUT) as session:
+                return await download_with_session(session, url)
+        return await download_with_session(session, url)
                 
     except Exception as e:
         print(f"❌ Error downloading {url}: {e}")
         return None
 
+async def download_with_session(session: aiohttp.ClientSession, url: str) -> bytes:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        content = await response.read()
+        print(f"✅ Downloaded {len(content)} bytes")
+        return content
+
 async def upload_to_supabase_storage(bucket: str, path: str, file_content: bytes, content_type: str = None) -> str:
     """Upload file to Supabase storage and return public URL."""
     try:
@@ -295,7 +341,7 @@ async def upload_to_supabase_storage(bucket: str, path: str, file_content: bytes
         
         # Use asyncio timeout instead of signal-based timeout
         upload_task = asyncio.create_task(
-            asyncio.to_thread(
+            run_blocking_call(
                 lambda: supabase.storage.from_(bucket).upload(
                     path=path,
                     file=file_content,
@@ -522,13 +568,44 @@ def calculate_engagement_rate(likes, comments, followers):
 
 # ==================== INSTAGRAM SCRAPING FUNCTIONS ====================
 
-def scrape_instagram_user_data(username):
-    """Improved Instagram scraper with reliable API calls and better error handling."""
+def is_safely_in_follower_range(followers):
+    """True if a stored follower count is far enough inside 10k–350k to skip the sequential gate."""
+    if not followers:
+        return False
+    return 10000 * (1 + SPECULATIVE_FOLLOWER_MARGIN) <= followers <= 350000 * (1 - SPECULATIVE_FOLLOWER_MARGIN)
+
+async def scrape_instagram_user_data(username, known_followers=None):
+    """Improved Instagram scraper with reliable API calls and better error handling.
+    
+    When the stored follower count (known_followers) is well inside the 10k–350k
+    window, the posts call is sent alongside the profile call instead of after it;
+    creators near the edges keep the sequential path so filtered ones cost one call.
+    """
     print(f"\n📡 Fetching Instagram data for @{username}...")
     username = username.strip().lstrip("@")
     
-    # Step 1: Get profile data with reliable API call
-    profile_result = make_instagram_api_call(username, SCRAPECREATORS_API_KEY, "profile")
+    tombstone = await find_tombstone('instagram', username)
+    if tombstone:
+        return {'tombstoned': True, 'message': tombstone_message(tombstone)}
+    
+    # Speculatively start the posts call for creators that will almost certainly pass the follower gate
+    posts_task = None
+    if is_safely_in_follower_range(known_followers):
+        posts_task = asyncio.create_task(make_instagram_api_call(username, SCRAPECREATORS_API_KEY, "posts"))
+    
+    try:
+        return await _scrape_instagram_user_data(username, posts_task)
+    finally:
+        if posts_task and not posts_task.done():
+            posts_task.cancel()  # Profile failed or was filtered - the posts response is not needed
+
+async def fetch_instagram_profile(username):
+    """Profile step shared by full and light rescrapes.
+    
+    Returns (profile_data, followers, None) for an in-range creator, or
+    (None, None, result) where result is what the scraper should return.
+    """
+    profile_result = await make_instagram_api_call(username, SCRAPECREATORS_API_KEY, "profile")
     
     if not profile_result['success']:
         error_type = profile_result['error_type']
@@ -537,44 +614,63 @@ def scrape_instagram_user_data(username):
         print(f"❌ Profile API call failed for @{username}: {error_msg}")
         
         # Handle different error types appropriately
-        if error_type == 'profile_not_found':
+        if error_type == 'retry_later':
+            return None, None, {'error': 'retry_later', 'retry_after': profile_result.get('retry_after'), 'message': error_msg}
+        elif error_type == 'profile_not_found':
             print(f"👻 Profile not found for @{username} - likely deleted account")
-            return None  # Permanent failure - remove from database
+            await bury_handle('instagram', username, 'not_found', error_msg)
+            return None, None, None  # Permanent failure - remove from database
         elif error_type == 'access_denied':
             print(f"🔒 Access denied for @{username} - likely private account")
-            return {'error': 'temporary', 'message': 'Account went private - retry later'}
-        elif error_type in ['rate_limited', 'server_error', 'timeout', 'circuit_breaker']:
+            await bury_handle('instagram', username, 'private', error_msg)
+            return None, None, {'error': 'temporary', 'message': 'Account went private - retry later'}
+        elif error_type in ['rate_limited', 'server_error', 'timeout', 'circuit_breaker', 'retry_budget']:
             print(f"⏳ Temporary API issue for @{username}: {error_type}")
-            return {'error': 'temporary', 'message': f'API issue: {error_type} - will retry'}
+            return None, None, {'error': 'temporary', 'message': f'API issue: {error_type} - will retry'}
         else:
             print(f"❓ Unknown error for @{username}: {error_type}")
-            return {'error': 'unknown', 'message': f'Unknown error: {error_msg}'}
+            return None, None, {'error': 'unknown', 'message': f'Unknown error: {error_msg}'}
     
     # Parse profile data
     try:
         profile_data = profile_result['data'].get("data", {}).get("user", {})
         if not profile_data:
             print(f"❌ Empty profile data for @{username}")
-            return {'error': 'temporary', 'message': 'Empty API response - retry later'}
+            return None, None, {'error': 'temporary', 'message': 'Empty API response - retry later'}
         
-        full_name = profile_data.get("full_name", "")
-        bio = profile_data.get("biography", "")
-        avatar_url = profile_data.get("profile_pic_url_hd", "")
         followers = profile_data.get("edge_followed_by", {}).get("count", 0)
         
         print(f"📊 Profile data: {followers:,} followers")
         
     except Exception as e:
         print(f"❌ Error parsing profile data for @{username}: {e}")
-        return {'error': 'temporary', 'message': f'Data parsing error: {e}'}
+        return None, None, {'error': 'temporary', 'message': f'Data parsing error: {e}'}
     
     # Check follower range early
     if not (10000 <= followers <= 350000):
         print(f"🚫 Skipping: Follower count {followers:,} not in 10k–350k range.")
-        return {'skipped': True}
+        await bury_handle('instagram', username, 'follower_range', f"{followers:,} followers")
+        return None, None, {'skipped': True}
     
-    # Step 2: Get posts data with reliable API call
-    posts_result = make_instagram_api_call(username, SCRAPECREATORS_API_KEY, "posts")
+    return profile_data, followers, None
+
+async def _scrape_instagram_user_data(username, posts_task, profile=None):
+    # Step 1: Get profile data with reliable API call (unless the caller already has it)
+    if profile is None:
+        profile_data, followers, failure = await fetch_instagram_profile(username)
+        if profile_data is None:
+            return failure
+    else:
+        profile_data, followers = profile
+    full_name = profile_data.get("full_name", "")
+    bio = profile_data.get("biography", "")
+    avatar_url = profile_data.get("profile_pic_url_hd", "")
+    
+    # Step 2: Get posts data with reliable API call (already in flight when speculative)
+    if posts_task:
+        posts_result = await posts_task
+    else:
+        posts_result = await make_instagram_api_call(username, SCRAPECREATORS_API_KEY, "posts")
     
     if not posts_result['success']:
         error_type = posts_result['error_type']
@@ -582,6 +678,9 @@ def scrape_instagram_user_data(username):
         
         print(f"❌ Posts API call failed for @{username}: {error_msg}")
         
+        if error_type == 'retry_later':
+            return {'error': 'retry_later', 'retry_after': posts_result.get('retry_after'), 'message': error_msg}
+        
         # For posts, we might be able to continue with just profile data
         # If posts API fails, we should fail the entire scraping process
         # rather than updating with incomplete/zero metrics
@@ -714,19 +813,49 @@ def scrape_instagram_user_data(username):
     print("\n📅 Checking Instagram creator activity...")
     if not is_creator_active(recent_posts, days_threshold=45):
         print(f"🚫 Skipping @{username}: No posts in the last 45 days")
+        await bury_handle('instagram', username, 'inactive', "No posts in the last 45 days")
         return {'skipped': True}
         
     return influencer_data
 
+async def scrape_instagram_light(username, followers_at_full=None):
+    """Light rescrape: profile call only.
+    
+    Returns {'light': True, 'followers_count': n} when a profile-only refresh is
+    enough. If followers moved past the tier policy's threshold since the last
+    full rescrape, escalates to a full scrape that reuses this profile
+    response (only the posts call is added) and returns its result.
+    """
+    print(f"\n📡 Fetching Instagram profile for @{username} (light rescrape)...")
+    username = username.strip().lstrip("@")
+    
+    tombstone = await find_tombstone('instagram', username)
+    if tombstone:
+        return {'tombstoned': True, 'message': tombstone_message(tombstone)}
+    
+    profile_data, followers, failure = await fetch_instagram_profile(username)
+    if profile_data is None:
+        return failure
+    
+    if follower_move_needs_full(followers_at_full, followers):
+        print(f"🔀 Followers moved more than {RESCRAPE_FULL_FOLLOWER_CHANGE:g}% since the last full rescrape "
+              f"({followers_at_full or 0:,} → {followers:,}) - running a full rescrape")
+        return await _scrape_instagram_user_data(username, None, profile=(profile_data, followers))
+    return {'light': True, 'followers_count': followers}
+
 # ==================== TIKTOK SCRAPING FUNCTIONS ====================
 
-def scrape_tiktok_user_data(username):
+async def scrape_tiktok_user_data(username):
     """Improved TikTok scraper with reliable API calls and better error handling."""
     print(f"\n📡 Fetching TikTok data for @{username}...")
     username = username.strip().lstrip("@")
     
+    tombstone = await find_tombstone('tiktok', username)
+    if tombstone:
+        return {'tombstoned': True, 'message': tombstone_message(tombstone)}
+    
     # Make reliable API call
-    result = make_tiktok_api_call(username, SCRAPECREATORS_API_KEY)
+    result = await make_tiktok_api_call(username, SCRAPECREATORS_API_KEY)
     
     if not result['success']:
         error_type = result['error_type']
@@ -735,10 +864,13 @@ def scrape_tiktok_user_data(username):
         print(f"❌ TikTok API call failed for @{username}: {error_msg}")
         
         # Handle different error types
-        if error_type == 'profile_not_found':
+        if error_type == 'retry_later':
+            return {'error': 'retry_later', 'retry_after': result.get('retry_after'), 'message': error_msg}
+        elif error_type == 'profile_not_found':
             print(f"👻 TikTok profile not found for @{username}")
+            await bury_handle('tiktok', username, 'not_found', error_msg)
             return None  # Permanent failure
-        elif error_type in ['rate_limited', 'server_error', 'timeout', 'circuit_breaker']:
+        elif error_type in ['rate_limited', 'server_error', 'timeout', 'circuit_breaker', 'retry_budget']:
             return {'error': 'temporary', 'message': f'API issue: {error_type}'}
         else:
             return {'error': 'unknown', 'message': f'Unknown error: {error_msg}'}
@@ -761,6 +893,7 @@ def scrape_tiktok_user_data(username):
         # Check follower range
         if not (10000 <= followers <= 350000):
             print(f"❌ Skipped: TikTok follower count {followers:,} outside target range")
+            await bury_handle('tiktok', username, 'follower_range', f"{followers:,} followers")
             return {'skipped': True}
         
         # Process posts
@@ -835,6 +968,7 @@ def scrape_tiktok_user_data(username):
         # Check activity
         if not is_creator_active(recent_posts, days_threshold=45):
             print(f"🚫 TikTok creator @{username} is inactive")
+            await bury_handle('tiktok', username, 'inactive', "No posts in the last 45 days")
             return {'skipped': True, 'reason': 'inactive'}
 
         # Build data structure
@@ -873,251 +1007,516 @@ def scrape_tiktok_user_data(username):
 
 # ==================== DATABASE FUNCTIONS ====================
 
+# Stored fields a rescrape reads - of each recent post only its views (buzz score) and created_at
+# (no-material-change check), not the whole post
+RESCRAPE_COLUMNS = ",".join([
+    "id", "handle", "platform", "updated_at", "followers_count", "average_likes", "average_comments",
+    "average_views", "engagement_rate", "primary_niche", "secondary_niche", "location",
+    *(f"recent_post_{i}_views:recent_post_{i}->views" for i in range(1, 13)),
+    *(f"recent_post_{i}_created_at:recent_post_{i}->created_at" for i in range(1, 13))
+])
+RESCRAPE_ID_CHUNK = 100  # Ids per in_() lookup, keeping request URLs short
+
+def utc_timestamp() -> str:
+    """Current time as a timezone-aware UTC ISO timestamp, for updated_at and job cutoffs alike."""
+    return datetime.now(timezone.utc).isoformat()
+
+def creators_query(columns, platform=None, **select_options):
+    query = supabase.table("creatordata").select(columns, **select_options).in_('primary_niche', RESCRAPE_TARGET_NICHES)
+    if platform:
+        query = query.eq('platform', platform.title())
+    return query
+
+def count_existing_creators(platform=None, started=None) -> int:
+    """Number of creators iter_existing_creator_pages(platform, started=started) yields, without fetching them."""
+    started = started or utc_timestamp()
+    query = creators_query("id", platform, count="exact").or_(f'updated_at.lte."{started}",updated_at.is.null')
+    response = query.limit(1).execute()
+    return response.count or 0
+
+def rescrape_row(row):
+    """Shape a projected creatordata row like a full one for the rescrape stages."""
+    for i in range(1, 13):
+        post = {'views': row.pop(f'recent_post_{i}_views', None),
+                'created_at': row.pop(f'recent_post_{i}_created_at', None)}
+        if any(value is not None for value in post.values()):
+            row[f'recent_post_{i}'] = post
+    return row
+
+def iter_existing_creator_pages(platform=None, page_size=RESCRAPE_PAGE_SIZE, started=None):
+    """
+    Yield pages of creators in the target niches, stalest first.
+    
+    Pages are ordered by (updated_at, id) and each one starts after the last
+    row of the previous page, so no request is capped by PostgREST's row limit
+    or slowed by an offset, and only one page is held in memory. Rows updated
+    after `started` (ISO timestamp, default now) are left out - a rescrape
+    bumps updated_at, which would otherwise move creators this job already
+    refreshed back into its path. Passing a job's original `started` again
+    resumes it: creators it refreshed are past the cutoff and everything
+    else is still ahead. Creators that were never updated (null updated_at)
+    come last.
+    """
+    started = started or utc_timestamp()
+    cursor = None  # (updated_at, id) of the last row read
+    while True:
+        query = creators_query(RESCRAPE_COLUMNS, platform).lte('updated_at', started)
+        if cursor:
+            query = query.or_(f'updated_at.gt."{cursor[0]}",and(updated_at.eq."{cursor[0]}",id.gt.{cursor[1]})')
+        rows = query.order('updated_at').order('id').limit(page_size).execute().data or []
+        if rows:
+            cursor = (rows[-1]['updated_at'], rows[-1]['id'])
+            yield [rescrape_row(row) for row in rows]
+        if len(rows) < page_size:
+            break
+    
+    cursor = None  # id of the last undated row read
+    while True:
+        query = creators_query(RESCRAPE_COLUMNS, platform).is_('updated_at', 'null')
+        if cursor is not None:
+            query = query.gt('id', cursor)
+        rows = query.order('id').limit(page_size).execute().data or []
+        if rows:
+            cursor = rows[-1]['id']
+            yield [rescrape_row(row) for row in rows]
+        if len(rows) < page_size:
+            break
+
+async def stream_existing_creators(platform=None, page_size=RESCRAPE_PAGE_SIZE, started=None):
+    """
+    Async generator over creators in the target niches, for process_creators_adaptive.
+    
+    Pages (see iter_existing_creator_pages) are fetched on blocking_executor as
+    the job consumes them, so memory stays flat however many creators there are.
+    
+    Args:
+        platform: Only this platform ('instagram' / 'tiktok'), default all
+        page_size: Rows per request
+        started: Cutoff for updated_at - a resumed job passes its original start time
+    """
+    pages = iter_existing_creator_pages(platform, page_size, started)
+    yielded = 0
+    while (page := await run_blocking_call(next, pages, None)) is not None:
+        for creator in page:
+            if TEST_MODE and yielded >= TEST_LIMIT:
+                return
+            yielded += 1
+            yield creator
+
+async def stream_creators_by_id(creators, page_size=RESCRAPE_ID_CHUNK):
+    """
+    Async generator over the stored rows (RESCRAPE_COLUMNS) of a given creator list, in list order.
+    
+    Auto-rescrape jobs get only id / handle / platform per creator; loading
+    the projected row gives the compute stage its change baselines. Creators
+    without an id are passed through as given, and ones no longer in
+    creatordata are skipped.
+    """
+    for start in range(0, len(creators), page_size):
+        chunk = creators[start:start + page_size]
+        ids = [creator['id'] for creator in chunk if creator.get('id')]
+        rows = {}
+        if ids:
+            query = supabase.table("creatordata").select(RESCRAPE_COLUMNS).in_('id', ids)
+            response = await run_blocking_call(query.execute)
+            rows = {row['id']: rescrape_row(row) for row in response.data or []}
+        for creator in chunk:
+            if not creator.get('id'):
+                yield creator
+            elif creator['id'] in rows:
+                yield rows[creator['id']]
+            else:
+                print(f"⚠️ @{creator.get('handle')} is no longer in creatordata - skipping")
+
 def get_existing_creators():
-    """Fetches all existing creators from Supabase."""
+    """Fetches all existing creators in the target niches (see iter_existing_creator_pages)."""
     print("\nFetching existing creators from Supabase...")
-    target_niches = ['Trading', 'Crypto', 'Finance']
     try:
-        response = supabase.table("creatordata").select("*").in_('primary_niche', target_niches).execute()
-        print(f"Found {len(response.data)} existing creators in the target niches.")
+        creators = [creator for page in iter_existing_creator_pages() for creator in page]
+        print(f"Found {len(creators)} existing creators in the target niches.")
         
         # Apply test mode limit if enabled
-        if TEST_MODE and len(response.data) > TEST_LIMIT:
+        if TEST_MODE and len(creators) > TEST_LIMIT:
             print(f"🧪 TEST MODE: Limiting to first {TEST_LIMIT} creators")
-            response.data = response.data[:TEST_LIMIT]
+            creators = creators[:TEST_LIMIT]
         
-        return response.data
+        return creators
     except Exception as e:
         print(f"❌ Error fetching existing creators: {e}")
         return []
 
-async def rescrape_and_update_creator(creator):
-    """Rescrapes a creator and updates their record based on platform."""
+# A rescrape runs as four stages, chained directly by rescrape_and_update_creator
+# and through bounded queues by process_creators_adaptive (see RescrapePipeline):
+#   fetch_creator_data -> build_creator_update -> refresh_creator_media -> write_creator_update
+# A stage either hands its output to the next stage or finishes the creator with
+# a result dict ({'handle', 'status', ...}).
+
+async def fetch_creator_data(creator):
+    """
+    API stage: scrape the creator's platform for fresh data.
+    
+    Returns (new_data, None) to continue, or (None, result) when the creator
+    is finished here (API failure, tombstone, retryable error, unknown platform).
+    Inactive creators and light rescrapes continue with new_data - the
+    compute stage turns them into a delete or a light update.
+    """
     handle = creator.get('handle')
     platform = creator.get('platform')
     
     if not handle or not platform:
         print(f"❌ Missing handle or platform for creator: {creator}")
-        return {'handle': handle, 'status': 'error', 'error': 'Missing handle or platform'}
+        return None, {'handle': handle, 'status': 'error', 'error': 'Missing handle or platform'}
     
     print(f"\n{'='*20} RESCRAPING @{handle} ({platform}) {'='*20}")
     
-    # Add timeout protection to the entire creator processing
-    start_time = time.time()
-    try:
-        # Route to appropriate scraper based on platform
-        if platform.lower() == 'instagram':
-            new_data = scrape_instagram_user_data(handle)
-        elif platform.lower() == 'tiktok':
-            new_data = scrape_tiktok_user_data(handle)
+    # Route to appropriate scraper based on platform
+    if platform.lower() == 'instagram':
+        # Profile-only refresh between full rescrapes (see rescrape_tiers.py)
+        plan = await plan_rescrape('instagram', handle, creator.get('followers_count'))
+        if plan['tier'] == 'light':
+            new_data = await scrape_instagram_light(handle, plan['followers_at_full'])
         else:
-            print(f"❌ Unknown platform '{platform}' for @{handle}")
-            return {'handle': handle, 'status': 'error', 'error': f'Unknown platform: {platform}'}
-        
-        if not new_data:
-            print(f"ℹ️ No data returned for @{handle}, skipping update.")
-            return {'handle': handle, 'status': 'failed', 'error': 'API failure - no data returned'}
-        
-        # Handle new improved error responses
-        elif isinstance(new_data, dict) and new_data.get('error'):
-            error_type = new_data.get('error', 'unknown')
-            error_msg = new_data.get('message', 'Unknown error')
-            if error_type == 'temporary':
-                print(f"⏳ Temporary error for @{handle}: {error_msg}")
-                return {'handle': handle, 'status': 'failed', 'error': f'Temporary API issue: {error_msg}'}
-            else:
-                print(f"❌ Permanent error for @{handle}: {error_msg}")
-                return {'handle': handle, 'status': 'failed', 'error': f'Permanent error: {error_msg}'}
-        
-        # Check if creator was skipped due to inactivity or out-of-range followers
-        elif isinstance(new_data, dict) and new_data.get('skipped'):
-            reason = new_data.get('reason', 'inactive')
-            if reason == 'inactive':
-                print(f"🗑️ Deleting inactive creator @{handle} from database...")
-                try:
-                    supabase.table("creatordata").delete().eq("handle", handle).execute()
-                    print(f"✅ Successfully deleted inactive creator @{handle}")
-                    return {'handle': handle, 'status': 'deleted', 'reason': 'inactive'}
-                except Exception as e:
-                    print(f"❌ Error deleting inactive creator @{handle}: {e}")
-                    return {'handle': handle, 'status': 'error', 'error': f'Delete failed: {e}'}
-            else:
-                print(f"🚫 Creator @{handle} skipped: {reason}")
-                return {'handle': handle, 'status': 'failed', 'error': f'Skipped: {reason}'}
-
-        # Validate that we have meaningful data before updating
-        # If key metrics are missing or zero, it might indicate incomplete API data
-        followers_count = new_data.get('followers_count', 0)
-        avg_views = new_data.get('average_views', 0)
-        
-        # Handle average_likes which can be a dict or number
-        avg_likes_raw = new_data.get('average_likes', 0)
-        if isinstance(avg_likes_raw, dict):
-            avg_likes = avg_likes_raw.get('avg_value', 0)
-        else:
-            avg_likes = avg_likes_raw or 0
-        
-        if followers_count == 0:
-            print(f"⚠️ Warning: @{handle} has zero followers - possibly incomplete API data")
-            return {'handle': handle, 'status': 'failed', 'error': 'Incomplete API data - zero followers detected'}
-        
-        # Check if we have engagement metrics (views, likes, or engagement_rate)
-        # Handle different formats for engagement_rate and average_comments
-        engagement_rate_raw = new_data.get('engagement_rate', 0)
-        if isinstance(engagement_rate_raw, dict):
-            engagement_rate_val = engagement_rate_raw.get('avg_value', 0)
-        else:
-            engagement_rate_val = engagement_rate_raw or 0
-            
-        avg_comments_raw = new_data.get('average_comments', 0)
-        if isinstance(avg_comments_raw, dict):
-            avg_comments_val = avg_comments_raw.get('avg_value', 0)
+            new_data = await scrape_instagram_user_data(handle, known_followers=creator.get('followers_count'))
+    elif platform.lower() == 'tiktok':
+        new_data = await scrape_tiktok_user_data(handle)
+    else:
+        print(f"❌ Unknown platform '{platform}' for @{handle}")
+        return None, {'handle': handle, 'status': 'error', 'error': f'Unknown platform: {platform}'}
+    
+    if not new_data:
+        print(f"ℹ️ No data returned for @{handle}, skipping update.")
+        return None, {'handle': handle, 'status': 'failed', 'error': 'API failure - no data returned'}
+    
+    # Known-dead handle - skipped without an API call
+    elif isinstance(new_data, dict) and new_data.get('tombstoned'):
+        return None, {'handle': handle, 'status': 'skipped', 'reason': new_data['message']}
+    
+    # Retryable failure - hand the creator back to the job queue
+    elif isinstance(new_data, dict) and new_data.get('error') == 'retry_later':
+        error_msg = new_data.get('message', 'Retryable API error')
+        print(f"🔁 Deferring @{handle}: {error_msg}")
+        return None, {'handle': handle, 'status': 'retry', 'retry_after': new_data.get('retry_after'),
+                      'error': f'Temporary API issue: {error_msg}'}
+    
+    # Handle new improved error responses
+    elif isinstance(new_data, dict) and new_data.get('error'):
+        error_type = new_data.get('error', 'unknown')
+        error_msg = new_data.get('message', 'Unknown error')
+        if error_type == 'temporary':
+            print(f"⏳ Temporary error for @{handle}: {error_msg}")
+            return None, {'handle': handle, 'status': 'failed', 'error': f'Temporary API issue: {error_msg}'}
         else:
-            avg_comments_val = avg_comments_raw or 0
-        
-        has_engagement_data = (
-            avg_views > 0 or 
-            avg_likes > 0 or 
-            engagement_rate_val > 0 or
-            avg_comments_val > 0
-        )
-        
-        if not has_engagement_data:
-            print(f"⚠️ Warning: @{handle} has no engagement metrics - possibly incomplete API data")
-            return {'handle': handle, 'status': 'failed', 'error': 'Incomplete API data - no engagement metrics found'}
-
-        # Delete old media before processing new media
-        delete_all_creator_media(handle)
-
-        # Calculate Buzz Score
-        buzz_score = calculate_buzz_score(new_data, creator)
-
-        # Safely get old average likes for change calculation
-        old_likes_data = creator.get('average_likes')
-        old_avg_likes = 0
-        if isinstance(old_likes_data, dict):
-            old_avg_likes = old_likes_data.get('avg_value', 0)
-        elif isinstance(old_likes_data, (int, float)):
-            old_avg_likes = old_likes_data
-
-        # Calculate percentage changes
-        followers_change, followers_change_type = calculate_change(new_data.get('followers_count'), creator.get('followers_count'))
-        er_change, er_change_type = calculate_change(new_data.get('engagement_rate'), creator.get('engagement_rate'))
-        views_change, views_change_type = calculate_change(new_data.get('average_views'), creator.get('average_views'))
+            print(f"❌ Permanent error for @{handle}: {error_msg}")
+            return None, {'handle': handle, 'status': 'failed', 'error': f'Permanent error: {error_msg}'}
+    
+    # Out-of-range followers (inactive creators go on to be deleted)
+    elif isinstance(new_data, dict) and new_data.get('skipped') and new_data.get('reason', 'inactive') != 'inactive':
+        reason = new_data.get('reason')
+        print(f"🚫 Creator @{handle} skipped: {reason}")
+        return None, {'handle': handle, 'status': 'failed', 'error': f'Skipped: {reason}'}
+    
+    return new_data, None
+
+def build_light_update(creator, new_data):
+    """Light rescrape payload: followers_count, followers_change and updated_at only."""
+    followers = new_data['followers_count']
+    followers_change, followers_change_type = calculate_change(followers, creator.get('followers_count'))
+    print(f"💾 Light update for @{creator.get('handle')}: followers {creator.get('followers_count')} → {followers} "
+          f"({followers_change:.2f}%)")
+    return {
+        "followers_count": int(followers),
+        "followers_change": int(followers_change),  # *_change columns are INTEGER
+        "followers_change_type": followers_change_type,
+        "updated_at": utc_timestamp(),
+    }
+
+# Columns an 'unchanged' write refreshes
+UNCHANGED_UPDATE_COLUMNS = [
+    "buzz_score", "followers_count", "engagement_rate", "average_views", "average_likes", "average_comments",
+    "followers_change", "followers_change_type", "engagement_rate_change", "engagement_rate_change_type",
+    "average_views_change", "average_views_change_type", "average_likes_change", "average_likes_change_type",
+    "average_comments_change", "average_comments_change_type", "updated_at",
+]
+
+def post_timestamps(data):
+    return {post['created_at'] for i in range(1, 13)
+            if isinstance(post := data.get(f'recent_post_{i}'), dict) and post.get('created_at')}
+
+# Metrics whose movement decides whether a full rescrape changed anything material
+MATERIAL_METRICS = ('followers_count', 'engagement_rate', 'average_views')
+
+def metric_value(value):
+    """A stored or fresh metric as a float ({'avg_value': ...} dicts included), or None if it has none."""
+    if isinstance(value, dict):
+        value = value.get('avg_value')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def no_material_change(creator, new_data):
+    """
+    True when a full rescrape found the same recent posts as last time and
+    each of MATERIAL_METRICS moved less than RESCRAPE_UNCHANGED_MOVEMENT percent.
+    
+    Needs the stored post timestamps and a present, non-zero stored value for
+    every metric (calculate_change reports 0% against a missing or zero
+    baseline); creators without them are always treated as changed.
+    """
+    stored_posts = post_timestamps(creator)
+    if not stored_posts or post_timestamps(new_data) != stored_posts:
+        return False
+    for metric in MATERIAL_METRICS:
+        baseline, fresh = metric_value(creator.get(metric)), metric_value(new_data.get(metric))
+        if not baseline or fresh is None:
+            return False
+        if abs(calculate_change(fresh, baseline)[0]) >= RESCRAPE_UNCHANGED_MOVEMENT:
+            return False
+    return True
+
+def build_creator_update(creator, new_data):
+    """
+    Compute stage: validate fresh data and build the database write.
+    
+    Returns (write, None) or (None, result) when validation fails. A write is
+    {'action': 'delete' | 'light' | 'unchanged' | 'full', 'payload': dict, 'new_data': dict};
+    only 'full' writes go through the media stage. 'unchanged' writes (no
+    material change, see no_material_change) carry counters and updated_at only.
+    """
+    handle = creator.get('handle')
+    
+    if new_data.get('skipped'):
+        return {'action': 'delete', 'payload': None, 'new_data': new_data}, None
+    
+    if new_data.get('light'):
+        return {'action': 'light', 'payload': build_light_update(creator, new_data), 'new_data': new_data}, None
+    
+    # Validate that we have meaningful data before updating
+    # If key metrics are missing or zero, it might indicate incomplete API data
+    followers_count = new_data.get('followers_count', 0)
+    avg_views = new_data.get('average_views', 0)
+    
+    # Handle average_likes which can be a dict or number
+    avg_likes_raw = new_data.get('average_likes', 0)
+    if isinstance(avg_likes_raw, dict):
+        avg_likes = avg_likes_raw.get('avg_value', 0)
+    else:
+        avg_likes = avg_likes_raw or 0
+    
+    if followers_count == 0:
+        print(f"⚠️ Warning: @{handle} has zero followers - possibly incomplete API data")
+        return None, {'handle': handle, 'status': 'failed', 'error': 'Incomplete API data - zero followers detected'}
+    
+    # Check if we have engagement metrics (views, likes, or engagement_rate)
+    # Handle different formats for engagement_rate and average_comments
+    engagement_rate_raw = new_data.get('engagement_rate', 0)
+    if isinstance(engagement_rate_raw, dict):
+        engagement_rate_val = engagement_rate_raw.get('avg_value', 0)
+    else:
+        engagement_rate_val = engagement_rate_raw or 0
         
-        # Handle both dict and int formats for average_likes
-        new_likes = new_data.get('average_likes', {})
-        if isinstance(new_likes, dict):
-            new_likes_value = new_likes.get('avg_value', 0)
+    avg_comments_raw = new_data.get('average_comments', 0)
+    if isinstance(avg_comments_raw, dict):
+        avg_comments_val = avg_comments_raw.get('avg_value', 0)
+    else:
+        avg_comments_val = avg_comments_raw or 0
+    
+    has_engagement_data = (
+        avg_views > 0 or 
+        avg_likes > 0 or 
+        engagement_rate_val > 0 or
+        avg_comments_val > 0
+    )
+    
+    if not has_engagement_data:
+        print(f"⚠️ Warning: @{handle} has no engagement metrics - possibly incomplete API data")
+        return None, {'handle': handle, 'status': 'failed', 'error': 'Incomplete API data - no engagement metrics found'}
+
+    # Calculate Buzz Score
+    buzz_score = calculate_buzz_score(new_data, creator)
+
+    # Safely get old average likes for change calculation
+    old_likes_data = creator.get('average_likes')
+    old_avg_likes = 0
+    if isinstance(old_likes_data, dict):
+        old_avg_likes = old_likes_data.get('avg_value', 0)
+    elif isinstance(old_likes_data, (int, float)):
+        old_avg_likes = old_likes_data
+
+    # Calculate percentage changes
+    followers_change, followers_change_type = calculate_change(new_data.get('followers_count'), creator.get('followers_count'))
+    er_change, er_change_type = calculate_change(new_data.get('engagement_rate'), creator.get('engagement_rate'))
+    views_change, views_change_type = calculate_change(new_data.get('average_views'), creator.get('average_views'))
+    
+    # Handle both dict and int formats for average_likes
+    new_likes = new_data.get('average_likes', {})
+    if isinstance(new_likes, dict):
+        new_likes_value = new_likes.get('avg_value', 0)
+    else:
+        new_likes_value = new_likes or 0
+    
+    likes_change, likes_change_type = calculate_change(new_likes_value, old_avg_likes)
+    comments_change, comments_change_type = calculate_change(new_data.get('average_comments'), creator.get('average_comments'))
+    
+    # Ensure all numeric values are properly typed for database
+    def safe_int(value):
+        """Convert value to int, handling None and float values."""
+        if value is None or value == '':
+            return None
+        try:
+            # Convert to float first to handle string floats, then to int
+            float_val = float(value)
+            return int(float_val)
+        except (ValueError, TypeError):
+            print(f"⚠️ Could not convert to int: {value} (type: {type(value)})")
+            return None
+    
+    def safe_float(value):
+        """Convert value to float, handling None values."""
+        if value is None or value == '':
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            print(f"⚠️ Could not convert to float: {value} (type: {type(value)})")
+            return None
+    
+    print(f"   📊 Change calculation for @{handle}:")
+    print(f"      Followers: {creator.get('followers_count')} → {new_data.get('followers_count')}")
+    print(f"      Engagement Rate: {creator.get('engagement_rate')} → {new_data.get('engagement_rate')}")
+    print(f"      Avg Views: {creator.get('average_views')} → {new_data.get('average_views')}")
+    print(f"      Avg Likes: {old_avg_likes} → {new_likes_value}")
+    print(f"      Avg Comments: {creator.get('average_comments')} → {new_data.get('average_comments')}")
+    print(f"      Calculated changes: Followers: {followers_change:.2f}%, ER: {er_change:.2f}%, Views: {views_change:.2f}%, Likes: {likes_change:.2f}%, Comments: {comments_change:.2f}%")
+
+    # Prepare update payload with proper type conversion
+    # NOTE: All *_change columns in database are INTEGER, so we need to convert percentages to integers
+    update_payload = {
+        "buzz_score": safe_int(buzz_score),
+        "followers_change": safe_int(followers_change),  # Convert percentage to integer 
+        "followers_change_type": followers_change_type,
+        "engagement_rate_change": safe_int(er_change),  # Convert percentage to integer
+        "engagement_rate_change_type": er_change_type,
+        "average_views_change": safe_int(views_change),  # Convert percentage to integer
+        "average_views_change_type": views_change_type,
+        "average_likes_change": safe_int(likes_change),  # Convert percentage to integer
+        "average_likes_change_type": likes_change_type,
+        "average_comments_change": safe_int(comments_change),  # Convert percentage to integer
+        "average_comments_change_type": comments_change_type,
+        # Preserve existing niche data - only update if we have better data
+        "primary_niche": creator.get("primary_niche") or new_data.get("primary_niche"),
+        "secondary_niche": creator.get("secondary_niche") or new_data.get("secondary_niche"),
+        "location": creator.get("location") or new_data.get("location"),
+        "updated_at": utc_timestamp(),
+    }
+    
+    # Add new_data fields with proper type conversion
+    for key, value in new_data.items():
+        if key not in update_payload:  # Don't override already set fields
+            update_payload[key] = value
+    
+    # Ensure integer fields in new_data are properly converted
+    if 'followers_count' in update_payload:
+        update_payload['followers_count'] = safe_int(update_payload['followers_count'])
+    if 'average_views' in update_payload:
+        update_payload['average_views'] = safe_int(update_payload['average_views'])
+    if 'average_comments' in update_payload:
+        update_payload['average_comments'] = safe_int(update_payload['average_comments'])
+    if 'engagement_rate' in update_payload:
+        update_payload['engagement_rate'] = safe_float(update_payload['engagement_rate'])
+    
+    # Handle average_likes which might be a dict or number
+    if 'average_likes' in update_payload:
+        avg_likes = update_payload['average_likes']
+        if isinstance(avg_likes, dict):
+            # Keep as dict but ensure numeric values are properly typed
+            if 'avg_value' in avg_likes:
+                avg_likes['avg_value'] = safe_int(avg_likes['avg_value'])
+            if 'median_value' in avg_likes:
+                avg_likes['median_value'] = safe_int(avg_likes['median_value'])
+            if 'std_dev' in avg_likes:
+                avg_likes['std_dev'] = safe_float(avg_likes['std_dev'])
         else:
-            new_likes_value = new_likes or 0
-        
-        likes_change, likes_change_type = calculate_change(new_likes_value, old_avg_likes)
-        comments_change, comments_change_type = calculate_change(new_data.get('average_comments'), creator.get('average_comments'))
-        
-        # Ensure all numeric values are properly typed for database
-        def safe_int(value):
-            """Convert value to int, handling None and float values."""
-            if value is None or value == '':
-                return None
-            try:
-                # Convert to float first to handle string floats, then to int
-                float_val = float(value)
-                return int(float_val)
-            except (ValueError, TypeError):
-                print(f"⚠️ Could not convert to int: {value} (type: {type(value)})")
-                return None
-        
-        def safe_float(value):
-            """Convert value to float, handling None values."""
-            if value is None or value == '':
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                print(f"⚠️ Could not convert to float: {value} (type: {type(value)})")
-                return None
-        
-        print(f"   📊 Change calculation for @{handle}:")
-        print(f"      Followers: {creator.get('followers_count')} → {new_data.get('followers_count')}")
-        print(f"      Engagement Rate: {creator.get('engagement_rate')} → {new_data.get('engagement_rate')}")
-        print(f"      Avg Views: {creator.get('average_views')} → {new_data.get('average_views')}")
-        print(f"      Avg Likes: {old_avg_likes} → {new_likes_value}")
-        print(f"      Avg Comments: {creator.get('average_comments')} → {new_data.get('average_comments')}")
-        print(f"      Calculated changes: Followers: {followers_change:.2f}%, ER: {er_change:.2f}%, Views: {views_change:.2f}%, Likes: {likes_change:.2f}%, Comments: {comments_change:.2f}%")
-
-        # Prepare update payload with proper type conversion
-        # NOTE: All *_change columns in database are INTEGER, so we need to convert percentages to integers
-        update_payload = {
-            "buzz_score": safe_int(buzz_score),
-            "followers_change": safe_int(followers_change),  # Convert percentage to integer 
-            "followers_change_type": followers_change_type,
-            "engagement_rate_change": safe_int(er_change),  # Convert percentage to integer
-            "engagement_rate_change_type": er_change_type,
-            "average_views_change": safe_int(views_change),  # Convert percentage to integer
-            "average_views_change_type": views_change_type,
-            "average_likes_change": safe_int(likes_change),  # Convert percentage to integer
-            "average_likes_change_type": likes_change_type,
-            "average_comments_change": safe_int(comments_change),  # Convert percentage to integer
-            "average_comments_change_type": comments_change_type,
-            # Preserve existing niche data - only update if we have better data
-            "primary_niche": creator.get("primary_niche") or new_data.get("primary_niche"),
-            "secondary_niche": creator.get("secondary_niche") or new_data.get("secondary_niche"),
-            "location": creator.get("location") or new_data.get("location"),
-            "updated_at": datetime.now().isoformat(),
-        }
-        
-        # Add new_data fields with proper type conversion
-        for key, value in new_data.items():
-            if key not in update_payload:  # Don't override already set fields
-                update_payload[key] = value
-        
-        # Ensure integer fields in new_data are properly converted
-        if 'followers_count' in update_payload:
-            update_payload['followers_count'] = safe_int(update_payload['followers_count'])
-        if 'average_views' in update_payload:
-            update_payload['average_views'] = safe_int(update_payload['average_views'])
-        if 'average_comments' in update_payload:
-            update_payload['average_comments'] = safe_int(update_payload['average_comments'])
-        if 'engagement_rate' in update_payload:
-            update_payload['engagement_rate'] = safe_float(update_payload['engagement_rate'])
-        
-        # Handle average_likes which might be a dict or number
-        if 'average_likes' in update_payload:
-            avg_likes = update_payload['average_likes']
-            if isinstance(avg_likes, dict):
-                # Keep as dict but ensure numeric values are properly typed
-                if 'avg_value' in avg_likes:
-                    avg_likes['avg_value'] = safe_int(avg_likes['avg_value'])
-                if 'median_value' in avg_likes:
-                    avg_likes['median_value'] = safe_int(avg_likes['median_value'])
-                if 'std_dev' in avg_likes:
-                    avg_likes['std_dev'] = safe_float(avg_likes['std_dev'])
-            else:
-                # Convert to int if it's a simple number
-                update_payload['average_likes'] = safe_int(avg_likes)
-        
-        print(f"   🔍 Final update payload verification:")
-        print(f"      followers_change: {update_payload.get('followers_change')} (type: {type(update_payload.get('followers_change'))}) - represents {followers_change:.2f}%")
-        print(f"      engagement_rate_change: {update_payload.get('engagement_rate_change')} (type: {type(update_payload.get('engagement_rate_change'))}) - represents {er_change:.2f}%")
-        print(f"      average_views_change: {update_payload.get('average_views_change')} (type: {type(update_payload.get('average_views_change'))}) - represents {views_change:.2f}%")
-        print(f"      average_likes_change: {update_payload.get('average_likes_change')} (type: {type(update_payload.get('average_likes_change'))}) - represents {likes_change:.2f}%")
-        print(f"      average_comments_change: {update_payload.get('average_comments_change')} (type: {type(update_payload.get('average_comments_change'))}) - represents {comments_change:.2f}%")
-        print(f"      followers_count: {update_payload.get('followers_count')} (type: {type(update_payload.get('followers_count'))})")
-        print(f"      buzz_score: {update_payload.get('buzz_score')} (type: {type(update_payload.get('buzz_score'))})")
-
-        # Process media files
-        print(f"   ⬇️ Downloading media for @{handle}...")
-        media_updates = await process_creator_media(creator.get('id'), handle, update_payload)
-        update_payload.update(media_updates)
-
-        print(f"💾 Updating data for @{handle} in Supabase...")
-        supabase.table("creatordata").update(update_payload).eq("handle", handle).execute()
-        print(f"✅ Successfully updated @{handle}.")
+            # Convert to int if it's a simple number
+            update_payload['average_likes'] = safe_int(avg_likes)
+    
+    print(f"   🔍 Final update payload verification:")
+    print(f"      followers_change: {update_payload.get('followers_change')} (type: {type(update_payload.get('followers_change'))}) - represents {followers_change:.2f}%")
+    print(f"      engagement_rate_change: {update_payload.get('engagement_rate_change')} (type: {type(update_payload.get('engagement_rate_change'))}) - represents {er_change:.2f}%")
+    print(f"      average_views_change: {update_payload.get('average_views_change')} (type: {type(update_payload.get('average_views_change'))}) - represents {views_change:.2f}%")
+    print(f"      average_likes_change: {update_payload.get('average_likes_change')} (type: {type(update_payload.get('average_likes_change'))}) - represents {likes_change:.2f}%")
+    print(f"      average_comments_change: {update_payload.get('average_comments_change')} (type: {type(update_payload.get('average_comments_change'))}) - represents {comments_change:.2f}%")
+    print(f"      followers_count: {update_payload.get('followers_count')} (type: {type(update_payload.get('followers_count'))})")
+    print(f"      buzz_score: {update_payload.get('buzz_score')} (type: {type(update_payload.get('buzz_score'))})")
+
+
+    if no_material_change(creator, new_data):
+        print(f"💤 No material change for @{handle} (same posts, movement under {RESCRAPE_UNCHANGED_MOVEMENT}%) "
+              f"- refreshing counters only")
+        payload = {column: update_payload[column] for column in UNCHANGED_UPDATE_COLUMNS if column in update_payload}
+        return {'action': 'unchanged', 'payload': payload, 'new_data': new_data}, None
+
+    return {'action': 'full', 'payload': update_payload, 'new_data': new_data}, None
+
+async def refresh_creator_media(creator, write):
+    """Media stage: replace the creator's stored media and point the payload at the new copies."""
+    handle = creator.get('handle')
+    # Delete old media before processing new media
+    await run_blocking_call(delete_all_creator_media, handle)
+    print(f"   ⬇️ Downloading media for @{handle}...")
+    media_updates = await process_creator_media(creator.get('id'), handle, write['payload'])
+    write['payload'].update(media_updates)
+
+async def write_creator_update(creator, write):
+    """DB stage: apply a write to creatordata (and the rescrape tier state) and return the creator's result."""
+    handle = creator.get('handle')
+    
+    if write['action'] == 'delete':
+        print(f"🗑️ Deleting inactive creator @{handle} from database...")
+        try:
+            await run_blocking_call(lambda: supabase.table("creatordata").delete().eq("handle", handle).execute())
+            print(f"✅ Successfully deleted inactive creator @{handle}")
+            return {'handle': handle, 'status': 'deleted', 'reason': 'inactive'}
+        except Exception as e:
+            print(f"❌ Error deleting inactive creator @{handle}: {e}")
+            return {'handle': handle, 'status': 'error', 'error': f'Delete failed: {e}'}
+    
+    payload = write['payload']
+    print(f"💾 Updating data for @{handle} in Supabase...")
+    await run_blocking_call(lambda: supabase.table("creatordata").update(payload).eq("handle", handle).execute())
+    print(f"✅ Successfully updated @{handle}.")
+    return await complete_creator_update(creator, write)
+
+async def complete_creator_update(creator, write):
+    """Record the rescrape tier state for a written update and return the creator's result."""
+    handle = creator.get('handle')
+    platform = creator.get('platform').lower()
+    payload = write['payload']
+    if write['action'] == 'light':
+        await record_rescrape(platform, handle, 'light', payload['followers_count'])
+        return {'handle': handle, 'status': 'success', 'tier': 'light', 'data': {**creator, **payload}}
+    # An unchanged write still came from a full scrape
+    await record_rescrape(platform, handle, 'full', write['new_data'].get('followers_count', 0))
+    return {'handle': handle, 'status': 'success', 'tier': write['action'], 'data': write['new_data']}
+
+async def rescrape_and_update_creator(creator):
+    """Rescrapes a creator and updates their record, running the rescrape stages in sequence."""
+    handle = creator.get('handle')
+    start_time = time.time()
+    try:
+        new_data, result = await fetch_creator_data(creator)
+        if result:
+            return result
+        write, result = build_creator_update(creator, new_data)
+        if result:
+            return result
+        if write['action'] == 'full':
+            await refresh_creator_media(creator, write)
+        result = await write_creator_update(creator, write)
         
         processing_time = time.time() - start_time
         print(f"⏱️ Processed @{handle} in {processing_time:.2f} seconds")
-        return {'handle': handle, 'status': 'success', 'data': new_data}
+        return result
         
     except Exception as e:
         processing_time = time.time() - start_time
@@ -1128,7 +1527,13 @@ async def rescrape_and_update_creator(creator):
 # ==================== CONCURRENT PROCESSING FUNCTIONS ====================
 
 async def process_creator_batch(creators_batch, batch_size=2):
-    """Process multiple creators concurrently with controlled concurrency."""
+    """
+    Process multiple creators concurrently with controlled concurrency.
+    
+    Blocking storage and DB calls run on blocking_executor, so up to batch_size
+    creators progress in parallel (beyond RESCRAPE_BLOCKING_WORKERS their
+    blocking calls queue for a thread).
+    """
     semaphore = asyncio.Semaphore(batch_size)
     
     async def process_with_semaphore(creator):
@@ -1143,6 +1548,459 @@ async def process_creator_batch(creators_batch, batch_size=2):
     
     return results
 
+class PipelineStage:
+    """One rescrape pipeline stage: a bounded input queue drained by a fixed pool of worker tasks."""
+    
+    def __init__(self, name, handler, workers, queue_size, on_error):
+        self.name = name
+        self.handler = handler  # async handler(item): forwards the item or finishes its creator
+        self.on_error = on_error  # on_error(item, exception) for handler crashes
+        self.workers = max(1, workers)
+        self.queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.processed = 0
+        self.busy = 0
+        self.busy_seconds = 0.0
+        self.max_depth = 0
+        self._tasks = []
+    
+    async def put(self, item):
+        """Queue an item, waiting while the stage is full (backpressure on the stage feeding it)."""
+        await self.queue.put(item)
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+    
+    def start(self):
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+    
+    async def _work(self):
+        while True:
+            item = await self.queue.get()
+            self.busy += 1
+            start_time = time.time()
+            try:
+                await self.handler(item)
+            except Exception as e:
+                self.on_error(item, e)
+            finally:
+                self.busy -= 1
+                self.busy_seconds += time.time() - start_time
+                self.processed += 1
+                self.queue.task_done()
+    
+    async def drain(self):
+        """Wait until every queued item is handled, then stop the workers."""
+        await self.queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    def snapshot(self, elapsed):
+        return {
+            'workers': self.workers,
+            'busy': self.busy,
+            'processed': self.processed,
+            'per_second': round(self.processed / elapsed, 2) if elapsed else 0,
+            'utilization': round(self.busy_seconds / (elapsed * self.workers), 2) if elapsed else 0,
+            'queue_depth': self.queue.qsize(),
+            'max_queue_depth': self.max_depth,
+            'queue_size': self.queue.maxsize,
+        }
+
+CREATOR_ROW_GONE = "creator was deleted during the job"
+
+class WriteBehindBuffer:
+    """
+    Collects creatordata update rows and writes them as multi-row updates on id.
+    
+    A batch is flushed when batch_size rows are queued (by the add() call that
+    filled it, which holds the DB worker as backpressure), when the oldest row
+    has waited interval seconds, and on close(). Rows with different columns
+    (light vs full updates) go in separate bulk updates. The write never
+    inserts, so a creator deleted during the job is not re-created as a
+    partial row; its on_done gets CREATOR_ROW_GONE. If a bulk update fails
+    rows are retried one by one as plain updates, so a bad row only fails
+    itself. on_done(error) is awaited per row with None or the error message.
+    """
+    
+    def __init__(self, batch_size=RESCRAPE_WRITE_BATCH, interval=RESCRAPE_WRITE_INTERVAL):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.pending = []  # (row, on_done)
+        self._timer = None
+        self._lock = asyncio.Lock()  # One flush at a time; close() waits for an in-flight flush
+        self.rows = 0
+        self.bulk_updates = 0
+        self.retried = 0
+        self.failed = 0
+        self.gone = 0
+    
+    async def add(self, row, on_done):
+        self.pending.append((row, on_done))
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+    
+    async def _flush_later(self):
+        await asyncio.sleep(self.interval)
+        self._timer = None
+        await self.flush()
+    
+    async def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            batch, self.pending = self.pending, []
+            groups = {}
+            for row, on_done in batch:
+                groups.setdefault(tuple(sorted(row)), []).append((row, on_done))
+            for group in groups.values():
+                await self._write_group(group)
+    
+    async def _write_group(self, group):
+        rows = [row for row, _ in group]
+        columns = [column for column in rows[0] if column != 'id']
+        try:
+            # bulk_update_creators (bulk_update_creators.sql) only updates, so a creator deleted
+            # since the job loaded it is left out of the returned ids instead of re-inserted
+            response = await run_blocking_call(lambda: supabase.rpc(
+                "bulk_update_creators", {"updates": rows, "update_columns": columns}).execute())
+            updated = set(response.data or [])
+            self.bulk_updates += 1
+            print(f"💾 Bulk updated {len(updated)} creators")
+            errors = [None if row['id'] in updated else CREATOR_ROW_GONE for row in rows]
+        except Exception as e:
+            print(f"⚠️ Bulk update of {len(rows)} creators failed ({e}) - retrying one by one")
+            errors = [await self._write_one(row) for row in rows]
+        gone = errors.count(CREATOR_ROW_GONE)
+        if gone:
+            self.gone += gone
+            print(f"🗑️ Skipped {gone} updates for creators deleted during the job")
+        self.rows += len(rows)
+        for (row, on_done), error in zip(group, errors):
+            try:
+                await on_done(error)
+            except Exception as e:
+                print(f"⚠️ Write callback failed for @{row.get('handle')}: {e}")
+    
+    async def _write_one(self, row):
+        self.retried += 1
+        update = {key: value for key, value in row.items() if key != 'id'}
+        try:
+            response = await run_blocking_call(lambda: supabase.table("creatordata").update(update).eq("id", row['id']).execute())
+            return None if response.data else CREATOR_ROW_GONE
+        except Exception as e:
+            self.failed += 1
+            print(f"❌ Update failed for @{row.get('handle')}: {e}")
+            return str(e)
+    
+    async def close(self):
+        """Write everything still buffered."""
+        await self.flush()
+    
+    def snapshot(self):
+        return {'rows': self.rows, 'bulk_updates': self.bulk_updates, 'retried_one_by_one': self.retried,
+                'failed': self.failed, 'deleted_during_job': self.gone, 'buffered': len(self.pending)}
+
+class RescrapePipeline:
+    """
+    Compute, media and DB stages behind the API fetch stage of process_creators_adaptive.
+    
+    Each stage has its own workers and a bounded queue in front of it. A full
+    queue blocks the stage feeding it - a slow media stage holds fetch slots
+    rather than letting API results pile up - so API, storage and database
+    work overlap instead of adding up per creator. Media downloads share one
+    keep-alive session for the job, and updates are written in batches through
+    a WriteBehindBuffer. Items are dicts carrying the creator and what earlier
+    stages produced ('new_data', 'write').
+    """
+    
+    def __init__(self, on_result=None, creator_timeout=CREATOR_TIMEOUT, queue_size=RESCRAPE_QUEUE_SIZE,
+                 compute_workers=RESCRAPE_COMPUTE_WORKERS, media_workers=RESCRAPE_MEDIA_WORKERS,
+                 db_workers=RESCRAPE_DB_WORKERS):
+        self.on_result = on_result
+        self.creator_timeout = creator_timeout
+        self.compute = PipelineStage('compute', self._compute, compute_workers, queue_size, self._crashed)
+        self.media = PipelineStage('media', self._media, media_workers, queue_size, self._crashed)
+        self.db = PipelineStage('db', self._write, db_workers, queue_size, self._crashed)
+        self.stages = [self.compute, self.media, self.db]
+        self.writes = WriteBehindBuffer()
+        self.started_at = time.time()
+        self.finished = Counter()  # status -> creators
+        # The fetch stage's concurrency is the AIMD window; these are its counters
+        self.fetch_window = 0
+        self.fetch_busy = 0
+        self.fetched = 0
+        self.fetch_seconds = 0.0
+    
+    def start(self):
+        # Stage workers inherit one keep-alive media session for the whole job
+        self.media_session = aiohttp.ClientSession(timeout=MEDIA_DOWNLOAD_TIMEOUT)
+        token = media_session_var.set(self.media_session)
+        try:
+            for stage in self.stages:
+                stage.start()
+        finally:
+            media_session_var.reset(token)
+    
+    async def drain(self):
+        """Finish every creator already in the pipeline (upstream stages first)."""
+        for stage in self.stages:
+            await stage.drain()
+        await self.writes.close()
+        await self.media_session.close()
+    
+    def finish(self, creator, result):
+        """Report a creator's final result."""
+        self.finished[result.get('status')] += 1
+        if self.on_result:
+            try:
+                self.on_result(creator, result)
+            except Exception as e:
+                print(f"⚠️ Result handler failed for @{creator.get('handle')}: {e}")
+    
+    def _crashed(self, item, error):
+        handle = item['creator'].get('handle')
+        processing_time = time.time() - item['started_at']
+        print(f"❌ CRITICAL ERROR: @{handle} processing failed after {processing_time:.2f}s: {error}")
+        traceback.print_exc()
+        self.finish(item['creator'], {'handle': handle, 'status': 'error', 'error': f'Critical error: {str(error)}'})
+    
+    async def fetch(self, creator):
+        """
+        Fetch stage, one task per creator in the AIMD window.
+        
+        Returns the creator's result when it finished here (including 'retry'
+        for the requeue logic), or None once it is queued for compute.
+        """
+        item = {'creator': creator, 'started_at': time.time()}
+        self.fetch_busy += 1
+        try:
+            new_data, result = await asyncio.wait_for(fetch_creator_data(creator), timeout=self.creator_timeout)
+        except asyncio.TimeoutError:
+            processing_time = time.time() - item['started_at']
+            print(f"⏰ TIMEOUT: @{creator.get('handle')} processing exceeded {self.creator_timeout}s ({processing_time:.2f}s)")
+            return {'handle': creator.get('handle'), 'status': 'error', 'error': f'Processing timeout after {processing_time:.2f}s'}
+        except Exception as e:
+            processing_time = time.time() - item['started_at']
+            print(f"❌ CRITICAL ERROR: @{creator.get('handle')} processing failed after {processing_time:.2f}s: {e}")
+            return {'handle': creator.get('handle'), 'status': 'error', 'error': f'Critical error: {str(e)}'}
+        finally:
+            self.fetch_busy -= 1
+            self.fetched += 1
+            self.fetch_seconds += time.time() - item['started_at']
+        
+        if result:
+            return result
+        item['new_data'] = new_data
+        await self.compute.put(item)
+        return None
+    
+    async def _compute(self, item):
+        write, result = build_creator_update(item['creator'], item['new_data'])
+        if result:
+            self.finish(item['creator'], result)
+            return
+        item['write'] = write
+        if write['action'] == 'full':
+            await self.media.put(item)
+        else:
+            await self.db.put(item)
+    
+    async def _media(self, item):
+        creator = item['creator']
+        try:
+            await asyncio.wait_for(refresh_creator_media(creator, item['write']), timeout=self.creator_timeout)
+        except asyncio.TimeoutError:
+            print(f"⏰ TIMEOUT: @{creator.get('handle')} media exceeded {self.creator_timeout}s")
+            self.finish(creator, {'handle': creator.get('handle'), 'status': 'error',
+                                  'error': f'Media processing timeout after {self.creator_timeout}s'})
+            return
+        await self.db.put(item)
+    
+    async def _write(self, item):
+        creator, write = item['creator'], item['write']
+        if write['action'] == 'delete' or not creator.get('id'):
+            result = await write_creator_update(creator, write)
+            print(f"⏱️ Processed @{creator.get('handle')} in {time.time() - item['started_at']:.2f} seconds")
+            self.finish(creator, result)
+            return
+        # handle is unchanged; it names the row in write logs
+        row = {'handle': creator.get('handle'), **write['payload'], 'id': creator['id']}
+        await self.writes.add(row, partial(self._written, item))
+    
+    async def _written(self, item, error):
+        creator = item['creator']
+        if error:
+            self.finish(creator, {'handle': creator.get('handle'), 'status': 'error', 'error': f'Update failed: {error}'})
+            return
+        result = await complete_creator_update(creator, item['write'])
+        print(f"⏱️ Processed @{creator.get('handle')} in {time.time() - item['started_at']:.2f} seconds")
+        self.finish(creator, result)
+    
+    def snapshot(self):
+        """Per-stage throughput, utilization and queue depth for job results."""
+        elapsed = max(time.time() - self.started_at, 0.001)
+        return {
+            'elapsed_seconds': round(elapsed, 1),
+            'creators_per_second': round(sum(self.finished.values()) / elapsed, 2),
+            'finished': dict(self.finished),
+            'stages': {
+                'fetch': {
+                    'workers': self.fetch_window,
+                    'busy': self.fetch_busy,
+                    'processed': self.fetched,
+                    'per_second': round(self.fetched / elapsed, 2),
+                    'avg_seconds': round(self.fetch_seconds / self.fetched, 2) if self.fetched else None,
+                },
+                **{stage.name: stage.snapshot(elapsed) for stage in self.stages}
+            },
+            'writes': self.writes.snapshot()
+        }
+    
+    def log_status(self):
+        queues = " | ".join(f"{stage.name} {stage.busy}/{stage.workers} busy, queue {stage.queue.qsize()}/{stage.queue.maxsize}"
+                            for stage in self.stages)
+        elapsed = max(time.time() - self.started_at, 0.001)
+        print(f"🏭 Pipeline: fetch {self.fetch_busy}/{self.fetch_window} | {queues} | "
+              f"{sum(self.finished.values()) / elapsed:.2f} creators/s")
+
+async def process_creators_adaptive(creators, controller=None, on_result=None, should_stop=None,
+                                    creator_timeout=CREATOR_TIMEOUT, on_stats=None):
+    """
+    Rescrape creators through the staged pipeline, with API fetches in flight set by an AIMD controller.
+    
+    The fetch stage starts up to controller.window creators at once; fetched
+    creators flow through bounded queues to the compute, media and DB stages
+    (see RescrapePipeline), so the next API calls go out while earlier
+    creators' media and writes are still running.
+    
+    API calls run with retries deferred: a creator that hits a retryable failure
+    goes back on the work queue with a not-before time (up to MAX_REQUEUES times)
+    and the slot moves on to the next creator instead of sleeping.
+    
+    Args:
+        creators: Iterable of creator rows, or an async iterable (stream_existing_creators) that is
+                  read as the fetch stage frees slots
+        controller: AIMDController (a default one is created if omitted)
+        on_result: Called as on_result(creator, result) once per creator with its final result
+        should_stop: Optional callable; once it returns True no new creators start
+        creator_timeout: Seconds allowed per creator for its API stage, and again for its media
+        on_stats: Optional callable given RescrapePipeline.snapshot() every PIPELINE_REPORT_INTERVAL
+                  seconds and once at the end
+    
+    Returns:
+        The controller, so callers can report its window and history
+    """
+    controller = controller or AIMDController()
+    pipeline = RescrapePipeline(on_result, creator_timeout)
+    feed = creators.__aiter__() if hasattr(creators, '__aiter__') else None
+    pending = deque() if feed else deque(creators)
+    deferred = []  # heap of (not_before, sequence, creator)
+    requeues = {}  # sequence -> requeue count, keyed per queued creator
+    in_flight = {}  # task -> (sequence, creator)
+    sequence = 0
+    stopping = False
+    requeued_total = 0
+    last_report = time.time()
+    
+    def report():
+        pipeline.fetch_window = controller.window
+        pipeline.log_status()
+        if on_stats:
+            try:
+                on_stats(pipeline.snapshot())
+            except Exception as e:
+                print(f"⚠️ Pipeline stats handler failed: {e}")
+    
+    async def refill():
+        """Top pending up to the fetch window from an async feed."""
+        nonlocal feed
+        while feed and len(pending) < controller.window:
+            try:
+                pending.append(await feed.__anext__())
+            except StopAsyncIteration:
+                feed = None
+    
+    def next_ready():
+        """Pop the next creator whose not-before time has passed, or None."""
+        nonlocal sequence
+        if deferred and deferred[0][0] <= time.time():
+            _, seq, creator = heapq.heappop(deferred)
+            return seq, creator
+        if pending:
+            sequence += 1
+            return sequence, pending.popleft()
+        return None
+    
+    # Every API attempt made by these creators feeds the controller; retries are requeued, not slept
+    with api_call_scope(observers=[controller.observe], defer_retries=True):
+        pipeline.start()
+        await refill()
+        while pending or deferred or in_flight or feed:
+            if not stopping and should_stop and should_stop():
+                print(f"🛑 Stopping job - {len(pending) + len(deferred)} creators not started, "
+                      f"waiting for {len(in_flight)} in flight")
+                stopping = True
+            if stopping and not in_flight:
+                break
+            if not stopping:
+                await refill()
+            
+            while not stopping and len(in_flight) < controller.window:
+                ready = next_ready()
+                if ready is None:
+                    break
+                seq, creator = ready
+                # A requeued creator's calls are retries and spend the shared retry budget
+                with api_call_scope(requeued=seq in requeues):
+                    in_flight[asyncio.create_task(pipeline.fetch(creator))] = (seq, creator)
+            
+            if time.time() - last_report >= PIPELINE_REPORT_INTERVAL:
+                report()
+                last_report = time.time()
+            
+            wait_timeout = STOP_CHECK_INTERVAL
+            if deferred:
+                wait_timeout = max(0.05, min(wait_timeout, deferred[0][0] - time.time()))
+            
+            if not in_flight:
+                # Only deferred creators left - wait for the earliest one
+                await asyncio.sleep(wait_timeout)
+                continue
+            
+            done, _ = await asyncio.wait(in_flight, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                seq, creator = in_flight.pop(task)
+                result = task.result()
+                if result is None:
+                    continue  # Handed on to the compute stage
+                
+                if result.get('status') == 'retry':
+                    count = requeues.get(seq, 0)
+                    if count < MAX_REQUEUES:
+                        delay = requeue_delay(result.get('retry_after'), count)
+                        requeues[seq] = count + 1
+                        requeued_total += 1
+                        heapq.heappush(deferred, (time.time() + delay, seq, creator))
+                        print(f"🔁 Requeued @{creator.get('handle')} (attempt {count + 2}) - not before {delay:.0f}s from now")
+                        continue
+                    result = {**result, 'status': 'failed',
+                              'error': f"{result.get('error')} (gave up after {MAX_REQUEUES} requeues)"}
+                
+                pipeline.finish(creator, result)
+        
+        # Let creators already past the fetch stage finish
+        await pipeline.drain()
+        if feed and hasattr(feed, 'aclose'):
+            await feed.aclose()
+    
+    report()
+    if requeued_total:
+        print(f"🔁 {requeued_total} retryable failures were requeued instead of slept")
+    controller.counters['requeued'] = requeued_total
+    return controller
+
 # ==================== MAIN EXECUTION ====================
 
 async def cleanup_inactive_creators(resume_from_handle=None):
@@ -1195,91 +2053,48 @@ async def cleanup_inactive_creators(resume_from_handle=None):
     deleted_count = 0
     error_count = 0
     
-    # Configure concurrent processing
-    print(f"🚀 Using concurrent processing with batch size: {CLEANUP_BATCH_SIZE}")
-    print(f"   • Expected speedup: 2-3x faster than sequential processing")
-    print(f"   • Memory usage: Moderate increase due to concurrent operations")
-    print(f"   • API rate limiting: Controlled via semaphore and delays")
-    
-    # Split creators into batches for concurrent processing
-    creator_batches = chunk_list(existing_creators, CLEANUP_BATCH_SIZE)
-    total_batches = len(creator_batches)
-    
-    print(f"📦 Processing {len(existing_creators)} creators in {total_batches} batches of {CLEANUP_BATCH_SIZE}")
+    # Configure adaptive concurrent processing
+    controller = AIMDController()
+    print(f"🚀 Using adaptive concurrency: starting at {controller.window}, range {controller.minimum}-{controller.maximum}")
+    print(f"   • Window grows while API latency and error rate stay healthy")
+    print(f"   • Window halves on 429s or 5xx responses")
     
     # Create progress bar with enhanced description
     with tqdm(total=len(existing_creators), desc="Rescraping and checking creators", 
               bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
         
-        for batch_idx, creator_batch in enumerate(creator_batches):
-            batch_start_time = time.time()
+        def handle_result(creator, result):
+            nonlocal deleted_count, error_count
+            handle = result.get('handle')
+            status = result.get('status')
             
-            print(f"\n📦 Processing batch {batch_idx + 1}/{total_batches} with {len(creator_batch)} creators...")
+            if status == 'success':
+                updated_creators.append(result.get('data'))
+                print(f"✅ Updated @{handle}")
+            elif status == 'deleted':
+                print(f"🗑️ Deleted inactive creator @{handle}")
+                deleted_count += 1
+            elif status == 'error':
+                print(f"❌ Error processing @{handle}: {result.get('error')}")
+                error_count += 1
+            elif status == 'failed':
+                print(f"❌ Failed to get data for @{handle}")
+                error_count += 1
+            elif status == 'skipped':
+                print(f"🪦 Skipped @{handle}: {result.get('reason')}")
             
-            # Process this batch concurrently
-            try:
-                batch_results = await process_creator_batch(creator_batch, CLEANUP_BATCH_SIZE)
-            except Exception as e:
-                print(f"❌ Concurrent processing failed for batch {batch_idx + 1}: {e}")
-                print("🔄 Falling back to sequential processing for this batch...")
-                
-                # Fallback to sequential processing
-                batch_results = []
-                for creator in creator_batch:
-                    try:
-                        result = await rescrape_and_update_creator(creator)
-                        batch_results.append(result)
-                    except Exception as creator_error:
-                        print(f"❌ Error processing @{creator.get('handle', 'unknown')}: {creator_error}")
-                        batch_results.append({'handle': creator.get('handle'), 'status': 'error', 'error': str(creator_error)})
+            # Complete timing and update progress
+            progress_tracker.complete_item()
+            pbar.set_description(f"{progress_tracker.get_progress_bar_description()} [window {controller.window}]")
+            pbar.update(1)
             
-            # Process results from this batch
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    print(f"❌ Batch processing error: {result}")
-                    error_count += 1
-                    progress_tracker.complete_item()
-                    pbar.update(1)
-                    continue
-                
-                handle = result.get('handle')
-                status = result.get('status')
-                
-                if status == 'success':
-                    updated_creators.append(result.get('data'))
-                    print(f"✅ Updated @{handle}")
-                elif status == 'deleted':
-                    print(f"🗑️ Deleted inactive creator @{handle}")
-                    deleted_count += 1
-                elif status == 'error':
-                    print(f"❌ Error processing @{handle}: {result.get('error')}")
-                    error_count += 1
-                elif status == 'failed':
-                    print(f"❌ Failed to get data for @{handle}")
-                    error_count += 1
-                
-                # Complete timing and update progress
-                progress_tracker.complete_item()
-                pbar.set_description(progress_tracker.get_progress_bar_description())
-                pbar.update(1)
-            
-            # Show batch progress
-            batch_time = time.time() - batch_start_time
+            # Show progress summary every 10 items or at 25%, 50%, 75% milestones
             completed = progress_tracker.completed_items
             total = progress_tracker.total_items
-            
-            print(f"📦 Batch {batch_idx + 1}/{total_batches} completed in {batch_time:.1f}s")
-            print(f"   • Progress: {completed}/{total} ({completed/total*100:.1f}%)")
-            print(f"   • Batch processing rate: {len(creator_batch)/batch_time:.2f} creators/second")
-            
-            # Show progress summary every 10 items or at 25%, 50%, 75% milestones
             if (completed % 10 == 0 and completed > 0) or completed in [total//4, total//2, 3*total//4]:
                 progress_tracker.display_progress_summary()
-            
-            # Small delay between batches to be respectful to APIs
-            if batch_idx < total_batches - 1:  # Don't delay after the last batch
-                print(f"⏳ Waiting {BATCH_DELAY}s before next batch...")
-                await asyncio.sleep(BATCH_DELAY)
+        
+        await process_creators_adaptive(existing_creators, controller, on_result=handle_result)
     
     print(f"\n📊 Unified Rescaper Complete:")
     print(f"   • Creators updated: {len(updated_creators)}")
@@ -1293,6 +2108,9 @@ async def cleanup_inactive_creators(resume_from_handle=None):
     print(f"   • Average time per creator: {final_stats['avg_time']:.1f} seconds")
     if final_stats['avg_time'] > 0:
         print(f"   • Concurrent processing speedup: {final_stats['avg_time']/15:.1f}x faster than sequential")
+    concurrency = controller.snapshot()
+    print(f"   • Concurrency window: final {concurrency['window']}, peak {concurrency['peak_window']} "
+          f"({concurrency['increases']} increases, {concurrency['decreases']} decreases)")
     
     # Test mode summary
     if TEST_MODE:
@@ -1323,8 +2141,8 @@ if __name__ == "__main__":
     
     # Performance configuration display
     print("⚡ PERFORMANCE CONFIGURATION:")
-    print(f"   • Cleanup batch size: {CLEANUP_BATCH_SIZE} creators simultaneously")
-    print(f"   • Batch delay: {BATCH_DELAY} seconds between batches")
+    print(f"   • Adaptive concurrency: AIMD window (see adaptive_concurrency.py)")
+    print(f"   • Per-creator timeout: {CREATOR_TIMEOUT} seconds")
     print(f"   • Expected speedup: 3-5x faster than sequential processing")
     
     # Test mode display
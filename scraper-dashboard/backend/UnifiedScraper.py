@@ -16,6 +16,8 @@ import io
 from typing import Optional
 import json
 import time
+from api_reliability_fix import make_instagram_api_call, make_tiktok_api_call, run_api_call
+from tombstones import find_tombstone, bury_handle, tombstone_message
 
 # ==============================================================================
 # --- INITIALIZATION ---
@@ -99,10 +101,14 @@ def convert_heic_bytes_to_jpg(heic_bytes: bytes) -> bytes:
     image.save(output, format="JPEG")
     return output.getvalue()
 
+# Keep-alive connection pool shared by every media download in the process
+media_session = requests.Session()
+media_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
 def download_file(url: str) -> bytes:
     """Download file from URL and return its content as bytes. Converts .heic to .jpg if needed."""
     try:
-        response = requests.get(url, timeout=10)
+        response = media_session.get(url, timeout=10)
         response.raise_for_status()
         content_type = response.headers.get("Content-Type", "")
         if "heic" in content_type or url.lower().endswith(".heic"):
@@ -178,7 +184,11 @@ def calculate_engagement_rate(likes, comments, followers):
 # ==============================================================================
 
 async def process_creator_media(creator_id: str, handle: str, creator_data: dict):
-    """Process media for a single creator. This function is used by both scrapers."""
+    """Process media for a single creator. This function is used by both scrapers.
+
+    Downloads, uploads and the database update run in worker threads, so media
+    for one creator can run as a background task on a job's event loop.
+    """
     clean_handle_name = clean_handle(handle)
     storage_folder = f"{clean_handle_name}/"
     updates = {}
@@ -186,18 +196,20 @@ async def process_creator_media(creator_id: str, handle: str, creator_data: dict
 
     # Ensure bucket exists
     try:
-        supabase.storage.get_bucket(BUCKET_NAME)
+        await asyncio.to_thread(supabase.storage.get_bucket, BUCKET_NAME)
     except Exception:
         print(f"Bucket '{BUCKET_NAME}' not found. Creating it...")
-        supabase.storage.create_bucket(BUCKET_NAME, public=True)
+        await asyncio.to_thread(supabase.storage.create_bucket, BUCKET_NAME, public=True)
 
     # Process profile image
     if creator_data.get("profile_image_url"):
         profile_ext, profile_content_type = get_file_extension_and_type(creator_data["profile_image_url"])
         profile_storage_path = f"{storage_folder}profile{profile_ext}"
-        profile_content = download_file(creator_data["profile_image_url"])
+        profile_content = await asyncio.to_thread(download_file, creator_data["profile_image_url"])
         if profile_content:
-            new_url = upload_to_supabase_storage(BUCKET_NAME, profile_storage_path, profile_content, profile_content_type)
+            new_url = await asyncio.to_thread(
+                upload_to_supabase_storage, BUCKET_NAME, profile_storage_path, profile_content, profile_content_type
+            )
             if new_url:
                 updates["profile_image_url"] = new_url
 
@@ -230,9 +242,11 @@ async def process_creator_media(creator_id: str, handle: str, creator_data: dict
 
             ext, content_type = get_file_extension_and_type(media_url)
             media_storage_path = f"{storage_folder}media_{processed_media + 1}{ext}"
-            file_content = download_file(media_url)
+            file_content = await asyncio.to_thread(download_file, media_url)
             if file_content:
-                new_url = upload_to_supabase_storage(BUCKET_NAME, media_storage_path, file_content, content_type)
+                new_url = await asyncio.to_thread(
+                    upload_to_supabase_storage, BUCKET_NAME, media_storage_path, file_content, content_type
+                )
                 if new_url:
                     new_media_urls.append(new_url)
                     processed_media += 1
@@ -247,7 +261,7 @@ async def process_creator_media(creator_id: str, handle: str, creator_data: dict
             updates[post_key] = post
 
     if updates:
-        supabase.table("creatordata").update(updates).eq("id", creator_id).execute()
+        await asyncio.to_thread(supabase.table("creatordata").update(updates).eq("id", creator_id).execute)
         print(f"✅ Updated {processed_media} media URLs for creator {handle}")
 
 
@@ -428,6 +442,31 @@ def predict_freeform_location_tiktok(all_captions, bio, region):
 
 
 
+def scrapecreators_error(result: dict, username: str, label: str, not_found_error: str) -> dict:
+    """Map a failed API manager result onto this scraper's error shapes."""
+    error_type = result.get('error_type')
+    message = result.get('error_message') or 'Unknown error'
+    if error_type == 'retry_later':
+        print(f"🔁 {label} request for @{username} deferred: {message}")
+        return {"error": "retry_later", "retry_after": result.get('retry_after'), "message": message}
+    elif error_type == 'profile_not_found':
+        print(f"👻 {label} not found for @{username}")
+        return {"error": not_found_error, "message": f"{label} not found"}
+    elif error_type == 'access_denied':
+        print(f"🔒 {label} access forbidden for @{username} (private/blocked)")
+        return {"error": "access_denied", "message": f"{label} access denied"}
+    print(f"❌ {label} API request failed for @{username}: {message}")
+    return {"error": "api_error", "message": f"{label} API error: {message}"}
+
+# Profile API failures that tombstone the handle (error_type -> tombstone failure class)
+TOMBSTONE_ERROR_CLASSES = {'profile_not_found': 'not_found', 'access_denied': 'private'}
+
+def tombstone_failed_profile(result: dict, platform: str, username: str):
+    """Tombstone a handle whose profile call failed permanently."""
+    failure_class = TOMBSTONE_ERROR_CLASSES.get(result.get('error_type'))
+    if failure_class:
+        run_api_call(bury_handle(platform, username, failure_class, result.get('error_message') or ''))
+
 def process_instagram_user(username_input):
     """Process a single Instagram username with multi-niche validation."""
     username_input = username_input.strip().lstrip("@")
@@ -435,67 +474,19 @@ def process_instagram_user(username_input):
     print(f"🔄 Processing Instagram: @{username_input}")
     print(f"{'='*50}")
     
-    print("\n📡 Fetching profile data from ScrapeCreators API...")
-    profile_url = f"https://api.scrapecreators.com/v1/instagram/profile?handle={username_input}"
-    headers = {"x-api-key": SCRAPECREATORS_API_KEY}
-    
-    # Enhanced retry logic with better error handling
-    max_retries = 5  # Increased retries
-    retry_delay = 1
+    tombstone = run_api_call(find_tombstone('instagram', username_input))
+    if tombstone:
+        return {"error": "tombstoned", "message": tombstone_message(tombstone)}
     
-    for attempt in range(max_retries):
-        try:
-            if attempt > 0:
-                wait_time = min(retry_delay * (2 ** (attempt - 1)), 30)  # Cap at 30s
-                print(f"   🔄 Retry {attempt + 1}/{max_retries} for @{username_input} after {wait_time}s...")
-                time.sleep(wait_time)
-            
-            response = requests.get(profile_url, headers=headers, timeout=45)  # Increased timeout
-            
-            if response.status_code == 200:
-                break  # Success
-            elif response.status_code == 429:
-                print(f"⏳ Rate limited for @{username_input}, waiting 90s...")
-                time.sleep(90)  # Longer wait for rate limits
-                continue
-            elif response.status_code == 404:
-                print(f"👻 Profile not found for @{username_input}")
-                return {"error": "not_found", "message": "Profile not found"}
-            elif response.status_code in [500, 502, 503, 504, 520, 521, 522, 523, 524]:
-                print(f"🔄 Server error {response.status_code} for @{username_input}, retrying...")
-                time.sleep(5)  # Brief pause for server errors
-                continue
-            elif response.status_code == 403:
-                print(f"🔒 Access forbidden for @{username_input} (private/blocked)")
-                return {"error": "access_denied", "message": "Profile is private or access denied"}
-            else:
-                print(f"❌ Unexpected status code {response.status_code} for @{username_input}")
-                if attempt == max_retries - 1:
-                    return {"error": "api_error", "message": f"API error: {response.status_code}"}
-                continue
-                
-        except requests.exceptions.Timeout:
-            print(f"⏰ Request timeout for @{username_input} (attempt {attempt + 1})")
-            if attempt == max_retries - 1:
-                return {"error": "timeout", "message": "Request timed out after multiple attempts"}
-            continue
-        except requests.exceptions.ConnectionError:
-            print(f"🌐 Connection error for @{username_input} (attempt {attempt + 1})")
-            if attempt == max_retries - 1:
-                return {"error": "connection_error", "message": "Connection failed after multiple attempts"}
-            time.sleep(5)  # Wait before retrying connection errors
-            continue
-        except requests.RequestException as e:
-            print(f"❌ Profile API request failed (attempt {attempt + 1}): {e}")
-            if attempt == max_retries - 1:
-                return {"error": "api_error", "message": f"Profile API request failed after {max_retries} attempts: {str(e)}"}
-            continue
-    else:
-        print(f"❌ All {max_retries} attempts failed for @{username_input}")
-        return {"error": "api_error", "message": f"Profile API failed after {max_retries} attempts"}
+    print("\n📡 Fetching profile data from ScrapeCreators API...")
+    # Retries, rate limiting and circuit breaking are handled by the shared API manager
+    profile_result = run_api_call(make_instagram_api_call(username_input, SCRAPECREATORS_API_KEY, "profile"))
+    if not profile_result['success']:
+        tombstone_failed_profile(profile_result, 'instagram', username_input)
+        return scrapecreators_error(profile_result, username_input, "Profile", "not_found")
 
     try:
-        response_data = response.json()
+        response_data = profile_result['data']
         
         # Better error handling for missing data structure
         if "data" not in response_data:
@@ -514,16 +505,14 @@ def process_instagram_user(username_input):
         avatar_url = data.get("profile_pic_url_hd")
         followers = data.get("edge_followed_by", {}).get("count", 0)
         
-    except json.JSONDecodeError as e:
-        print(f"❌ Invalid JSON response for @{username_input}: {e}")
-        return {"error": "api_error", "message": f"Invalid JSON response: {str(e)}"}
     except Exception as e:
         print(f"❌ Error parsing ScrapeCreators profile data for @{username_input}: {str(e)}")
-        print(f"   Response content: {response.text[:500]}...")
+        print(f"   Response content: {str(profile_result['data'])[:500]}...")
         return {"error": "api_error", "message": f"Data parsing error: {str(e)}"}
 
     if followers < 10_000 or followers > 350_000:
         print(f"🚫 Skipping: Follower count {followers} not in 10k–350k range.")
+        run_api_call(bury_handle('instagram', username_input, 'follower_range', f"{followers:,} followers"))
         return {"error": "filtered", "message": f"Follower count {followers:,} not in 10k-350k range"}
     
     # --- START: Multi-Niche Classification Logic ---
@@ -542,62 +531,12 @@ def process_instagram_user(username_input):
     # --- END: Multi-Niche Classification Logic ---
 
     print("\n📡 Fetching post data from ScrapeCreators API...")
-    scrapecreators_url = f"https://api.scrapecreators.com/v2/instagram/user/posts?handle={username_input}"
-    
-    # Enhanced retry logic for posts API
-    for attempt in range(max_retries):
-        try:
-            if attempt > 0:
-                wait_time = min(retry_delay * (2 ** (attempt - 1)), 30)
-                print(f"   🔄 Posts retry {attempt + 1}/{max_retries} for @{username_input} after {wait_time}s...")
-                time.sleep(wait_time)
-            
-            posts_response = requests.get(scrapecreators_url, headers={"x-api-key": SCRAPECREATORS_API_KEY}, timeout=45)
-            
-            if posts_response.status_code == 200:
-                break  # Success
-            elif posts_response.status_code == 429:
-                print(f"⏳ Rate limited on posts for @{username_input}, waiting 90s...")
-                time.sleep(90)
-                continue
-            elif posts_response.status_code == 404:
-                print(f"👻 No posts found for @{username_input}")
-                return {"error": "no_posts", "message": "No posts found"}
-            elif posts_response.status_code in [500, 502, 503, 504, 520, 521, 522, 523, 524]:
-                print(f"🔄 Posts server error {posts_response.status_code} for @{username_input}, retrying...")
-                time.sleep(5)
-                continue
-            elif posts_response.status_code == 403:
-                print(f"🔒 Posts access forbidden for @{username_input}")
-                return {"error": "access_denied", "message": "Posts access denied"}
-            else:
-                print(f"❌ Unexpected posts status code {posts_response.status_code} for @{username_input}")
-                if attempt == max_retries - 1:
-                    return {"error": "api_error", "message": f"Posts API error: {posts_response.status_code}"}
-                continue
-                
-        except requests.exceptions.Timeout:
-            print(f"⏰ Posts request timeout for @{username_input} (attempt {attempt + 1})")
-            if attempt == max_retries - 1:
-                return {"error": "timeout", "message": "Posts request timed out after multiple attempts"}
-            continue
-        except requests.exceptions.ConnectionError:
-            print(f"🌐 Posts connection error for @{username_input} (attempt {attempt + 1})")
-            if attempt == max_retries - 1:
-                return {"error": "connection_error", "message": "Posts connection failed after multiple attempts"}
-            time.sleep(5)
-            continue
-        except requests.RequestException as e:
-            print(f"❌ Posts API request failed (attempt {attempt + 1}): {e}")
-            if attempt == max_retries - 1:
-                return {"error": "api_error", "message": f"Posts API request failed after {max_retries} attempts: {str(e)}"}
-            continue
-    else:
-        print(f"❌ All {max_retries} posts attempts failed for @{username_input}")
-        return {"error": "api_error", "message": f"Posts API failed after {max_retries} attempts"}
+    posts_result = run_api_call(make_instagram_api_call(username_input, SCRAPECREATORS_API_KEY, "posts"))
+    if not posts_result['success']:
+        return scrapecreators_error(posts_result, username_input, "Posts", "no_posts")
 
     try:
-        posts_data = posts_response.json().get("items", [])
+        posts_data = (posts_result['data'] or {}).get("items", [])
         likes_list, comments_list, views_list = [], [], []
         all_hashtags, tagged_users, recent_posts, past_ad_placements, all_captions, all_locations, all_tagged_users_in_posts = [], [], [], [], [], [], []
 
@@ -725,6 +664,7 @@ def process_instagram_user(username_input):
         print("\n📅 Checking creator activity...")
         if not is_creator_active(recent_posts, days_threshold=45):
             print(f"🚫 Skipping @{username_input}: No posts in the last 45 days")
+            run_api_call(bury_handle('instagram', username_input, 'inactive', "No posts in the last 45 days"))
             return None
 
         print("\n💾 Saving Instagram data to Supabase...")
@@ -758,45 +698,19 @@ def process_tiktok_account(username, api_key):
     print(f"🔄 Processing TikTok: @{username}")
     print(f"{'='*50}")
 
-    api_url = f"https://api.scrapecreators.com/v3/tiktok/profile/videos?handle={username}"
-    headers = {"x-api-key": api_key}
-    
-    # Add same retry logic for TikTok API
-    max_retries = 3
-    retry_delay = 2
-    
-    for attempt in range(max_retries):
-        try:
-            if attempt > 0:
-                wait_time = retry_delay * (2 ** (attempt - 1))
-                print(f"   🔄 TikTok retry {attempt + 1}/{max_retries} for @{username} after {wait_time}s...")
-                time.sleep(wait_time)
-            
-            response = requests.get(api_url, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                break  # Success
-            elif response.status_code == 429:
-                print(f"⏳ Rate limited on TikTok for @{username}, waiting longer...")
-                time.sleep(60)
-                continue
-            elif response.status_code in [500, 502, 503, 504, 520]:
-                print(f"🔄 TikTok server error {response.status_code} for @{username}, retrying...")
-                continue
-            else:
-                print(f"❌ Failed to fetch TikTok data: {response.status_code}")
-                return {"error": "api_error", "message": f"TikTok API error: {response.status_code}"}
-                
-        except requests.RequestException as e:
-            print(f"❌ TikTok API request failed (attempt {attempt + 1}): {e}")
-            if attempt == max_retries - 1:
-                return {"error": "api_error", "message": f"TikTok API request failed after {max_retries} attempts: {str(e)}"}
-            continue
-    else:
-        print(f"❌ All {max_retries} TikTok attempts failed for @{username}")
-        return {"error": "api_error", "message": f"TikTok API failed after {max_retries} attempts"}
+    tombstone = run_api_call(find_tombstone('tiktok', username))
+    if tombstone:
+        return {"error": "tombstoned", "message": tombstone_message(tombstone)}
+
+    result = run_api_call(make_tiktok_api_call(username, api_key))
+    if not result['success']:
+        tombstone_failed_profile(result, 'tiktok', username)
+        if result.get('error_type') == 'retry_later':
+            return scrapecreators_error(result, username, "TikTok", "api_error")
+        print(f"❌ Failed to fetch TikTok data: {result.get('error_message')}")
+        return {"error": "api_error", "message": f"TikTok API error: {result.get('error_message')}"}
 
-    posts = safe_get(response.json(), ['aweme_list'], [])
+    posts = safe_get(result['data'] or {}, ['aweme_list'], [])
     if not posts:
         print("❌ No posts found for this account")
         return None
@@ -807,6 +721,7 @@ def process_tiktok_account(username, api_key):
 
     if not (10000 <= followers <= 350000):
         print(f"❌ Skipped: Follower count {followers} outside target range")
+        run_api_call(bury_handle('tiktok', username, 'follower_range', f"{followers:,} followers"))
         return None
 
     # --- START: Multi-Niche Classification Logic ---
@@ -917,6 +832,7 @@ def process_tiktok_account(username, api_key):
     print("\n📅 Checking creator activity...")
     if not is_creator_active(recent_posts, days_threshold=45):
         print(f"🚫 Skipping @{username}: No posts in the last 45 days")
+        run_api_call(bury_handle('tiktok', username, 'inactive', "No posts in the last 45 days"))
         return None
 
     return influencer_data
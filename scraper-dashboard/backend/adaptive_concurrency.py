@@ -0,0 +1,129 @@
+"""
+Adaptive Concurrency for Rescrape Jobs
+======================================
+
+AIMD (additive-increase / multiplicative-decrease) controller for the number
+of creators a rescrape job keeps in flight:
+- Grows the window by ~1 per window's worth of healthy API responses
+- Halves the window on 429s and 5xx (at most once per recovery period)
+- Holds the window while latency or error rate is above target
+- Keeps a bounded history of adjustments for job results
+
+The controller is fed by APIReliabilityManager through the `observers`
+entry of `api_call_scope`, so it reacts to every upstream attempt
+including retries.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+# Defaults (override via environment)
+RESCRAPE_CONCURRENCY_INITIAL = int(os.getenv("RESCRAPE_CONCURRENCY_INITIAL", "2"))
+RESCRAPE_CONCURRENCY_MIN = int(os.getenv("RESCRAPE_CONCURRENCY_MIN", "1"))
+RESCRAPE_CONCURRENCY_MAX = int(os.getenv("RESCRAPE_CONCURRENCY_MAX", "16"))
+RESCRAPE_LATENCY_TARGET = float(os.getenv("RESCRAPE_LATENCY_TARGET", "8.0"))  # Seconds per API call
+RESCRAPE_ERROR_RATE_TARGET = float(os.getenv("RESCRAPE_ERROR_RATE_TARGET", "0.1"))
+
+class AIMDController:
+    """Thread-safe AIMD window for creators in flight."""
+
+    def __init__(self, initial: int = RESCRAPE_CONCURRENCY_INITIAL, minimum: int = RESCRAPE_CONCURRENCY_MIN,
+                 maximum: int = RESCRAPE_CONCURRENCY_MAX, increase: float = 1.0, decrease: float = 0.5,
+                 latency_target: float = RESCRAPE_LATENCY_TARGET,
+                 error_rate_target: float = RESCRAPE_ERROR_RATE_TARGET,
+                 sample_size: int = 20, history_limit: int = 200):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.error_rate_target = error_rate_target
+
+        self._window = float(min(max(initial, self.minimum), self.maximum))
+        self._samples = deque(maxlen=sample_size)  # (healthy, latency) per API attempt
+        self._latency_ewma = None
+        self._last_decrease = 0
+        self._lock = threading.Lock()
+
+        self.history = deque(maxlen=history_limit)
+        self.counters = {'increases': 0, 'decreases': 0, 'congestion_signals': 0, 'observed_calls': 0}
+        self.peak_window = int(self._window)
+        self._record('start')
+
+    @property
+    def window(self) -> int:
+        """Current number of creators allowed in flight."""
+        return int(self._window)
+
+    def _record(self, reason: str, status: Union[int, str, None] = None):
+        self.history.append({
+            'at': datetime.utcnow().isoformat(),
+            'window': int(self._window),
+            'reason': reason,
+            'status': status,
+            'latency_ewma': round(self._latency_ewma, 2) if self._latency_ewma is not None else None
+        })
+
+    def _error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for healthy, _ in self._samples if not healthy) / len(self._samples)
+
+    @staticmethod
+    def is_congestion(status: Union[int, str]) -> bool:
+        """429s and 5xx mean the API wants less load."""
+        return status == 429 or (isinstance(status, int) and 500 <= status < 600)
+
+    def observe(self, endpoint: str, status: Union[int, str], latency: Optional[float]):
+        """API observer hook: one call per upstream attempt."""
+        healthy = isinstance(status, int) and status < 500 and status != 429
+        with self._lock:
+            self.counters['observed_calls'] += 1
+            self._samples.append((healthy, latency))
+            if latency is not None:
+                self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+
+            if self.is_congestion(status):
+                self.counters['congestion_signals'] += 1
+                # One decrease per recovery period, like TCP reacting once per RTT
+                recovery_period = max(self._latency_ewma or 0, 1.0)
+                if time.time() - self._last_decrease >= recovery_period:
+                    old_window = int(self._window)
+                    self._window = max(self.minimum, self._window * self.decrease)
+                    self._last_decrease = time.time()
+                    self.counters['decreases'] += 1
+                    self._record(f'decrease ({endpoint})', status)
+                    print(f"📉 Concurrency window {old_window} → {self.window} after {status} on {endpoint}")
+                return
+
+            if not healthy:
+                return
+
+            # Additive increase only while the API looks healthy
+            latency_ok = self._latency_ewma is None or self._latency_ewma <= self.latency_target
+            if latency_ok and self._error_rate() <= self.error_rate_target and self._window < self.maximum:
+                old_window = int(self._window)
+                self._window = min(self.maximum, self._window + self.increase / self._window)
+                if int(self._window) > old_window:
+                    self.counters['increases'] += 1
+                    self.peak_window = max(self.peak_window, int(self._window))
+                    self._record('increase')
+                    print(f"📈 Concurrency window {old_window} → {self.window}")
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable state for job results."""
+        with self._lock:
+            return {
+                'window': int(self._window),
+                'peak_window': self.peak_window,
+                'min': self.minimum,
+                'max': self.maximum,
+                'latency_ewma': round(self._latency_ewma, 2) if self._latency_ewma is not None else None,
+                'error_rate': round(self._error_rate(), 3),
+                **self.counters,
+                'history': list(self.history)
+            }
@@ -6,16 +6,1366 @@ This module provides robust API calling with:
 - Standardized retry logic with exponential backoff
 - Proper error categorization and handling
 - Rate limit management
-- Timeout protection
-- Circuit breaker pattern for repeated failures
+- Timeout protection, adapted per endpoint to its observed p99 latency
+- Circuit breaker pattern for repeated failures (shared cluster-wide through Redis)
+- Cluster-wide retry budget: retries capped at a percentage of first attempts
+- Priority lanes (interactive / scheduled / backfill) for rate limiting and connection slots
+- One keep-alive connection pool per process (async, aiohttp)
+- Read-through cache of raw responses per endpoint and handle (Redis or disk)
+- Single-flight: concurrent fetches of one handle share one upstream call
+- Per-job and daily ledger of upstream calls (credits spent and where they went)
+- Opt-in hedged requests after an endpoint's p95 latency, capped by a credit budget
+- Field-selective parsing of posts/videos payloads (see response_parsing.py)
+- Chaos mode: scripted latency and faults injected client-side for tuning (SCRAPECREATORS_CHAOS)
+
+All ScrapeCreators traffic runs on a single background event loop that owns
+the process-wide aiohttp session. Callers on any thread or event loop await
+`make_reliable_request` / `make_instagram_api_call` / `make_tiktok_api_call`;
+synchronous code uses `run_api_call(...)`.
 """
 
-import requests
+import aiohttp
+import asyncio
+import atexit
+import base64
+import contextvars
+import errno
+import fnmatch
+import hashlib
+import heapq
+import itertools
+import math
+import os
+import tempfile
+import threading
 import time
 import random
-from typing import Dict, Optional, Tuple
+import uuid
+import zlib
+from collections import Counter, deque
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta
 import json
+from response_parsing import parse_response
+
+# Connection pool configuration
+POOL_SIZE = int(os.getenv("SCRAPECREATORS_POOL_SIZE", "20"))  # Max open connections to the API
+KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection stays in the pool
+
+class APIClientLoop:
+    """Background event loop thread owning the process-wide keep-alive session."""
+    
+    def __init__(self, pool_size: int = POOL_SIZE):
+        self.pool_size = pool_size
+        self._loop = None
+        self._session = None
+        self._lock = threading.Lock()
+    
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the client loop thread on first use and return its loop."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                
+                thread = threading.Thread(target=run_loop, name="scrapecreators-client", daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                print(f"🔌 API client loop started (pool size {self.pool_size})")
+            return self._loop
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session. Must be called from the client loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def run(self, coro):
+        """Await a coroutine on the client loop from any event loop."""
+        loop = self.get_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+    
+    def run_blocking(self, coro):
+        """Run a coroutine on the client loop and block the calling thread for its result."""
+        loop = self.get_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    def submit(self, coro):
+        """Schedule a coroutine on the client loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.get_loop())
+    
+    def close(self):
+        """Close the shared session (called at interpreter exit)."""
+        if self._loop is None or self._session is None or self._session.closed:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result(timeout=5)
+        except Exception as e:
+            print(f"⚠️ Failed to close API client session: {e}")
+
+# Global client loop (one connection pool per process)
+client_loop = APIClientLoop()
+atexit.register(client_loop.close)
+
+def run_api_call(coro):
+    """Run an API coroutine (e.g. make_instagram_api_call(...)) from synchronous code."""
+    return client_loop.run_blocking(coro)
+
+# ==================== CALL CONTEXT ====================
+
+# Caller-side settings carried with every API call made in an api_call_scope
+api_call_context = contextvars.ContextVar('api_call_context', default={})
+
+@contextmanager
+def api_call_scope(**values):
+    """
+    Attach settings to every API call made inside this scope.
+    
+    Supported keys:
+        observers: callables(endpoint, status, latency) notified after each upstream
+                   attempt; status is the HTTP status or 'timeout' / 'connection_error' /
+                   'request_error'. Nested scopes add to the outer observers.
+        job_id: scraper_jobs id the calls are billed to in the API ledger.
+        defer_retries: if True, retryable failures (429, 5xx, timeouts, connection errors,
+                       open circuit) return immediately with error_type 'retry_later' and
+                       a 'retry_after' hint instead of sleeping between attempts, so a job
+                       can requeue the creator and move on.
+        force_refresh: if True, skip the response cache and fetch from the API (the
+                       fresh response still refreshes the cache).
+        requeued: if True, these calls re-try a creator a job deferred earlier, so
+                  they spend the retry budget like in-loop retries do.
+        priority: lane for the rate limiter and connection slots - 'interactive'
+                  (one-off admin calls, served first), 'scheduled' (default) or
+                  'backfill' (full sweeps, yields to the other lanes).
+        cancelled: threading.Event; once set, calls (and retries) in the scope fail
+                   with error_type 'cancelled' instead of reaching the API - e.g.
+                   for a worker thread whose creator already timed out.
+    
+    asyncio tasks and asyncio.to_thread calls started inside the scope inherit it.
+    """
+    current = api_call_context.get()
+    merged = {**current, **values}
+    if 'observers' in values:
+        merged['observers'] = tuple(current.get('observers', ())) + tuple(values['observers'])
+    token = api_call_context.set(merged)
+    try:
+        yield
+    finally:
+        api_call_context.reset(token)
+
+# ==================== REQUEUE POLICY ====================
+
+# Deferred ('retry_later') creators go back on the job's work queue with a not-before time
+MAX_REQUEUES = 3            # Requeues per creator before it is reported as failed
+REQUEUE_BASE_DELAY = 15     # Seconds before the first requeued attempt
+REQUEUE_MAX_DELAY = 300     # Cap on the not-before delay
+
+def requeue_delay(retry_after: Optional[float], requeues: int) -> float:
+    """Seconds before a deferred creator is retried: the API's hint, backed off per requeue."""
+    backoff = REQUEUE_BASE_DELAY * (2 ** requeues)
+    return min(max(retry_after or 0, backoff), REQUEUE_MAX_DELAY)
+
+# ==================== SHARED REDIS ====================
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+REDIS_RETRY_INTERVAL = 30  # Seconds to wait before retrying an unreachable Redis
+
+_async_redis = None
+_async_redis_failed_at = 0
+
+async def get_async_redis():
+    """Get the shared async Redis client (client loop only), or None if Redis is unavailable."""
+    global _async_redis, _async_redis_failed_at
+    if aioredis is None:
+        return None
+    if _async_redis is not None:
+        return _async_redis
+    if time.time() - _async_redis_failed_at < REDIS_RETRY_INTERVAL:
+        return None
+    try:
+        client = aioredis.from_url(REDIS_URL, decode_responses=True)
+        await client.ping()
+        _async_redis = client
+        print(f"✅ API coordination Redis connected: {REDIS_URL}")
+    except Exception as e:
+        print(f"⚠️ API coordination Redis unavailable, using per-process state: {e}")
+        _async_redis_failed_at = time.time()
+    return _async_redis
+
+def mark_async_redis_failed(error: Exception):
+    """Drop the shared Redis client after an error so callers fall back to local state."""
+    global _async_redis, _async_redis_failed_at
+    print(f"⚠️ API coordination Redis error, using per-process state for {REDIS_RETRY_INTERVAL}s: {error}")
+    _async_redis = None
+    _async_redis_failed_at = time.time()
+
+# ==================== PRIORITY LANES ====================
+
+# API calls carry a priority lane (api_call_scope(priority=...)), highest first.
+# One-off admin calls are 'interactive', daily/auto rescrapes and CSV uploads
+# 'scheduled', full-table sweeps 'backfill'.
+PRIORITY_LANES = ('interactive', 'scheduled', 'backfill')
+DEFAULT_PRIORITY = 'scheduled'
+INTERACTIVE_RESERVED_SLOTS = int(os.getenv("SCRAPECREATORS_INTERACTIVE_SLOTS", "2"))  # In-flight slots only interactive calls may use
+BACKFILL_BUCKET_FLOOR = float(os.getenv("SCRAPECREATORS_BACKFILL_FLOOR", "0.5"))  # Share of each token bucket backfill leaves to higher lanes
+
+def priority_lane(priority: Optional[str]) -> str:
+    """Normalize a priority name; unknown or missing names fall back to DEFAULT_PRIORITY."""
+    return priority if priority in PRIORITY_LANES else DEFAULT_PRIORITY
+
+class PriorityGate:
+    """In-process admission for upstream attempts, served highest lane first.
+    
+    Jobs and admin endpoints share this process's API client, so a bulk
+    rescrape would otherwise fill every connection slot ahead of a one-off
+    call. Waiters are woken by (lane, arrival order), and the last
+    INTERACTIVE_RESERVED_SLOTS slots are kept for interactive calls. A slot
+    covers the rate-limit wait and the request itself, not retry back-off.
+    Runs on the client loop.
+    """
+    
+    def __init__(self, slots: int = POOL_SIZE, reserved: int = INTERACTIVE_RESERVED_SLOTS):
+        self.slots = max(1, slots)
+        self.reserved = max(0, min(reserved, self.slots - 1))
+        self.in_use = 0
+        self._waiters = []  # heap of (lane rank, arrival seq, future)
+        self._seq = itertools.count()
+        self.waits = Counter()  # lane -> attempts that had to queue for a slot
+    
+    def _limit(self, rank: int) -> int:
+        return self.slots if rank == 0 else self.slots - self.reserved
+    
+    async def acquire(self, priority: str):
+        rank = PRIORITY_LANES.index(priority_lane(priority))
+        if self.in_use < self._limit(rank) and (not self._waiters or self._waiters[0][0] > rank):
+            self.in_use += 1
+            return
+        
+        self.waits[priority_lane(priority)] += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after being handed a slot: pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+    
+    def release(self):
+        self.in_use -= 1
+        while self._waiters:
+            rank, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            # Lower lanes have lower limits, so nobody behind the head can go either
+            if self.in_use >= self._limit(rank):
+                break
+            heapq.heappop(self._waiters)
+            self.in_use += 1
+            future.set_result(None)
+    
+    @asynccontextmanager
+    async def slot(self, priority: str):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+# ==================== RATE LIMITING ====================
+
+# Point at a local stand-in (scrapecreators_standin.py) for offline load tests
+SCRAPECREATORS_BASE_URL = os.getenv("SCRAPECREATORS_BASE_URL", "https://api.scrapecreators.com").rstrip('/')
+
+# ScrapeCreators endpoints, keyed by the name used for rate limits and reporting
+ENDPOINTS = {
+    'instagram_profile': '/v1/instagram/profile',
+    'instagram_posts': '/v2/instagram/user/posts',
+    'tiktok_videos': '/v3/tiktok/profile/videos',
+}
+
+# Token bucket settings per endpoint: (refill rate in requests/second, burst size).
+# Override with RATE_LIMIT_<ENDPOINT> and RATE_LIMIT_<ENDPOINT>_BURST,
+# e.g. RATE_LIMIT_INSTAGRAM_POSTS=2.5 and RATE_LIMIT_INSTAGRAM_POSTS_BURST=5
+DEFAULT_RATE_LIMITS = {
+    'instagram_profile': (3.0, 6),
+    'instagram_posts': (3.0, 6),
+    'tiktok_videos': (3.0, 6),
+}
+
+def load_rate_limits() -> Dict[str, Tuple[float, float]]:
+    """Read per-endpoint token bucket settings from the environment."""
+    limits = {}
+    for endpoint, (rate, burst) in DEFAULT_RATE_LIMITS.items():
+        env_name = f"RATE_LIMIT_{endpoint.upper()}"
+        limits[endpoint] = (
+            float(os.getenv(env_name, rate)),
+            float(os.getenv(f"{env_name}_BURST", burst))
+        )
+    return limits
+
+def endpoint_for_url(url: str) -> Optional[str]:
+    """Map a ScrapeCreators URL to its endpoint name (None for unknown URLs)."""
+    path = urlparse(url).path
+    for endpoint, endpoint_path in ENDPOINTS.items():
+        if path == endpoint_path:
+            return endpoint
+    return None
+
+# Reserve `requested` tokens (the balance may go negative) and return the wait in seconds.
+# Uses the Redis server clock so every replica agrees on refill timing.
+# ARGV[4] is the lane's floor: tokens it leaves for higher lanes before it is served.
+# ARGV[5] = '1' lets the caller jump queued reservations (its token still adds to the debt).
+# ARGV[6] > 0 starts a penalty (after a 429): until it ends every lane waits, jumping or not.
+TOKEN_BUCKET_RESERVE_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local floor = tonumber(ARGV[4]) or 0
+local jump = ARGV[5] == '1'
+local penalty = tonumber(ARGV[6]) or 0
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'penalty_until')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+local penalty_until = tonumber(state[3]) or 0
+local available = math.min(burst, tokens + math.max(0, now - ts) * rate)
+tokens = available - requested
+if penalty > 0 then
+    penalty_until = math.max(penalty_until, now + penalty)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now), 'penalty_until', tostring(penalty_until))
+redis.call('EXPIRE', KEYS[1], 3600)
+local short = floor - tokens
+if jump then
+    short = requested - math.max(available, 0)
+end
+local wait = math.max(short / rate, penalty_until - now)
+if wait <= 0 then
+    return '0'
+end
+return tostring(wait)
+"""
+
+class TokenBucketLimiter:
+    """Cluster-wide token bucket per endpoint, shared through Redis.
+    
+    Every worker reserves a token before sending. When the bucket is empty the
+    reservation returns how long to wait, so callers space themselves out at
+    exactly the configured rate instead of discovering the limit via 429s.
+    Falls back to an in-process bucket when Redis is unreachable.
+    """
+    
+    KEY_PREFIX = "ratelimit:scrapecreators:"
+    
+    def __init__(self, limits: Dict[str, Tuple[float, float]]):
+        self.limits = limits
+        self.local_buckets = {}  # endpoint -> {'tokens', 'ts'} when Redis is down
+    
+    def _reserve_local(self, endpoint: str, rate: float, burst: float, requested: float,
+                       floor: float = 0, jump: bool = False, penalty: float = 0) -> float:
+        now = time.time()
+        bucket = self.local_buckets.setdefault(endpoint, {'tokens': burst, 'ts': now, 'penalty_until': 0})
+        available = min(burst, bucket['tokens'] + max(0, now - bucket['ts']) * rate)
+        tokens = available - requested
+        bucket['tokens'], bucket['ts'] = tokens, now
+        if penalty > 0:
+            bucket['penalty_until'] = max(bucket['penalty_until'], now + penalty)
+        short = requested - max(available, 0) if jump else floor - tokens
+        return max(0, short / rate, bucket['penalty_until'] - now)
+    
+    async def _reserve(self, endpoint: str, requested: float, priority: str = DEFAULT_PRIORITY,
+                       penalty: float = 0) -> float:
+        rate, burst = self.limits[endpoint]
+        # Interactive calls wait only for their own token (never through a 429 penalty);
+        # backfill leaves part of the burst to others
+        jump = priority == 'interactive'
+        floor = burst * BACKFILL_BUCKET_FLOOR if priority == 'backfill' else 0
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                wait = await redis_client.eval(
+                    TOKEN_BUCKET_RESERVE_LUA, 1, f"{self.KEY_PREFIX}{endpoint}",
+                    rate, burst, requested, floor, '1' if jump else '0', penalty
+                )
+                return float(wait)
+            except Exception as e:
+                mark_async_redis_failed(e)
+        return self._reserve_local(endpoint, rate, burst, requested, floor, jump, penalty)
+    
+    async def acquire(self, endpoint: str, priority: str = DEFAULT_PRIORITY) -> float:
+        """Wait for a token for this endpoint in the caller's priority lane. Returns the seconds spent waiting."""
+        if endpoint not in self.limits:
+            return 0
+        wait = await self._reserve(endpoint, 1, priority)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    async def penalize(self, endpoint: str, seconds: float):
+        """Drain the bucket after a 429 so all workers pause for at least `seconds`."""
+        if endpoint not in self.limits:
+            return
+        rate, burst = self.limits[endpoint]
+        # Reserving burst + rate*seconds empties the bucket and pushes every waiter back; the penalty
+        # window also holds interactive calls, which otherwise jump the debt
+        await self._reserve(endpoint, burst + rate * seconds, penalty=seconds)
+
+# ==================== RETRY BUDGET ====================
+
+# Retries (in-loop and requeued creators) may be at most a fraction of first attempts
+# over a sliding window, cluster-wide, so a degraded API isn't hit with a retry storm
+RETRY_BUDGET_PERCENT = float(os.getenv("SCRAPECREATORS_RETRY_BUDGET_PERCENT", "10"))  # Retries per 100 first attempts
+RETRY_BUDGET_WINDOW = int(os.getenv("SCRAPECREATORS_RETRY_BUDGET_WINDOW", "60"))  # Sliding window in seconds
+RETRY_BUDGET_MIN = int(os.getenv("SCRAPECREATORS_RETRY_BUDGET_MIN", "5"))  # Retries always allowed per window
+RETRY_BUDGET_BUCKET = 10  # Seconds per counter bucket in the window
+
+# Count a first attempt, or spend one retry if the window still allows it (returns 1/0).
+# Buckets are keyed by the Redis server clock so every replica shares the same window.
+RETRY_BUDGET_LUA = """
+local bucket_seconds = tonumber(ARGV[2])
+local buckets = tonumber(ARGV[3])
+local now = tonumber(redis.call('TIME')[1])
+local current = math.floor(now / bucket_seconds)
+local key = KEYS[1] .. current
+if ARGV[1] == 'attempt' then
+    redis.call('HINCRBY', key, 'attempts', 1)
+    redis.call('EXPIRE', key, bucket_seconds * (buckets + 1))
+    return 1
+end
+local attempts, retries = 0, 0
+for i = 0, buckets - 1 do
+    local counts = redis.call('HMGET', KEYS[1] .. (current - i), 'attempts', 'retries')
+    attempts = attempts + (tonumber(counts[1]) or 0)
+    retries = retries + (tonumber(counts[2]) or 0)
+end
+if retries >= math.max(tonumber(ARGV[5]), attempts * tonumber(ARGV[4])) then
+    return 0
+end
+redis.call('HINCRBY', key, 'retries', 1)
+redis.call('EXPIRE', key, bucket_seconds * (buckets + 1))
+return 1
+"""
+
+class RetryBudget:
+    """Cluster-wide retry budget over a sliding window of bucketed counters.
+    
+    Falls back to in-process counters when Redis is unreachable.
+    """
+    
+    KEY_PREFIX = "retrybudget:scrapecreators:"
+    
+    def __init__(self, percent: float = RETRY_BUDGET_PERCENT, window: int = RETRY_BUDGET_WINDOW,
+                 min_retries: int = RETRY_BUDGET_MIN, bucket_seconds: int = RETRY_BUDGET_BUCKET):
+        self.ratio = percent / 100
+        self.min_retries = min_retries
+        self.bucket_seconds = bucket_seconds
+        self.buckets = max(1, window // bucket_seconds)
+        self.local_buckets = {}  # bucket -> [attempts, retries] when Redis is down
+        self.rejected = 0
+    
+    def _spend_local(self, kind: str) -> bool:
+        current = int(time.time() // self.bucket_seconds)
+        for bucket in [b for b in self.local_buckets if b <= current - self.buckets]:
+            del self.local_buckets[bucket]
+        counts = self.local_buckets.setdefault(current, [0, 0])
+        if kind == 'attempt':
+            counts[0] += 1
+            return True
+        attempts = sum(c[0] for c in self.local_buckets.values())
+        retries = sum(c[1] for c in self.local_buckets.values())
+        if retries >= max(self.min_retries, attempts * self.ratio):
+            return False
+        counts[1] += 1
+        return True
+    
+    async def _spend(self, kind: str) -> bool:
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                allowed = await redis_client.eval(
+                    RETRY_BUDGET_LUA, 1, self.KEY_PREFIX, kind, self.bucket_seconds, self.buckets,
+                    self.ratio, self.min_retries
+                )
+                return bool(int(allowed))
+            except Exception as e:
+                mark_async_redis_failed(e)
+        return self._spend_local(kind)
+    
+    async def record_attempt(self):
+        """Count a first attempt (each one earns a fraction of a retry)."""
+        await self._spend('attempt')
+    
+    async def try_retry(self) -> bool:
+        """Spend one retry from the budget. False means the budget is exhausted."""
+        allowed = await self._spend('retry')
+        if not allowed:
+            self.rejected += 1
+        return allowed
+
+# ==================== RESPONSE CACHE ====================
+
+# Raw profile/posts/videos responses, keyed by endpoint and normalized handle, so resumed
+# jobs, fix jobs and retried rescrapes reuse JSON we already paid for
+RESPONSE_CACHE_BACKEND = os.getenv("SCRAPECREATORS_CACHE", "redis")  # redis, disk or off
+RESPONSE_CACHE_TTL = int(os.getenv("SCRAPECREATORS_CACHE_TTL", "21600"))  # 6 hours
+RESPONSE_CACHE_DIR = os.getenv(
+    "SCRAPECREATORS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "scrapecreators-cache")
+)
+
+def normalize_handle(handle: str) -> str:
+    """Canonical form of a creator handle for cache and coordination keys."""
+    return handle.strip().lstrip('@').lower()
+
+def handle_for_url(url: str) -> Optional[str]:
+    """Normalized `handle` query parameter of a ScrapeCreators URL, if any."""
+    handles = parse_qs(urlparse(url).query).get('handle')
+    return normalize_handle(handles[0]) if handles else None
+
+class ResponseCache:
+    """Read-through cache of zlib-compressed API response bodies.
+    
+    Uses Redis when the backend is 'redis' and Redis is reachable, local disk
+    otherwise. Entries expire after `ttl` seconds.
+    """
+    
+    KEY_PREFIX = "apicache:scrapecreators:"
+    
+    def __init__(self, backend: str = RESPONSE_CACHE_BACKEND, ttl: int = RESPONSE_CACHE_TTL,
+                 cache_dir: str = RESPONSE_CACHE_DIR):
+        self.backend = backend
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.backend != 'off' and self.ttl > 0
+    
+    def _path(self, endpoint: str, handle: str) -> str:
+        digest = hashlib.sha256(f"{endpoint}:{handle}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, endpoint, f"{digest}.json.z")
+    
+    def _read_disk(self, path: str) -> Optional[bytes]:
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_disk(self, path: str, payload: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)  # Atomic, so readers never see a partial file
+    
+    async def get(self, endpoint: str, handle: str) -> Optional[bytes]:
+        """Return the cached response body, or None on a miss."""
+        payload = None
+        redis_client = await get_async_redis() if self.backend == 'redis' else None
+        if redis_client is not None:
+            try:
+                cached = await redis_client.get(f"{self.KEY_PREFIX}{endpoint}:{handle}")
+                payload = base64.b64decode(cached) if cached else None
+            except Exception as e:
+                mark_async_redis_failed(e)
+                redis_client = None
+        if redis_client is None:
+            payload = await asyncio.to_thread(self._read_disk, self._path(endpoint, handle))
+        
+        if payload is None:
+            self.misses += 1
+            return None
+        try:
+            body = zlib.decompress(payload)
+        except zlib.error:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return body
+    
+    async def set(self, endpoint: str, handle: str, body: bytes):
+        """Store a response body (best effort - failures only cost a future API call)."""
+        payload = zlib.compress(body, 6)
+        redis_client = await get_async_redis() if self.backend == 'redis' else None
+        if redis_client is not None:
+            try:
+                await redis_client.setex(
+                    f"{self.KEY_PREFIX}{endpoint}:{handle}", self.ttl, base64.b64encode(payload).decode('ascii')
+                )
+                return
+            except Exception as e:
+                mark_async_redis_failed(e)
+        try:
+            await asyncio.to_thread(self._write_disk, self._path(endpoint, handle), payload)
+        except OSError as e:
+            print(f"⚠️ Failed to cache {endpoint} response for @{handle}: {e}")
+
+# ==================== SINGLE FLIGHT ====================
+
+# Failures that are the API's final answer for a handle, so followers can share them.
+# Others (retry_later, cancelled, retry_budget, circuit_breaker, max_retries_exceeded)
+# depend on the leader's call context or on a transient fault.
+SHARED_ERROR_TYPES = {'profile_not_found', 'access_denied', 'client_error', 'json_decode'}
+
+def shareable_result(result: Optional[Dict]) -> bool:
+    """True for results concurrent callers of the same fetch may reuse."""
+    return result is not None and (result.get('success') or result.get('error_type') in SHARED_ERROR_TYPES)
+
+# Delete the flight lock only if this worker still owns it
+RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+def single_flight_key(endpoint: str, handle: str, context: Dict) -> str:
+    """Coalescing key: only callers in the same lane with the same retry/cache settings share a fetch."""
+    return (f"{endpoint}:{handle}:{priority_lane(context.get('priority'))}:"
+            f"{int(bool(context.get('defer_retries')))}{int(bool(context.get('force_refresh')))}")
+
+class SingleFlight:
+    """Coalesces concurrent fetches of the same key into one upstream call.
+    
+    Within a process every call runs on the client loop, so followers simply
+    await the leader's future. Across workers the leader holds a Redis lock
+    (SET NX with a TTL) and publishes its result under the lock's token;
+    followers poll for that result. If the leader dies or gives up, followers
+    run the fetch themselves. Without Redis only in-process calls are shared.
+    Only shareable_result() outcomes are handed to followers; otherwise they
+    fetch again themselves.
+    """
+    
+    KEY_PREFIX = "singleflight:scrapecreators:"
+    RESULT_TTL = 60       # Seconds a published result stays readable for followers
+    POLL_INTERVAL = 0.25  # Seconds between follower checks
+    
+    def __init__(self):
+        self.in_flight = {}  # key -> asyncio.Future (client loop only)
+        self.coalesced = 0
+    
+    async def do(self, key: str, fetch, lock_ttl: float) -> Dict:
+        """Return fetch()'s result, sharing it with concurrent callers for `key`."""
+        while True:
+            future = self.in_flight.get(key)
+            if future is not None:
+                result = await asyncio.shield(future)
+                if result is not None:
+                    self.coalesced += 1
+                    return {**result, 'coalesced': True}
+                continue  # The leader had nothing to share - fetch (or follow a new leader)
+            
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+            result = None
+            try:
+                result = await self._run_across_workers(key, fetch, lock_ttl)
+                return result
+            finally:
+                del self.in_flight[key]
+                future.set_result(result if shareable_result(result) else None)
+    
+    async def _run_across_workers(self, key: str, fetch, lock_ttl: float) -> Dict:
+        redis_client = await get_async_redis()
+        if redis_client is None:
+            return await fetch()
+        
+        lock_key = f"{self.KEY_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        deadline = time.time() + lock_ttl
+        try:
+            while True:
+                if await redis_client.set(lock_key, token, nx=True, px=int(lock_ttl * 1000)):
+                    break  # This worker leads the flight
+                
+                # Another worker is fetching - wait for its result
+                leader_token = await redis_client.get(lock_key)
+                while leader_token:
+                    published = await redis_client.get(f"{lock_key}:result:{leader_token}")
+                    if published:
+                        self.coalesced += 1
+                        return {**json.loads(zlib.decompress(base64.b64decode(published))), 'coalesced': True}
+                    if time.time() > deadline:
+                        print(f"⚠️ Single-flight leader for {key} timed out - fetching directly")
+                        return await fetch()
+                    await asyncio.sleep(self.POLL_INTERVAL)
+                    if await redis_client.get(lock_key) != leader_token:
+                        # Lock released or taken over - the result may have been published just before
+                        published = await redis_client.get(f"{lock_key}:result:{leader_token}")
+                        if published:
+                            self.coalesced += 1
+                            return {**json.loads(zlib.decompress(base64.b64decode(published))), 'coalesced': True}
+                        break
+                    
+        except Exception as e:
+            mark_async_redis_failed(e)
+            return await fetch()
+        
+        result = None
+        try:
+            result = await fetch()
+            return result
+        finally:
+            try:
+                if shareable_result(result):
+                    payload = base64.b64encode(zlib.compress(json.dumps(result).encode(), 6)).decode('ascii')
+                    await redis_client.setex(f"{lock_key}:result:{token}", self.RESULT_TTL, payload)
+                await redis_client.eval(RELEASE_LOCK_LUA, 1, lock_key, token)
+            except Exception as e:
+                mark_async_redis_failed(e)
+
+# ==================== CIRCUIT BREAKER ====================
+
+# Breaker state per endpoint lives in one Redis hash: state (closed/open/half_open),
+# failures, opened_at and probe_until. All transitions run as Lua scripts against the
+# Redis server clock, so concurrent workers on every replica see one state machine.
+
+# ARGV: reset_time, probe_timeout. Returns {allowed, state, retry_after}.
+# An open circuit past its reset time hands exactly one caller the half-open probe.
+CIRCUIT_ALLOW_LUA = """
+local reset_time = tonumber(ARGV[1])
+local probe_timeout = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+if state == 'closed' then
+    return {1, state, '0'}
+end
+if state == 'open' then
+    local opened_at = tonumber(redis.call('HGET', KEYS[1], 'opened_at')) or 0
+    if now - opened_at < reset_time then
+        return {0, state, tostring(reset_time - (now - opened_at))}
+    end
+end
+local probe_until = tonumber(redis.call('HGET', KEYS[1], 'probe_until')) or 0
+if state == 'half_open' and now < probe_until then
+    return {0, state, tostring(probe_until - now)}
+end
+redis.call('HSET', KEYS[1], 'state', 'half_open', 'probe_until', tostring(now + probe_timeout))
+return {1, 'probe', '0'}
+"""
+
+# ARGV: threshold, ttl. Returns the new state.
+CIRCUIT_FAILURE_LUA = """
+local threshold = tonumber(ARGV[1])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+local failures = (tonumber(redis.call('HGET', KEYS[1], 'failures')) or 0) + 1
+if state == 'half_open' or (state == 'closed' and failures >= threshold) then
+    state = 'open'
+    redis.call('HSET', KEYS[1], 'opened_at', tostring(now))
+end
+redis.call('HSET', KEYS[1], 'state', state, 'failures', failures)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return state
+"""
+
+# Returns 'recovered' when a half-open probe closed the circuit, else the state.
+CIRCUIT_SUCCESS_LUA = """
+local state = redis.call('HGET', KEYS[1], 'state')
+if not state then
+    return 'closed'
+end
+if state == 'half_open' then
+    redis.call('HSET', KEYS[1], 'state', 'closed', 'failures', 0)
+    return 'recovered'
+end
+local failures = tonumber(redis.call('HGET', KEYS[1], 'failures')) or 0
+redis.call('HSET', KEYS[1], 'failures', math.max(0, failures - 2))
+return state
+"""
+
+class CircuitBreaker:
+    """Cluster-wide circuit breaker per endpoint, shared through Redis.
+    
+    closed -> open after `threshold` severe failures; open -> half-open once
+    `reset_time` has passed, admitting a single probe request across all
+    workers and replicas; half-open -> closed on the probe's success or back to
+    open on its failure. A probe that never reports back is replaced after
+    `probe_timeout`. Falls back to in-process state when Redis is unreachable.
+    """
+    
+    KEY_PREFIX = "circuit:scrapecreators:"
+    
+    def __init__(self, threshold: int, reset_time: float, probe_timeout: float):
+        self.threshold = threshold
+        self.reset_time = reset_time
+        self.probe_timeout = probe_timeout
+        self.local_state = {}  # key -> {'state', 'failures', 'opened_at', 'probe_until'} when Redis is down
+        self._lock = threading.Lock()
+    
+    def _allow_local(self, key: str) -> Tuple[bool, str, float]:
+        now = time.time()
+        with self._lock:
+            circuit = self.local_state.get(key)
+            if circuit is None or circuit['state'] == 'closed':
+                return True, 'closed', 0
+            if circuit['state'] == 'open' and now - circuit['opened_at'] < self.reset_time:
+                return False, 'open', self.reset_time - (now - circuit['opened_at'])
+            if circuit['state'] == 'half_open' and now < circuit['probe_until']:
+                return False, 'half_open', circuit['probe_until'] - now
+            circuit['state'] = 'half_open'
+            circuit['probe_until'] = now + self.probe_timeout
+            return True, 'probe', 0
+    
+    def _failure_local(self, key: str) -> str:
+        with self._lock:
+            circuit = self.local_state.setdefault(
+                key, {'state': 'closed', 'failures': 0, 'opened_at': 0, 'probe_until': 0}
+            )
+            circuit['failures'] += 1
+            if circuit['state'] == 'half_open' or (
+                    circuit['state'] == 'closed' and circuit['failures'] >= self.threshold):
+                circuit['state'] = 'open'
+                circuit['opened_at'] = time.time()
+            return circuit['state']
+    
+    def _success_local(self, key: str) -> str:
+        with self._lock:
+            circuit = self.local_state.get(key)
+            if circuit is None:
+                return 'closed'
+            if circuit['state'] == 'half_open':
+                circuit['state'] = 'closed'
+                circuit['failures'] = 0
+                return 'recovered'
+            circuit['failures'] = max(0, circuit['failures'] - 2)
+            return circuit['state']
+    
+    async def allow(self, key: str) -> Tuple[bool, str, float]:
+        """
+        Ask to send a request.
+        
+        Returns:
+            (allowed, state, retry_after) - state is 'probe' when this caller was
+            given the single half-open test request
+        """
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                allowed, state, retry_after = await redis_client.eval(
+                    CIRCUIT_ALLOW_LUA, 1, f"{self.KEY_PREFIX}{key}", self.reset_time, self.probe_timeout
+                )
+                return bool(allowed), state, float(retry_after)
+            except Exception as e:
+                mark_async_redis_failed(e)
+        return self._allow_local(key)
+    
+    async def record_failure(self, key: str) -> str:
+        """Count a severe failure. Returns the resulting state."""
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                # Keep state well past the reset time so an open circuit is never forgotten early
+                ttl = int(max(self.reset_time * 10, 600))
+                return await redis_client.eval(
+                    CIRCUIT_FAILURE_LUA, 1, f"{self.KEY_PREFIX}{key}", self.threshold, ttl
+                )
+            except Exception as e:
+                mark_async_redis_failed(e)
+        return self._failure_local(key)
+    
+    async def record_success(self, key: str) -> str:
+        """Count a success. Returns 'recovered' if this closed a half-open circuit."""
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                return await redis_client.eval(CIRCUIT_SUCCESS_LUA, 1, f"{self.KEY_PREFIX}{key}")
+            except Exception as e:
+                mark_async_redis_failed(e)
+        return self._success_local(key)
+
+# ==================== LATENCY TRACKING ====================
+
+# Hedged requests (off by default - every hedge can cost an extra API credit)
+HEDGING_ENABLED = os.getenv("SCRAPECREATORS_HEDGING", "false").lower() in ("1", "true", "yes")
+HEDGE_BUDGET = float(os.getenv("SCRAPECREATORS_HEDGE_BUDGET_PERCENT", "5")) / 100  # Max hedges per call sent
+HEDGE_MIN_DELAY = 1.0  # Never hedge sooner than this many seconds
+
+# Adaptive per-attempt timeouts: a high percentile of recent latency plus margin, within bounds
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_MARGIN_FACTOR = 1.5      # Timeout = p99 * factor + seconds
+TIMEOUT_MARGIN_SECONDS = 2.0
+TIMEOUT_MIN = float(os.getenv("SCRAPECREATORS_TIMEOUT_MIN", "8"))  # Never time out sooner than this
+TIMEOUT_MAX = os.getenv("SCRAPECREATORS_TIMEOUT_MAX")  # Defaults to the manager's REQUEST_TIMEOUT
+
+class LatencyTracker:
+    """Recent response latencies per endpoint, for percentiles.
+    
+    Successful responses are recorded as measured; timed-out attempts are
+    recorded at the time waited, so a slowing endpoint pushes its own
+    timeout up instead of failing every attempt.
+    """
+    
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self.window = window
+        self.samples = {}  # endpoint -> deque of seconds
+    
+    def observe(self, endpoint: Optional[str], latency: float):
+        if endpoint is not None:
+            self.samples.setdefault(endpoint, deque(maxlen=self.window)).append(latency)
+    
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        """The q-quantile (0-1) of recent latencies, or None until enough samples exist."""
+        samples = self.samples.get(endpoint)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    
+    def snapshot(self) -> Dict:
+        """Per-endpoint sample counts and p50/p90/p95/p99 in seconds."""
+        report = {}
+        for endpoint, samples in list(self.samples.items()):
+            ordered = sorted(list(samples))
+            report[endpoint] = {'samples': len(ordered)}
+            for name, q in (('p50', 0.5), ('p90', 0.9), ('p95', 0.95), ('p99', 0.99)):
+                report[endpoint][name] = round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
+        return report
+
+# ==================== CALL LEDGER ====================
+
+# Every upstream attempt is counted per job (context job_id) and per UTC day
+LEDGER_JOB_TTL = 7 * 24 * 3600     # Seconds job counters are kept
+LEDGER_DAY_TTL = 90 * 24 * 3600    # Seconds daily totals are kept
+LEDGER_LOG_LIMIT = 5000            # Per-call records kept per job
+LEDGER_FLUSH_INTERVAL = 2          # Seconds between batched writes
+SUCCESS_OUTCOMES = ('added', 'updated', 'refreshed')  # Creator outcomes that count as paid-off work
+
+class APICallLedger:
+    """Counts ScrapeCreators calls per job and per day in Redis.
+    
+    Records are buffered on the client loop and written in one pipeline per
+    flush. Jobs report each creator's final outcome with record_outcome so the
+    calls spent on that handle are attributed to it (e.g. posts calls for
+    creators later dropped as inactive). Falls back to in-process counters
+    when Redis is unreachable.
+    """
+    
+    KEY_PREFIX = "apiledger:"
+    
+    def __init__(self):
+        self.pending = []  # Records not yet written (client loop only)
+        self._flush_task = None
+        self.local_counters = {}  # key -> Counter when Redis is down
+        self.local_logs = {}  # job_id -> deque of records when Redis is down
+        self.outcome_futures = set()  # record_outcome calls submitted from job threads
+        self._lock = threading.Lock()
+    
+    def job_key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}job:{job_id}"
+    
+    def day_key(self, day: str) -> str:
+        return f"{self.KEY_PREFIX}day:{day}"
+    
+    def record(self, job_id: Optional[str], endpoint: Optional[str], handle: Optional[str],
+               attempt: Optional[int], status, latency: Optional[float], requeued: bool = False):
+        """
+        Buffer one upstream attempt. Status 'cache_hit' / 'coalesced' marks a call that was saved.
+        
+        Attempts after the first, and every attempt of a creator a job requeued
+        (defer_retries), count as retries.
+        """
+        self.pending.append({
+            'at': time.time(),
+            'job_id': job_id,
+            'endpoint': endpoint or 'other',
+            'handle': handle,
+            'attempt': attempt,
+            'requeued': requeued,
+            'status': status,
+            'latency': round(latency, 3) if latency is not None else None
+        })
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+    
+    async def _flush_later(self):
+        await asyncio.sleep(LEDGER_FLUSH_INTERVAL)
+        await self.flush()
+    
+    def _increments(self, records) -> Tuple[Dict[str, Counter], Dict[str, list]]:
+        """Turn buffered records into per-key counter increments and per-job logs."""
+        increments, logs = {}, {}
+        for record in records:
+            day = datetime.utcfromtimestamp(record['at']).strftime('%Y-%m-%d')
+            fields = Counter()
+            if record['status'] in ('cache_hit', 'coalesced'):
+                fields[f"saved:{record['status']}"] += 1
+            else:
+                fields['calls'] += 1
+                fields[f"calls:{record['endpoint']}"] += 1
+                fields[f"status:{record['status']}"] += 1
+                if record['attempt'] or record.get('requeued'):
+                    fields['retries'] += 1
+                if record['latency'] is not None:
+                    fields[f"latency_ms:{record['endpoint']}"] += int(record['latency'] * 1000)
+            
+            keys = [self.day_key(day)]
+            if record['job_id']:
+                keys.append(self.job_key(record['job_id']))
+                logs.setdefault(record['job_id'], []).append(json.dumps(record))
+                if record['handle'] and 'calls' in fields:
+                    increments.setdefault(f"{self.job_key(record['job_id'])}:handles", Counter())[record['handle']] += 1
+            for key in keys:
+                increments.setdefault(key, Counter()).update(fields)
+        return increments, logs
+    
+    def _apply_local(self, increments: Dict[str, Counter], logs: Dict[str, list]):
+        with self._lock:
+            for key, fields in increments.items():
+                self.local_counters.setdefault(key, Counter()).update(fields)
+            for job_id, entries in logs.items():
+                self.local_logs.setdefault(job_id, deque(maxlen=LEDGER_LOG_LIMIT)).extend(entries)
+    
+    async def _write(self, increments: Dict[str, Counter], logs: Dict[str, list]):
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key, fields in increments.items():
+                        for field, amount in fields.items():
+                            pipe.hincrby(key, field, amount)
+                        pipe.expire(key, LEDGER_DAY_TTL if ':day:' in key else LEDGER_JOB_TTL)
+                    for job_id, entries in logs.items():
+                        log_key = f"{self.job_key(job_id)}:log"
+                        pipe.rpush(log_key, *entries)
+                        pipe.ltrim(log_key, -LEDGER_LOG_LIMIT, -1)
+                        pipe.expire(log_key, LEDGER_JOB_TTL)
+                    await pipe.execute()
+                return
+            except Exception as e:
+                mark_async_redis_failed(e)
+        self._apply_local(increments, logs)
+    
+    async def flush(self):
+        """Write buffered records."""
+        records, self.pending = self.pending, []
+        if records:
+            await self._write(*self._increments(records))
+    
+    async def _read(self, key: str) -> Dict[str, str]:
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                return await redis_client.hgetall(key)
+            except Exception as e:
+                mark_async_redis_failed(e)
+        with self._lock:
+            return dict(self.local_counters.get(key, {}))
+    
+    async def record_outcome(self, job_id: str, handle: str, outcome: str):
+        """Attribute the calls spent on a handle to the creator's final outcome."""
+        await self.flush()
+        handle = normalize_handle(handle)
+        handle_calls = await self._read(f"{self.job_key(job_id)}:handles")
+        calls = int(handle_calls.get(handle, 0))
+        fields = Counter({f"creators:{outcome}": 1, f"outcome_calls:{outcome}": calls})
+        day = datetime.utcnow().strftime('%Y-%m-%d')
+        await self._write({self.job_key(job_id): fields, self.day_key(day): fields}, {})
+    
+    async def summary(self, key: str) -> Dict:
+        """Roll a job or day hash up into a JSON-serializable report."""
+        # Outcomes reported just before the summary should be counted in it
+        outcomes_in_flight = [asyncio.wrap_future(future) for future in list(self.outcome_futures)]
+        if outcomes_in_flight:
+            await asyncio.gather(*outcomes_in_flight, return_exceptions=True)
+        await self.flush()
+        fields = {field: int(value) for field, value in (await self._read(key)).items()}
+        calls = fields.get('calls', 0)
+        
+        by_endpoint, by_status, outcomes = {}, {}, {}
+        for field, value in fields.items():
+            kind, _, name = field.partition(':')
+            if kind == 'calls' and name:
+                latency_ms = fields.get(f"latency_ms:{name}", 0)
+                by_endpoint[name] = {'calls': value, 'avg_latency': round(latency_ms / value / 1000, 2) if value else None}
+            elif kind == 'status':
+                by_status[name] = value
+            elif kind == 'creators':
+                outcomes.setdefault(name, {})['creators'] = value
+            elif kind == 'outcome_calls':
+                outcomes.setdefault(name, {})['calls'] = value
+        
+        successes = sum(outcomes.get(outcome, {}).get('creators', 0) for outcome in SUCCESS_OUTCOMES)
+        return {
+            'calls': calls,
+            'retries': fields.get('retries', 0),
+            'saved_by_cache': fields.get('saved:cache_hit', 0),
+            'saved_by_coalescing': fields.get('saved:coalesced', 0),
+            'by_endpoint': by_endpoint,
+            'by_status': by_status,
+            'outcomes': outcomes,
+            'calls_per_success': round(calls / successes, 2) if successes else None
+        }
+
+# Global ledger (shared by every API manager in the process)
+api_ledger = APICallLedger()
+
+def record_job_outcome(job_id: str, handle: str, outcome: str):
+    """Report a creator's final outcome (e.g. 'updated', 'inactive', 'filtered') to the API ledger."""
+    if job_id and handle:
+        future = client_loop.submit(api_ledger.record_outcome(job_id, handle, outcome))
+        api_ledger.outcome_futures.add(future)
+        future.add_done_callback(api_ledger.outcome_futures.discard)
+
+def get_job_api_usage(job_id: str) -> Dict:
+    """API call totals for a job, for scraper_jobs.results."""
+    return run_api_call(api_ledger.summary(api_ledger.job_key(job_id)))
+
+def get_daily_api_usage(day: str) -> Dict:
+    """API call totals for one UTC day (YYYY-MM-DD), across all jobs and workers."""
+    return {'date': day, **run_api_call(api_ledger.summary(api_ledger.day_key(day)))}
+
+# ==================== CHAOS MODE ====================
+
+# Fault injection for tuning retry, breaker and fast_mode settings without the
+# real API. With SCRAPECREATORS_CHAOS pointing at a scenario file, every upstream
+# attempt first draws scripted latency and faults client-side, and each
+# make_reliable_request outcome is recorded (see get_chaos_report). Never set
+# this in production.
+CHAOS_SCENARIO = os.getenv("SCRAPECREATORS_CHAOS", "")  # Scenario JSON path; empty = off
+CHAOS_SEED = os.getenv("SCRAPECREATORS_CHAOS_SEED")  # Seed for reproducible fault sequences
+CHAOS_HANG_SECONDS = 120  # How long a scripted timeout hangs when the attempt has no timeout
+
+# Truncated posts payload returned by "malformed" faults
+CHAOS_MALFORMED_BODY = b'{"success": true, "items": [{"caption": {"text": "trunc'
+
+def sample_latency(spec: Optional[Dict]) -> float:
+    """Draw one response delay in seconds from a latency spec."""
+    if not spec:
+        return 0.0
+    if 'fixed' in spec:
+        return float(spec['fixed'])
+    if 'uniform' in spec:
+        low, high = spec['uniform']
+        return random.uniform(low, high)
+    if 'lognormal' in spec:
+        median = spec['lognormal']['median']
+        p95 = spec['lognormal'].get('p95', median * 2)
+        sigma = math.log(p95 / median) / 1.645 if p95 > median else 0.0
+        return random.lognormvariate(math.log(median), sigma)
+    raise ValueError(f"Unknown latency spec: {spec}")
+
+def fault_kind(fault: Dict) -> str:
+    """Short name of a scripted fault for reports: 'timeout', 'reset', 'malformed' or the HTTP status."""
+    for kind in ('timeout', 'reset', 'malformed'):
+        if fault.get(kind):
+            return kind
+    return str(fault.get('status', 500))
+
+class Scenario:
+    """Scripted latency and faults, resolved per endpoint and handle.
+    
+    Shared by chaos mode and scrapecreators_standin.py:
+        {
+          "default":   {"latency": {"lognormal": {"median": 0.8, "p95": 3.0}},
+                        "faults": [{"status": 429, "burst": {"every": 60, "duration": 5}, "retry_after": 5}]},
+          "endpoints": {"instagram_*": {"faults": [{"reset": true, "rate": 0.02}]}},
+          "handles":   {"deleted_creator": {"faults": [{"status": 404}]},
+                        "slow_*": {"faults": [{"timeout": true, "first": 2}]}}
+        }
+    
+    Endpoint and handle keys may be glob patterns; exact names win, then the
+    first matching pattern. Handle rules override endpoint rules override the
+    default, and faults from all three are checked handle first. Latency is
+    {"fixed": s}, {"uniform": [low, high]} or {"lognormal": {"median": s, "p95": s}}.
+    A fault is {"status": code, "retry_after": s}, {"timeout": true},
+    {"reset": true} (connection reset) or {"malformed": true} (truncated 200
+    body), and fires when all of its selectors match: "rate" (probability,
+    default 1), "first" (the first N calls for that handle and endpoint),
+    "calls" (list of 1-based call numbers) and "burst" (the first `duration`
+    seconds of every `every` seconds since startup).
+    """
+    
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
+        self.default = config.get('default', {})
+        self.endpoints = config.get('endpoints', {})
+        self.handles = {normalize_handle(handle): rules for handle, rules in config.get('handles', {}).items()}
+        self.started_at = time.time()
+    
+    @classmethod
+    def load(cls, path: Optional[str]) -> 'Scenario':
+        if not path:
+            return cls()
+        with open(path) as f:
+            return cls(json.load(f))
+    
+    @staticmethod
+    def _lookup(table: Dict[str, Dict], name: str) -> Dict:
+        if name in table:
+            return table[name]
+        for pattern, rules in table.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                return rules
+        return {}
+    
+    def _rules(self, endpoint: str, handle: str) -> List[Dict]:
+        """Rule sets from most to least specific."""
+        return [self._lookup(self.handles, handle), self._lookup(self.endpoints, endpoint), self.default]
+    
+    def latency(self, endpoint: str, handle: str) -> float:
+        for rules in self._rules(endpoint, handle):
+            if 'latency' in rules:
+                return sample_latency(rules['latency'])
+        return 0.0
+    
+    def _matches(self, fault: Dict, call_number: int) -> bool:
+        if 'first' in fault and call_number > fault['first']:
+            return False
+        if 'calls' in fault and call_number not in fault['calls']:
+            return False
+        if 'burst' in fault:
+            elapsed = time.time() - self.started_at
+            if elapsed % fault['burst']['every'] >= fault['burst']['duration']:
+                return False
+        return random.random() < fault.get('rate', 1.0)
+    
+    def fault(self, endpoint: str, handle: str, call_number: int) -> Optional[Dict]:
+        """First fault that fires for this call, if any."""
+        for rules in self._rules(endpoint, handle):
+            for fault in rules.get('faults', []):
+                if self._matches(fault, call_number):
+                    return fault
+        return None
+
+class ChaosMonkey:
+    """Injects a Scenario in front of upstream attempts and records how requests fared.
+    
+    `inject` runs before each attempt (including hedges): it sleeps the
+    scripted latency, then either returns a scripted (status, retry_after,
+    body) response, raises asyncio.TimeoutError / a connection reset, or
+    returns None to let the real request through. A scripted delay that
+    outlives the attempt's timeout becomes a timeout. Runs on the client loop.
+    """
+    
+    def __init__(self, scenario: Scenario, source: str = ''):
+        self.scenario = scenario
+        self.source = source
+        self.reset()
+    
+    def reset(self):
+        self.started_at = time.time()
+        self.scenario.started_at = self.started_at
+        self.call_numbers = Counter()  # (endpoint, handle) -> attempts so far
+        self.attempts = Counter()  # endpoint -> upstream attempts
+        self.injected = Counter()  # (endpoint, fault kind) -> faults injected
+        self.outcomes = Counter()  # (endpoint, outcome) -> make_reliable_request results
+        self.seconds = Counter()  # endpoint -> time spent in make_reliable_request
+    
+    async def inject(self, url: str, timeout_total: Optional[float]) -> Optional[Tuple[int, Optional[str], bytes]]:
+        endpoint = endpoint_for_url(url) or 'other'
+        handle = handle_for_url(url) or ''
+        self.call_numbers[(endpoint, handle)] += 1
+        self.attempts[endpoint] += 1
+        
+        delay = self.scenario.latency(endpoint, handle)
+        fault = self.scenario.fault(endpoint, handle, self.call_numbers[(endpoint, handle)])
+        if fault and fault.get('timeout'):
+            delay = timeout_total or CHAOS_HANG_SECONDS
+        if timeout_total and delay >= timeout_total:
+            await asyncio.sleep(timeout_total)
+            self.injected[(endpoint, 'timeout' if fault else 'slow_timeout')] += 1
+            raise asyncio.TimeoutError()
+        if delay:
+            await asyncio.sleep(delay)
+        if not fault:
+            return None
+        
+        kind = fault_kind(fault)
+        self.injected[(endpoint, kind)] += 1
+        if kind == 'reset':
+            raise aiohttp.ClientOSError(errno.ECONNRESET, "Connection reset by peer (chaos)")
+        if kind == 'malformed':
+            return 200, None, CHAOS_MALFORMED_BODY
+        retry_after = str(fault['retry_after']) if 'retry_after' in fault else None
+        body = json.dumps({'success': False, 'message': f'Chaos {kind}'}).encode()
+        return fault.get('status', 500), retry_after, body
+    
+    async def observe(self, endpoint: Optional[str], request) -> Dict:
+        """Await one make_reliable_request coroutine and record its outcome and duration."""
+        start = time.time()
+        result = await request
+        if result.get('cached'):
+            outcome = 'cached'
+        elif result.get('coalesced'):
+            outcome = 'coalesced'
+        elif result.get('success'):
+            outcome = 'success'
+        else:
+            outcome = result.get('error_type') or 'unknown_error'
+        self.outcomes[(endpoint or 'other', outcome)] += 1
+        self.seconds[endpoint or 'other'] += time.time() - start
+        return result
+    
+    def report(self) -> Dict:
+        elapsed = time.time() - self.started_at
+        endpoints = sorted({endpoint for endpoint, _ in self.outcomes} | set(self.attempts))
+        by_endpoint = {}
+        for endpoint in endpoints:
+            requests = sum(n for (name, _), n in self.outcomes.items() if name == endpoint)
+            by_endpoint[endpoint] = {
+                'requests': requests,
+                'attempts': self.attempts[endpoint],
+                'attempts_per_request': round(self.attempts[endpoint] / requests, 2) if requests else None,
+                'avg_seconds': round(self.seconds[endpoint] / requests, 2) if requests else None,
+                'injected': {kind: n for (name, kind), n in self.injected.items() if name == endpoint},
+                'outcomes': {outcome: n for (name, outcome), n in self.outcomes.items() if name == endpoint},
+            }
+        requests = sum(self.outcomes.values())
+        return {
+            'scenario': self.source,
+            'elapsed_seconds': round(elapsed, 1),
+            'requests': requests,
+            'requests_per_second': round(requests / elapsed, 2) if elapsed else 0,
+            'success_rate': round(sum(n for (_, outcome), n in self.outcomes.items()
+                                      if outcome in ('success', 'cached', 'coalesced')) / requests, 3)
+                            if requests else None,
+            'by_endpoint': by_endpoint,
+        }
+
+def load_chaos_monkey() -> Optional[ChaosMonkey]:
+    """ChaosMonkey for SCRAPECREATORS_CHAOS, or None when chaos mode is off."""
+    if not CHAOS_SCENARIO:
+        return None
+    if CHAOS_SEED:
+        random.seed(int(CHAOS_SEED))
+    print(f"🐒 CHAOS MODE: injecting faults from {CHAOS_SCENARIO} into ScrapeCreators calls")
+    return ChaosMonkey(Scenario.load(CHAOS_SCENARIO), CHAOS_SCENARIO)
 
 class APIReliabilityManager:
     """Manages reliable API calls with retry logic and error handling."""
@@ -41,73 +1391,70 @@ class APIReliabilityManager:
             self.circuit_breaker_threshold = 5
             self.circuit_breaker_reset_time = 30
         
-        # Rate Limit Management  
-        self.RATE_LIMIT_DELAY = 90 if fast_mode else 120  # Shorter rate limit wait
-        self.last_rate_limit = {}  # Track rate limits per endpoint
+        # Rate Limit Management (cluster-wide token bucket per endpoint)
+        self.RATE_LIMIT_BACKOFF = 10 if fast_mode else 20  # Pause after a 429 without Retry-After
+        self.rate_limiter = TokenBucketLimiter(load_rate_limits())
         
-        # Smart Circuit Breaker (responsive protection without slowdown)
-        self.failure_count = {}
-        self.half_open_attempts = {}  # Track "testing" requests
+        # Cluster-wide cap on retries relative to first attempts
+        self.retry_budget = RetryBudget()
         
-    def is_circuit_open(self, endpoint_base: str) -> bool:
-        """Check if circuit breaker is open for this endpoint with half-open state."""
-        if endpoint_base not in self.failure_count:
-            return False
-            
-        failures = self.failure_count[endpoint_base]
-        time_since_failure = time.time() - failures['last_failure']
+        # Connection slots handed out by priority lane (interactive before bulk jobs)
+        self.priority_gate = PriorityGate()
         
-        # If under threshold, circuit is closed (normal operation)
-        if failures['count'] < self.circuit_breaker_threshold:
-            return False
-            
-        # If enough time passed, enter "half-open" state (test with 1 request)
-        if time_since_failure > self.circuit_breaker_reset_time:
-            # Check if we're already testing
-            if endpoint_base not in self.half_open_attempts:
-                self.half_open_attempts[endpoint_base] = time.time()
-                print(f"🔄 Circuit breaker HALF-OPEN for {endpoint_base} - testing...")
-                return False  # Allow one test request
-            
-            # If test request was recent (within 10s), still wait
-            if time.time() - self.half_open_attempts[endpoint_base] < 10:
-                return True
-            
-            # Allow another test request
-            self.half_open_attempts[endpoint_base] = time.time()
-            print(f"🔄 Circuit breaker retry test for {endpoint_base}")
-            return False
-            
-        # Circuit is fully open - block requests
-        remaining_time = self.circuit_breaker_reset_time - time_since_failure
-        print(f"🔴 Circuit breaker OPEN for {endpoint_base} - {remaining_time:.0f}s remaining")
-        return True
+        # Raw response cache (zero API credits for recently fetched handles)
+        self.response_cache = ResponseCache()
+        
+        # Duplicate in-flight fetches share one upstream call; a leader that holds
+        # the lock longer than a full retry cycle is assumed dead
+        self.single_flight = SingleFlight()
+        self.single_flight_ttl = self.MAX_RETRIES * self.REQUEST_TIMEOUT + self.MAX_DELAY
+        
+        # Hedged requests (opt-in): a second copy after the endpoint's p95 latency,
+        # limited to HEDGE_BUDGET of all calls sent by this process
+        self.hedging = HEDGING_ENABLED
+        self.latency_tracker = LatencyTracker()
+        self.timeout_max = float(TIMEOUT_MAX) if TIMEOUT_MAX else float(self.REQUEST_TIMEOUT)
+        self.calls_sent = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        
+        # Fault injection for reliability tuning (off unless SCRAPECREATORS_CHAOS is set)
+        self.chaos = load_chaos_monkey()
+        
+        # Smart Circuit Breaker (cluster-wide, one half-open probe per endpoint)
+        self.circuit_breaker = CircuitBreaker(
+            self.circuit_breaker_threshold,
+            self.circuit_breaker_reset_time,
+            probe_timeout=self.REQUEST_TIMEOUT + 5  # A probe that hasn't answered by then is lost
+        )
+        
+    async def is_circuit_open(self, endpoint_base: str) -> Tuple[bool, float]:
+        """Check the circuit for this endpoint. Returns (open, seconds until it may admit a request)."""
+        allowed, state, retry_after = await self.circuit_breaker.allow(endpoint_base)
+        if allowed:
+            if state == 'probe':
+                print(f"🔄 Circuit breaker HALF-OPEN for {endpoint_base} - sending the test request")
+            return False, 0
+        if state == 'half_open':
+            print(f"🔄 Circuit breaker HALF-OPEN for {endpoint_base} - test request in flight")
+        else:
+            print(f"🔴 Circuit breaker OPEN for {endpoint_base} - {retry_after:.0f}s remaining")
+        return True, retry_after
     
-    def record_failure(self, endpoint_base: str, error_type: str = None):
+    async def record_failure(self, endpoint_base: str, error_type: str = None):
         """Record a failure for circuit breaker (only severe errors trigger circuit breaker)."""
         # Only trigger circuit breaker for severe server errors, not timeouts or rate limits
         severe_errors = ['server_error', 'max_retries_exceeded', 'connection_error']
         if error_type not in severe_errors:
             return  # Don't trigger circuit breaker for minor issues
-            
-        if endpoint_base not in self.failure_count:
-            self.failure_count[endpoint_base] = {'count': 0, 'last_failure': 0}
         
-        self.failure_count[endpoint_base]['count'] += 1
-        self.failure_count[endpoint_base]['last_failure'] = time.time()
-        
-        if self.failure_count[endpoint_base]['count'] >= self.circuit_breaker_threshold:
-            print(f"🔴 Circuit breaker OPEN for {endpoint_base} - {self.circuit_breaker_threshold} severe failures")
+        state = await self.circuit_breaker.record_failure(endpoint_base)
+        if state == 'open':
+            print(f"🔴 Circuit breaker OPEN for {endpoint_base} after {error_type}")
     
-    def record_success(self, endpoint_base: str):
-        """Record a success to reset failure count and half-open state."""
-        if endpoint_base in self.failure_count:
-            # Gradual recovery: reduce failure count by 2 on success
-            self.failure_count[endpoint_base]['count'] = max(0, self.failure_count[endpoint_base]['count'] - 2)
-            
-        # Reset half-open state on success
-        if endpoint_base in self.half_open_attempts:
-            del self.half_open_attempts[endpoint_base]
+    async def record_success(self, endpoint_base: str):
+        """Record a success (gradual recovery; closes a half-open circuit)."""
+        if await self.circuit_breaker.record_success(endpoint_base) == 'recovered':
             print(f"✅ Circuit breaker CLOSED for {endpoint_base} - API recovered")
     
     def calculate_delay(self, attempt: int, base_delay: float = None) -> float:
@@ -150,22 +1497,92 @@ class APIReliabilityManager:
         # Retry on other errors
         return True, f"Unexpected error {status_code} - retrying"
     
-    def make_reliable_request(self, url: str, username: str, request_type: str = "profile") -> Dict:
+    async def make_reliable_request(self, url: str, username: str, request_type: str = "profile",
+                                    endpoint: Optional[str] = None) -> Dict:
         """
         Make a reliable API request with comprehensive error handling.
         
+        The request runs on the shared client loop, so it can be awaited from
+        any event loop without opening a new connection.
+        
         Args:
             url: API endpoint URL
             username: Creator username (for logging)
             request_type: Type of request (profile/posts) for logging
+            endpoint: Endpoint name from ENDPOINTS (derived from the URL if omitted)
         
         Returns:
             Dict with 'success', 'data', 'error_type', and 'error_message' keys
         """
-        endpoint_base = url.split('?')[0]  # Base URL without parameters
+        endpoint = endpoint or endpoint_for_url(url)
+        context = api_call_context.get()
+        if self.is_cancelled(context):
+            return self.cancelled_result(username)
+        request = self._make_reliable_request(url, username, request_type, endpoint, context)
+        if self.chaos is not None:
+            request = self.chaos.observe(endpoint, request)
+        return await client_loop.run(request)
+    
+    def notify_observers(self, context: Dict, endpoint: Optional[str], status, latency: Optional[float],
+                         handle: Optional[str] = None, attempt: Optional[int] = None):
+        """Report one upstream attempt to the API ledger and the observers registered in the call context."""
+        api_ledger.record(context.get('job_id'), endpoint, handle, attempt, status, latency,
+                          requeued=context.get('requeued', False))
+        for observer in context.get('observers', ()):
+            try:
+                observer(endpoint, status, latency)
+            except Exception as e:
+                print(f"⚠️ API observer failed: {e}")
+    
+    async def _make_reliable_request(self, url: str, username: str, request_type: str,
+                                     endpoint: Optional[str], context: Dict) -> Dict:
+        """Cache lookup and single-flight for make_reliable_request. Runs on the client loop."""
+        handle = handle_for_url(url) if endpoint else None
+        cache_handle = handle if self.response_cache.enabled else None
+        
+        # Serve recently fetched responses from the cache
+        if cache_handle and not context.get('force_refresh', False):
+            cached_body = await self.response_cache.get(endpoint, cache_handle)
+            if cached_body is not None:
+                try:
+                    data = parse_response(endpoint, cached_body)
+                    print(f"💾 Cached {request_type} data for @{username}")
+                    api_ledger.record(context.get('job_id'), endpoint, cache_handle, None, 'cache_hit', None)
+                    return {
+                        'success': True,
+                        'data': data,
+                        'error_type': None,
+                        'error_message': None,
+                        'cached': True
+                    }
+                except json.JSONDecodeError:
+                    pass  # Corrupt entry - fetch fresh and overwrite it
+        
+        async def fetch():
+            return await self._fetch_with_retries(url, username, request_type, endpoint, context, handle, cache_handle)
+        
+        # Concurrent callers for the same handle (in this process or any worker) share one fetch
+        if handle:
+            result = await self.single_flight.do(single_flight_key(endpoint, handle, context), fetch,
+                                                 self.single_flight_ttl)
+            if result.get('coalesced'):
+                api_ledger.record(context.get('job_id'), endpoint, handle, None, 'coalesced', None)
+            return result
+        return await fetch()
+    
+    async def _fetch_with_retries(self, url: str, username: str, request_type: str, endpoint: Optional[str],
+                                  context: Dict, handle: Optional[str], cache_handle: Optional[str]) -> Dict:
+        """Retry loop for one upstream fetch. Runs on the client loop."""
+        endpoint_base = endpoint or url.split('?')[0]  # Circuit key: endpoint name, else base URL
+        
+        defer_retries = context.get('defer_retries', False)
+        priority = priority_lane(context.get('priority'))
         
         # Check circuit breaker
-        if self.is_circuit_open(endpoint_base):
+        circuit_open, circuit_retry_after = await self.is_circuit_open(endpoint_base)
+        if circuit_open:
+            if defer_retries:
+                return self.deferred_result("Circuit breaker open", max(circuit_retry_after, 1))
             return {
                 'success': False,
                 'data': None,
@@ -173,37 +1590,52 @@ class APIReliabilityManager:
                 'error_message': f"Circuit breaker open for {endpoint_base} - too many recent failures"
             }
         
-        # Check if we're still in rate limit cooldown
-        if endpoint_base in self.last_rate_limit:
-            time_since_rate_limit = time.time() - self.last_rate_limit[endpoint_base]
-            if time_since_rate_limit < self.RATE_LIMIT_DELAY:
-                remaining_wait = self.RATE_LIMIT_DELAY - time_since_rate_limit
-                print(f"⏳ Still in rate limit cooldown for {remaining_wait:.0f}s...")
-                time.sleep(remaining_wait)
-        
         print(f"📡 Fetching {request_type} data for @{username}...")
         
+        session = client_loop.get_session()
         last_error = None
         for attempt in range(self.MAX_RETRIES):
+            if self.is_cancelled(context):
+                return self.cancelled_result(username)
             try:
+                # Retries, including a requeued creator's calls, spend the shared retry budget
+                if attempt > 0 or context.get('requeued', False):
+                    if not await self.retry_budget.try_retry():
+                        return self.retry_budget_result(username, last_error, defer_retries)
+                else:
+                    await self.retry_budget.record_attempt()
+                
                 # Wait between attempts (except first)
                 if attempt > 0:
                     delay = self.calculate_delay(attempt - 1)
                     print(f"   🔄 Retry {attempt + 1}/{self.MAX_RETRIES} for @{username} after {delay:.1f}s...")
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                 
-                # Make the request
-                start_time = time.time()
-                response = requests.get(url, headers=self.headers, timeout=self.REQUEST_TIMEOUT)
+                # Hold a connection slot for our lane, then take a token from the shared bucket
+                async with self.priority_gate.slot(priority):
+                    rate_wait = await self.rate_limiter.acquire(endpoint, priority)
+                    if rate_wait >= 1:
+                        print(f"⏳ Rate limiter held @{username} for {rate_wait:.1f}s")
+                    
+                    # Make the request over the pooled keep-alive session
+                    timeout_seconds = self.request_timeout(endpoint)
+                    timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+                    start_time = time.time()
+                    status_code, retry_after, body = await self._send(session, url, timeout, endpoint,
+                                                                      context, handle, attempt)
                 request_time = time.time() - start_time
+                self.notify_observers(context, endpoint, status_code, request_time, handle, attempt)
                 
                 # Handle successful response
-                if response.status_code == 200:
-                    self.record_success(endpoint_base)
+                if status_code == 200:
+                    self.latency_tracker.observe(endpoint, request_time)
+                    await self.record_success(endpoint_base)
                     print(f"✅ API call successful for @{username} ({request_time:.2f}s)")
                     
                     try:
-                        data = response.json()
+                        data = parse_response(endpoint, body)
+                        if cache_handle:
+                            await self.response_cache.set(endpoint, cache_handle, body)
                         return {
                             'success': True,
                             'data': data,
@@ -219,51 +1651,72 @@ class APIReliabilityManager:
                         }
                 
                 # Handle rate limiting
-                elif response.status_code == 429:
-                    self.last_rate_limit[endpoint_base] = time.time()
-                    print(f"⏳ Rate limited for @{username} - waiting {self.RATE_LIMIT_DELAY}s...")
-                    time.sleep(self.RATE_LIMIT_DELAY)
-                    continue  # Don't count this as a retry attempt
+                elif status_code == 429:
+                    backoff = self.RATE_LIMIT_BACKOFF
+                    if retry_after and retry_after.isdigit():
+                        backoff = int(retry_after)
+                    print(f"⏳ Rate limited for @{username} - pausing {endpoint or endpoint_base} for {backoff}s...")
+                    # Drain the shared bucket so every worker backs off, then retry through it
+                    await self.rate_limiter.penalize(endpoint, backoff)
+                    if defer_retries:
+                        return self.deferred_result("Rate limited", backoff)
+                    last_error = "HTTP 429"
+                    continue
                 
                 # Handle other errors
-                should_retry, reason = self.should_retry(response.status_code, attempt)
-                print(f"❌ Request failed for @{username}: {response.status_code} - {reason}")
+                should_retry, reason = self.should_retry(status_code, attempt)
+                print(f"❌ Request failed for @{username}: {status_code} - {reason}")
                 
                 if not should_retry:
-                    error_type = self.categorize_error(response.status_code)
+                    error_type = self.categorize_error(status_code)
                     return {
                         'success': False,
                         'data': None,
                         'error_type': error_type,
-                        'error_message': f"API error {response.status_code}: {response.text[:200]}"
+                        'error_message': f"API error {status_code}: {body[:200].decode('utf-8', errors='replace')}"
                     }
                 
-                last_error = f"HTTP {response.status_code}"
+                last_error = f"HTTP {status_code}"
+                if defer_retries:
+                    await self.record_failure(endpoint_base, self.categorize_error(status_code))
+                    return self.deferred_result(last_error, self.calculate_delay(0))
                 
-            except requests.exceptions.Timeout:
-                print(f"⏰ Request timeout for @{username} (attempt {attempt + 1})")
+            except asyncio.TimeoutError:
+                waited = time.time() - start_time
+                self.latency_tracker.observe(endpoint, waited)
+                self.notify_observers(context, endpoint, 'timeout', waited, handle, attempt)
+                print(f"⏰ Request timeout for @{username} after {timeout_seconds:.0f}s (attempt {attempt + 1})")
                 last_error = "Request timeout"
+                if defer_retries:
+                    return self.deferred_result(last_error, self.calculate_delay(0))
                 if attempt == self.MAX_RETRIES - 1:
                     break
                 continue
                 
-            except requests.exceptions.ConnectionError as e:
+            except aiohttp.ClientConnectionError as e:
+                self.notify_observers(context, endpoint, 'connection_error', None, handle, attempt)
                 print(f"🌐 Connection error for @{username} (attempt {attempt + 1}): {e}")
                 last_error = f"Connection error: {e}"
+                if defer_retries:
+                    await self.record_failure(endpoint_base, 'connection_error')
+                    return self.deferred_result(last_error, self.calculate_delay(0))
                 if attempt == self.MAX_RETRIES - 1:
                     break
                 continue
                 
-            except requests.exceptions.RequestException as e:
+            except aiohttp.ClientError as e:
+                self.notify_observers(context, endpoint, 'request_error', None, handle, attempt)
                 print(f"❌ Request exception for @{username} (attempt {attempt + 1}): {e}")
                 last_error = f"Request exception: {e}"
+                if defer_retries:
+                    return self.deferred_result(last_error, self.calculate_delay(0))
                 if attempt == self.MAX_RETRIES - 1:
                     break
                 continue
         
         # All retries failed - this is a severe error worthy of circuit breaker
         error_type = 'max_retries_exceeded'
-        self.record_failure(endpoint_base, error_type)
+        await self.record_failure(endpoint_base, error_type)
         return {
             'success': False,
             'data': None,
@@ -271,6 +1724,120 @@ class APIReliabilityManager:
             'error_message': f"All {self.MAX_RETRIES} attempts failed. Last error: {last_error}"
         }
     
+    def request_timeout(self, endpoint: Optional[str]) -> float:
+        """Per-attempt timeout: p99 of recent latency plus margin, within [TIMEOUT_MIN, timeout_max]."""
+        p99 = self.latency_tracker.percentile(endpoint, TIMEOUT_PERCENTILE) if endpoint else None
+        if p99 is None:
+            return self.timeout_max  # Not enough samples yet
+        return min(self.timeout_max, max(TIMEOUT_MIN, p99 * TIMEOUT_MARGIN_FACTOR + TIMEOUT_MARGIN_SECONDS))
+    
+    def latency_report(self) -> Dict:
+        """Latency percentiles and current timeout per endpoint, for job results."""
+        report = self.latency_tracker.snapshot()
+        for endpoint, stats in report.items():
+            stats['timeout'] = round(self.request_timeout(endpoint), 1)
+        return report
+    
+    def hedge_delay(self, endpoint: Optional[str]) -> Optional[float]:
+        """Seconds to wait before hedging a request to this endpoint, or None to not hedge."""
+        if not self.hedging or endpoint is None:
+            return None
+        p95 = self.latency_tracker.percentile(endpoint, 0.95)
+        if p95 is None:
+            return None
+        if self.hedges_sent >= self.calls_sent * HEDGE_BUDGET:
+            return None
+        return max(HEDGE_MIN_DELAY, p95)
+    
+    async def _get(self, session: aiohttp.ClientSession, url: str,
+                   timeout: aiohttp.ClientTimeout) -> Tuple[int, Optional[str], bytes]:
+        if self.chaos is not None:
+            injected = await self.chaos.inject(url, timeout.total)
+            if injected is not None:
+                return injected
+        async with session.get(url, headers=self.headers, timeout=timeout) as response:
+            return response.status, response.headers.get('Retry-After'), await response.read()
+    
+    async def _send(self, session: aiohttp.ClientSession, url: str, timeout: aiohttp.ClientTimeout,
+                    endpoint: Optional[str], context: Dict, handle: Optional[str],
+                    attempt: int) -> Tuple[int, Optional[str], bytes]:
+        """Send one request; when hedging, race a second copy once the first outlives the p95."""
+        self.calls_sent += 1
+        delay = self.hedge_delay(endpoint)
+        if delay is None:
+            return await self._get(session, url, timeout)
+        
+        primary = asyncio.ensure_future(self._get(session, url, timeout))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or self.hedges_sent >= self.calls_sent * HEDGE_BUDGET:
+            return await primary
+        
+        # Wait for the hedge's token only while the primary is still outstanding
+        token = asyncio.ensure_future(self.rate_limiter.acquire(endpoint, priority_lane(context.get('priority'))))
+        await asyncio.wait({primary, token}, return_when=asyncio.FIRST_COMPLETED)
+        if primary.done():
+            token.cancel()
+            return await primary
+        self.hedges_sent += 1
+        print(f"🏁 Hedging {endpoint} request for @{handle} after {delay:.1f}s")
+        hedge = asyncio.ensure_future(self._get(session, url, timeout))
+        
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedges_won += 1
+                        return task.result()
+                if not pending:
+                    return done.pop().result()  # Both failed - raise the last error
+        finally:
+            for task in pending:
+                task.cancel()
+                # The losing copy was still billed
+                api_ledger.record(context.get('job_id'), endpoint, handle, attempt, 'hedge_cancelled', None,
+                                  requeued=context.get('requeued', False))
+    
+    def is_cancelled(self, context: Dict) -> bool:
+        cancelled = context.get('cancelled')
+        return cancelled is not None and cancelled.is_set()
+    
+    def cancelled_result(self, username: str) -> Dict:
+        """Result for a call whose caller gave up on it (see api_call_scope's 'cancelled')."""
+        print(f"🛑 Caller cancelled - not calling the API for @{username}")
+        return {
+            'success': False,
+            'data': None,
+            'error_type': 'cancelled',
+            'error_message': 'Cancelled by the caller'
+        }
+    
+    def deferred_result(self, reason: str, retry_after: float) -> Dict:
+        """Result for a retryable failure handed back to the caller's work queue."""
+        print(f"🔁 {reason} - deferring, retry after {retry_after:.0f}s")
+        return {
+            'success': False,
+            'data': None,
+            'error_type': 'retry_later',
+            'error_message': f"{reason} - retry after {retry_after:.0f}s",
+            'retry_after': retry_after
+        }
+    
+    def retry_budget_result(self, username: str, last_error: Optional[str], defer_retries: bool) -> Dict:
+        """Result for a retry the budget refused: deferred for jobs, a failure otherwise."""
+        reason = f"Retry budget exhausted (last error: {last_error or 'earlier attempt failed'})"
+        if defer_retries:
+            return self.deferred_result(reason, RETRY_BUDGET_WINDOW / 2)
+        print(f"💸 {reason} - not retrying @{username}")
+        return {
+            'success': False,
+            'data': None,
+            'error_type': 'retry_budget',
+            'error_message': reason
+        }
+    
     def categorize_error(self, status_code: int) -> str:
         """Categorize errors for better reporting."""
         if status_code == 404:
@@ -289,6 +1856,18 @@ class APIReliabilityManager:
 # Global instance
 api_manager = None
 
+def get_api_latency_report() -> Dict:
+    """Per-endpoint latency percentiles and adaptive timeouts seen by this process (empty before any call)."""
+    if api_manager is None:
+        return {}
+    return api_manager.latency_report()
+
+def get_chaos_report() -> Dict:
+    """How API calls reacted to injected faults in this process (empty unless chaos mode is on)."""
+    if api_manager is None or api_manager.chaos is None:
+        return {}
+    return api_manager.chaos.report()
+
 def get_api_manager(api_key: str, fast_mode: bool = True) -> APIReliabilityManager:
     """Get or create global API manager instance with fast mode enabled by default."""
     global api_manager
@@ -300,16 +1879,16 @@ def get_api_manager(api_key: str, fast_mode: bool = True) -> APIReliabilityManag
             print(f"   ⚡ Fast settings: {api_manager.MAX_RETRIES} retries, {api_manager.circuit_breaker_reset_time}s circuit breaker")
     return api_manager
 
-def make_instagram_api_call(username: str, api_key: str, call_type: str = "profile") -> Dict:
-    """Make reliable Instagram API call."""
+async def make_instagram_api_call(username: str, api_key: str, call_type: str = "profile") -> Dict:
+    """Make reliable Instagram API call (awaitable)."""
     manager = get_api_manager(api_key)
     
     if call_type == "profile":
-        url = f"https://api.scrapecreators.com/v1/instagram/profile?handle={username}"
-        return manager.make_reliable_request(url, username, "Instagram profile")
+        url = f"{SCRAPECREATORS_BASE_URL}{ENDPOINTS['instagram_profile']}?handle={username}"
+        return await manager.make_reliable_request(url, username, "Instagram profile", endpoint='instagram_profile')
     elif call_type == "posts":
-        url = f"https://api.scrapecreators.com/v2/instagram/user/posts?handle={username}"
-        return manager.make_reliable_request(url, username, "Instagram posts")
+        url = f"{SCRAPECREATORS_BASE_URL}{ENDPOINTS['instagram_posts']}?handle={username}"
+        return await manager.make_reliable_request(url, username, "Instagram posts", endpoint='instagram_posts')
     else:
         return {
             'success': False,
@@ -318,11 +1897,11 @@ def make_instagram_api_call(username: str, api_key: str, call_type: str = "profi
             'error_message': f"Unknown call type: {call_type}"
         }
 
-def make_tiktok_api_call(username: str, api_key: str) -> Dict:
-    """Make reliable TikTok API call."""
+async def make_tiktok_api_call(username: str, api_key: str) -> Dict:
+    """Make reliable TikTok API call (awaitable)."""
     manager = get_api_manager(api_key)
-    url = f"https://api.scrapecreators.com/v3/tiktok/profile/videos?handle={username}"
-    return manager.make_reliable_request(url, username, "TikTok profile+posts")
+    url = f"{SCRAPECREATORS_BASE_URL}{ENDPOINTS['tiktok_videos']}?handle={username}"
+    return await manager.make_reliable_request(url, username, "TikTok profile+posts", endpoint='tiktok_videos')
 
 # Error reporting utilities
 def format_error_summary(results: Dict) -> str:
@@ -335,7 +1914,9 @@ def format_error_summary(results: Dict) -> str:
         # Extract error type from error message
         if ' - ' in failed_item:
             error_part = failed_item.split(' - ', 1)[1]
-            if 'rate_limited' in error_part.lower():
+            if 'retry_budget' in error_part.lower() or 'retry budget' in error_part.lower():
+                error_type = 'Retry Budget'
+            elif 'rate_limited' in error_part.lower():
                 error_type = 'Rate Limited'
             elif 'timeout' in error_part.lower():
                 error_type = 'Timeout'
@@ -366,6 +1947,8 @@ def get_retry_recommendations(error_type: str) -> str:
         'profile_not_found': 'Creator may have deleted account - remove from database',
         'access_denied': 'Creator went private - retry later or remove',
         'circuit_breaker': 'Too many API failures - wait 5+ minutes before new jobs',
-        'max_retries_exceeded': 'Persistent API issues - check API status or wait longer'
+        'max_retries_exceeded': 'Persistent API issues - check API status or wait longer',
+        'retry_later': 'Still failing after the job requeued it - retry in a later job',
+        'retry_budget': 'API degraded and the shared retry budget ran out - retry once error rates drop'
     }
     return recommendations.get(error_type, 'Unknown error type - investigate manually')
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full json.loads vs field-selective parse_response
+============================================================
+
+Measures per-creator CPU time and peak memory for decoding ScrapeCreators
+posts/videos payloads, holding `--creators` parsed responses at once like a
+worker with that many creators in flight.
+
+Usage:
+    python benchmark_parsing.py                       # synthetic Instagram posts payload
+    python benchmark_parsing.py --endpoint tiktok_videos
+    python benchmark_parsing.py --fixture recorded_posts.json --endpoint instagram_posts
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from response_parsing import parse_response, orjson
+
+def synthetic_candidates(count: int) -> list:
+    return [
+        {"width": 1080 - i * 100, "height": 1350 - i * 120,
+         "url": f"https://scontent.cdninstagram.com/v/t51.{random.getrandbits(64)}_n.jpg?stp=dst-jpg&_nc_ht={i}"}
+        for i in range(count)
+    ]
+
+def synthetic_instagram_post(index: int) -> dict:
+    carousel = [
+        {
+            "id": f"{index}_{i}", "media_type": 1, "display_uri": None,
+            "image_versions2": {"candidates": synthetic_candidates(8)},
+            "original_width": 1080, "original_height": 1350, "accessibility_caption": "Photo by creator " * 4,
+        }
+        for i in range(random.randint(0, 8))
+    ]
+    return {
+        "id": str(random.getrandbits(60)), "pk": random.getrandbits(60), "code": f"C{index}xYz",
+        "taken_at": int(time.time()) - index * 86400, "media_type": 8 if carousel else 1,
+        "caption": {"text": "Markets update #crypto #trading @partner " * 10, "pk": random.getrandbits(60),
+                    "user": {"username": "creator", "full_name": "Creator", "profile_pic_url": "https://x" * 20}},
+        "like_count": random.randint(100, 10000), "comment_count": random.randint(5, 500), "play_count": None,
+        "like_and_view_counts_disabled": False, "is_paid_partnership": index % 5 == 0,
+        "carousel_media_count": len(carousel), "carousel_media": carousel,
+        "image_versions2": {"candidates": synthetic_candidates(8),
+                            "additional_candidates": {"igtv_first_frame": {"url": "https://x/first.jpg"}}},
+        "usertags": {"in": [{"user": {"username": f"brand{i}", "full_name": "Brand", "pk": i,
+                                      "profile_pic_url": "https://x" * 20}, "position": [0.5, 0.5]}
+                            for i in range(3)]},
+        "location": {"name": "Dubai", "id": 1, "slug": "dubai", "address": "", "city": "Dubai"},
+        "clips_metadata": {"audio_type": "original", "music_info": None, "original_sound_info": {"x": "y" * 200}},
+        "sharing_friction_info": {"should_have_sharing_friction": False}, "comments": [],
+    }
+
+def synthetic_tiktok_video(index: int) -> dict:
+    url_list = [f"https://p16-sign.tiktokcdn.com/{random.getrandbits(64)}.jpeg?x-expires={i}" for i in range(3)]
+    return {
+        "aweme_id": str(random.getrandbits(60)), "desc": "Trading tips #forex @broker " * 5,
+        "create_time": int(time.time()) - index * 86400, "region": "AE",
+        "author": {"unique_id": "creator", "nickname": "Creator", "signature": "Bio " * 20,
+                   "follower_count": 120000, "following_count": 100,
+                   "avatar_thumb": {"url_list": url_list}, "avatar_larger": {"url_list": url_list},
+                   "avatar_medium": {"url_list": url_list}, "share_info": {"x": "y" * 300}},
+        "statistics": {"digg_count": 1000, "comment_count": 50, "play_count": 20000, "share_count": 10},
+        "video": {"play_addr": {"url_list": url_list * 2}, "download_addr": {"url_list": url_list * 2},
+                  "ai_dynamic_cover": {"url_list": url_list}, "cover": {"url_list": url_list},
+                  "bit_rate": [{"play_addr": {"url_list": url_list * 2}} for _ in range(4)]},
+        "music": {"title": "original sound", "play_url": {"url_list": url_list}},
+        "commerce_info": {"bc_label_test_text": ""}, "text_extra": [{"hashtag_name": "forex"}] * 3,
+    }
+
+def synthetic_body(endpoint: str, posts: int) -> bytes:
+    if endpoint == 'tiktok_videos':
+        return json.dumps({"aweme_list": [synthetic_tiktok_video(i) for i in range(posts)], "has_more": 1}).encode()
+    return json.dumps({"items": [synthetic_instagram_post(i) for i in range(posts)], "more_available": True}).encode()
+
+def measure(name: str, parse, bodies: list) -> dict:
+    # CPU time per creator (best of 5 rounds to skip warm-up and GC noise)
+    rounds = []
+    for _ in range(5):
+        start = time.process_time()
+        for body in bodies:
+            parse(body)
+        rounds.append(time.process_time() - start)
+    cpu_ms = min(rounds) / len(bodies) * 1000
+
+    # Peak and retained memory with every creator's result held at once
+    tracemalloc.start()
+    held = [parse(body) for body in bodies]
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+
+    print(f"   {name:<28} {cpu_ms:8.2f} ms/creator   peak {peak / 1e6:8.1f} MB   retained {retained / 1e6:8.1f} MB")
+    return {'cpu_ms': cpu_ms, 'peak': peak, 'retained': retained}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--endpoint', default='instagram_posts', choices=['instagram_posts', 'tiktok_videos'])
+    parser.add_argument('--fixture', help='Recorded response body to use instead of a synthetic one')
+    parser.add_argument('--posts', type=int, default=33, help='Posts per synthetic payload')
+    parser.add_argument('--creators', type=int, default=50, help='Payloads parsed and held at once')
+    args = parser.parse_args()
+
+    random.seed(7)
+    if args.fixture:
+        with open(args.fixture, 'rb') as f:
+            bodies = [f.read()] * args.creators
+    else:
+        bodies = [synthetic_body(args.endpoint, args.posts) for _ in range(args.creators)]
+
+    print(f"📊 {args.endpoint}: {args.creators} payloads, {sum(map(len, bodies)) / len(bodies) / 1e3:.0f} KB each "
+          f"(orjson {'available' if orjson else 'not installed'})")
+    before = measure("json.loads (before)", json.loads, bodies)
+    after = measure("parse_response (after)", lambda body: parse_response(args.endpoint, body), bodies)
+    print(f"✅ CPU {before['cpu_ms'] / after['cpu_ms']:.1f}x faster, "
+          f"peak memory {before['peak'] / after['peak']:.1f}x lower, "
+          f"retained memory {before['retained'] / max(after['retained'], 1):.1f}x lower")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+-- BULK UPDATE CREATORS - used by the rescraper's write-behind buffer
+-- Updates a batch of existing creatordata rows in one statement and returns the ids it updated.
+-- Unlike an upsert it never inserts: a creator deleted while a rescrape job was running is
+-- simply missing from the result instead of coming back as a partial row.
+--
+-- updates:        JSON array of rows, each with "id" and the columns to write
+-- update_columns: the columns to write (every row in a batch carries the same ones)
+
+CREATE OR REPLACE FUNCTION bulk_update_creators(updates JSONB, update_columns TEXT[])
+RETURNS JSONB AS $$
+DECLARE
+    assignments TEXT;
+    updated_ids JSONB;
+BEGIN
+    SELECT string_agg(format('%I = r.%I', col, col), ', ')
+    INTO assignments
+    FROM unnest(update_columns) AS col;
+
+    EXECUTE format(
+        'WITH updated AS (
+            UPDATE creatordata c SET %s
+            FROM jsonb_populate_recordset(NULL::creatordata, $1) r
+            WHERE c.id = r.id
+            RETURNING c.id
+        )
+        SELECT COALESCE(jsonb_agg(id), ''[]''::jsonb) FROM updated',
+        assignments
+    ) INTO updated_ids USING updates;
+
+    RETURN updated_ids;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Verify: returns [] (no creator has id NULL)
+SELECT bulk_update_creators('[]'::jsonb, ARRAY['followers_count']);
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark: reliability settings under injected faults
+=====================================================
+
+Runs the same synthetic rescrape workload through APIReliabilityManager once
+per settings profile, with chaos mode injecting a scenario's latency and
+faults, and compares end-to-end throughput and outcomes. Successful calls are
+served by an in-process scrapecreators_standin server, so no credits are spent.
+
+Each profile gets a fresh manager with per-process limiter, breaker and
+retry-budget state (Redis and the response cache are not used) and the same
+random seed, so profiles see the same fault sequence.
+
+Usage:
+    python chaos_benchmark.py --scenario fixtures/scrapecreators/scenarios/degraded.json
+    python chaos_benchmark.py --scenario ... --profiles fast safe --creators 100 --concurrency 20
+    python chaos_benchmark.py --scenario ... --set MAX_RETRIES=2 --set circuit_breaker_threshold=8
+    python chaos_benchmark.py --scenario ... --retry-budget 50
+    python chaos_benchmark.py --scenario ... --defer          # job mode: failures requeue instead of sleeping
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+os.environ["SCRAPECREATORS_CACHE"] = "off"  # Every call must reach the (chaos-wrapped) upstream
+
+from aiohttp import web
+
+import api_reliability_fix
+from api_reliability_fix import (
+    APIReliabilityManager, ChaosMonkey, CircuitBreaker, ENDPOINTS, RetryBudget, Scenario, TokenBucketLimiter,
+    api_call_scope
+)
+from scrapecreators_standin import StandInServer
+
+# Per-process limiter/breaker state, so runs neither share nor pollute production Redis
+api_reliability_fix.aioredis = None
+
+PLATFORM_ENDPOINTS = {
+    'instagram': ['instagram_profile', 'instagram_posts'],
+    'tiktok': ['tiktok_videos'],
+}
+
+def parse_override(text: str):
+    name, _, value = text.partition('=')
+    if not name or not value:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    return name, json.loads(value)
+
+def build_manager(profile: str, overrides: list, rate: float, retry_budget: float) -> APIReliabilityManager:
+    manager = APIReliabilityManager("chaos-benchmark", fast_mode=(profile != 'safe'))
+    for name, value in overrides:
+        if not hasattr(manager, name):
+            raise SystemExit(f"❌ APIReliabilityManager has no setting {name!r}")
+        setattr(manager, name, value)
+    # Rebuild the pieces that copy settings at construction time
+    manager.circuit_breaker = CircuitBreaker(
+        manager.circuit_breaker_threshold,
+        manager.circuit_breaker_reset_time,
+        probe_timeout=manager.REQUEST_TIMEOUT + 5
+    )
+    if 'REQUEST_TIMEOUT' in dict(overrides):
+        manager.timeout_max = float(manager.REQUEST_TIMEOUT)
+    if rate:
+        manager.rate_limiter = TokenBucketLimiter({endpoint: (rate, rate * 2) for endpoint in ENDPOINTS})
+    if retry_budget is not None:
+        manager.retry_budget = RetryBudget(percent=retry_budget)
+    return manager
+
+async def run_profile(label: str, manager: APIReliabilityManager, base_url: str, args) -> dict:
+    """Scrape every synthetic creator once and return the chaos report."""
+    random.seed(args.seed)
+    manager.chaos = ChaosMonkey(Scenario.load(args.scenario), args.scenario)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    creators_ok = 0
+
+    async def scrape(handle: str):
+        nonlocal creators_ok
+        async with semaphore:
+            for endpoint in PLATFORM_ENDPOINTS[args.platform]:
+                url = f"{base_url}{ENDPOINTS[endpoint]}?handle={handle}"
+                result = await manager.make_reliable_request(url, handle, endpoint, endpoint=endpoint)
+                if not result['success']:
+                    return
+            creators_ok += 1
+
+    print(f"\n🐒 {label}: {manager.MAX_RETRIES} retries, base delay {manager.BASE_DELAY}s, "
+          f"breaker {manager.circuit_breaker_threshold} failures / {manager.circuit_breaker_reset_time}s")
+    start = time.time()
+    with api_call_scope(defer_retries=args.defer):
+        await asyncio.gather(*(scrape(f"chaos_{i:04d}") for i in range(args.creators)))
+    elapsed = time.time() - start
+
+    report = manager.chaos.report()
+    report.update({
+        'profile': label,
+        'creators_ok': creators_ok,
+        'creators_per_second': round(args.creators / elapsed, 2),
+        'job_seconds': round(elapsed, 1),
+    })
+    for endpoint, stats in report['by_endpoint'].items():
+        print(f"   {endpoint:<18} {stats['attempts_per_request'] or 0:4.2f} attempts/request  "
+              f"{stats['avg_seconds'] or 0:6.2f}s avg   injected {stats['injected']}   outcomes {stats['outcomes']}")
+    return report
+
+async def main_async(args):
+    server = StandInServer()
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+    print(f"🧪 Stand-in on {base_url}, scenario {args.scenario}, {args.creators} {args.platform} creators "
+          f"at concurrency {args.concurrency}{' (deferred retries)' if args.defer else ''}")
+
+    reports = []
+    try:
+        for profile in args.profiles:
+            manager = build_manager(profile, args.overrides if profile == 'custom' else [], args.rate,
+                                    args.retry_budget)
+            reports.append(await run_profile(profile, manager, base_url, args))
+    finally:
+        await runner.cleanup()
+
+    print(f"\n📊 {'profile':<8} {'creators/s':>10} {'job time':>9} {'ok':>9} {'calls/s':>8}")
+    for report in reports:
+        print(f"   {report['profile']:<8} {report['creators_per_second']:>10.2f} {report['job_seconds']:>8.1f}s "
+              f"{report['creators_ok']:>4}/{args.creators:<4} {report['requests_per_second']:>8.2f}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
+        print(f"💾 Reports written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenario', required=True, help='Chaos scenario JSON (same format as the stand-in)')
+    parser.add_argument('--profiles', nargs='+', default=['fast', 'safe'], choices=['fast', 'safe', 'custom'],
+                        help="Settings to compare; 'custom' is fast mode plus --set overrides")
+    parser.add_argument('--set', dest='overrides', action='append', type=parse_override, default=[],
+                        metavar='NAME=VALUE', help='Manager setting for the custom profile (JSON value)')
+    parser.add_argument('--platform', default='instagram', choices=sorted(PLATFORM_ENDPOINTS))
+    parser.add_argument('--creators', type=int, default=60)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--rate', type=float, default=0, help='Requests/second per endpoint (default: configured limits)')
+    parser.add_argument('--retry-budget', type=float, help='Retry budget percent (default: configured budget)')
+    parser.add_argument('--defer', action='store_true', help='Run calls with defer_retries like background jobs')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='Write the per-profile reports as JSON')
+    args = parser.parse_args()
+    if args.overrides and 'custom' not in args.profiles:
+        args.profiles.append('custom')
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
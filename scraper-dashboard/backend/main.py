@@ -22,6 +22,7 @@ import time
 import signal
 # Import simple scraper
 from simple_scraper import get_scraper
+from api_reliability_fix import api_call_scope, get_daily_api_usage
 
 # ==================== CONFIGURATION ====================
 
@@ -1951,6 +1952,24 @@ async def get_daily_rescraping_stats(current_user: str = Depends(verify_token)):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api-usage/daily")
+def get_daily_api_usage_stats(days: int = 7, current_user: str = Depends(verify_token)):
+    """ScrapeCreators calls per day (UTC) with retries, savings and cost per successful creator"""
+    # Plain def: the per-day ledger reads block, so FastAPI runs this in its threadpool
+    try:
+        days = max(1, min(days, 90))
+        today = datetime.utcnow()
+        daily_usage = [
+            get_daily_api_usage((today - timedelta(days=i)).strftime('%Y-%m-%d'))
+            for i in range(days)
+        ]
+        return {"daily_usage": daily_usage}
+        
+    except Exception as e:
+        print(f"Daily API usage error: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
 # ==================== STARTUP EVENT ====================
 
 @app.on_event("startup")
@@ -2621,8 +2640,10 @@ async def simple_process_csv_creators(file: UploadFile = File(...), current_user
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/simple/test-single-creator")
-async def simple_test_single_creator(handle: str, platform: str, current_user: str = Depends(verify_token)):
-    """Simple endpoint to test scraping a single creator"""
+def simple_test_single_creator(handle: str, platform: str, fresh: bool = False,
+                               current_user: str = Depends(verify_token)):
+    """Simple endpoint to test scraping a single creator (fresh=true bypasses the API response cache)"""
+    # Plain def: the scrape blocks, so FastAPI runs it in its threadpool instead of stalling other requests
     try:
         handle = handle.strip().lstrip('@')
         platform = platform.lower()
@@ -2635,10 +2656,11 @@ async def simple_test_single_creator(handle: str, platform: str, current_user: s
         scraper = get_scraper()
         
         # Scrape creator data
-        if platform == 'instagram':
-            creator_data = scraper.scrape_instagram_creator(handle)
-        else:
-            creator_data = scraper.scrape_tiktok_creator(handle)
+        with api_call_scope(force_refresh=fresh, priority='interactive'):
+            if platform == 'instagram':
+                creator_data = scraper.scrape_instagram_creator(handle)
+            else:
+                creator_data = scraper.scrape_tiktok_creator(handle)
         
         if not creator_data:
             return {"status": "failed", "error": "Failed to scrape creator data"}
@@ -0,0 +1,154 @@
+"""
+Stand-ins for Offline Tests
+===========================
+
+UnifiedRescaper imports Gemini, Supabase, pandas, tqdm and Pillow at module
+level. stub_scraper_imports() puts a MagicMock in sys.modules for each one
+that is not installed, so tests can import the rescraper without them; the
+tests never call into these libraries. FakeSupabase stands in for the
+creatordata table (the query builder calls and the bulk_update_creators RPC
+the rescraper makes), evaluated over a list of row dicts.
+"""
+
+import importlib
+import re
+import sys
+from unittest.mock import MagicMock
+
+SCRAPER_IMPORTS = ['google.generativeai', 'pandas', 'tqdm', 'PIL', 'pillow_heif', 'supabase']
+
+def stub_scraper_imports():
+    """Stub the rescraper's third-party imports that are missing here."""
+    for name in SCRAPER_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            parent = name.split('.')[0]
+            if parent != name:
+                try:
+                    importlib.import_module(parent)
+                except ImportError:
+                    sys.modules[parent] = MagicMock()
+            sys.modules[name] = MagicMock()
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+class FakeQuery:
+    """The slice of the PostgREST query builder the rescraper uses, evaluated over a list of rows."""
+
+    KEYSET = re.compile(r'updated_at\.gt\."([^"]+)",and\(updated_at\.eq\."([^"]+)",id\.gt\.(\d+)\)')
+    CUTOFF = re.compile(r'updated_at\.lte\."([^"]+)",updated_at\.is\.null')
+
+    def __init__(self, table, count=None):
+        self.table = table
+        self.count = count
+        self.filters = []
+        self.ordering = []
+        self.max_rows = None
+        self.write = None
+
+    def where(self, predicate):
+        self.filters.append(predicate)
+        return self
+
+    def in_(self, column, values):
+        return self.where(lambda row: row.get(column) in values)
+
+    def eq(self, column, value):
+        return self.where(lambda row: row.get(column) == value)
+
+    def gt(self, column, value):
+        return self.where(lambda row: row.get(column) is not None and row[column] > value)
+
+    def lte(self, column, value):
+        return self.where(lambda row: row.get(column) is not None and row[column] <= value)
+
+    def is_(self, column, value):
+        assert value == 'null'
+        return self.where(lambda row: row.get(column) is None)
+
+    def or_(self, expression):
+        if match := self.KEYSET.fullmatch(expression):
+            updated_at, _, last_id = match.groups()
+            return self.where(lambda row: row['updated_at'] is not None and (
+                row['updated_at'] > updated_at or (row['updated_at'] == updated_at and row['id'] > int(last_id))))
+        if match := self.CUTOFF.fullmatch(expression):
+            started = match.group(1)
+            return self.where(lambda row: row['updated_at'] is None or row['updated_at'] <= started)
+        raise AssertionError(f"unexpected or_ filter: {expression}")
+
+    def order(self, column):
+        self.ordering.append(column)
+        return self
+
+    def limit(self, rows):
+        self.max_rows = rows
+        return self
+
+    def update(self, values):
+        self.write = ('update', values)
+        return self
+
+    def execute(self):
+        self.table.requests.append(self)
+        if self.write:
+            return self.table.apply(self)
+        rows = [row for row in self.table.rows if all(predicate(row) for predicate in self.filters)]
+        rows.sort(key=lambda row: tuple(row[column] for column in self.ordering))
+        count = len(rows) if self.count else None
+        if self.max_rows is not None:
+            rows = rows[:self.max_rows]
+        return FakeResponse([dict(row) for row in rows], count)
+
+class FakeTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+        self.fail_bulk_updates = False
+
+    def select(self, columns, count=None):
+        return FakeQuery(self, count)
+
+    def update(self, values):
+        return FakeQuery(self).update(values)
+
+    def apply(self, query):
+        kind, payload = query.write
+        if kind == 'bulk_update':
+            if self.fail_bulk_updates:
+                raise RuntimeError("bulk update rejected")
+            rows, columns = payload['updates'], payload['update_columns']
+            updated = []
+            for update in rows:
+                stored = next((row for row in self.rows if row['id'] == update['id']), None)
+                if stored is not None:
+                    stored.update({column: update.get(column) for column in columns})
+                    updated.append(update['id'])
+            return FakeResponse(updated)
+        matched = [row for row in self.rows if all(predicate(row) for predicate in query.filters)]
+        for row in matched:
+            row.update(payload)
+        return FakeResponse([dict(row) for row in matched])
+
+    def by_id(self, creator_id):
+        return next(row for row in self.rows if row['id'] == creator_id)
+
+    def writes(self, kind):
+        return [query.write[1] for query in self.requests if query.write and query.write[0] == kind]
+
+class FakeSupabase:
+    def __init__(self, rows):
+        self.creatordata = FakeTable(rows)
+
+    def table(self, name):
+        assert name == "creatordata"
+        return self.creatordata
+
+    def rpc(self, name, params):
+        assert name == "bulk_update_creators"
+        query = FakeQuery(self.creatordata)
+        query.write = ('bulk_update', params)
+        return query
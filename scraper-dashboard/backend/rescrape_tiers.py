@@ -0,0 +1,111 @@
+"""
+Light / Full Rescrape Tiers
+===========================
+
+Most creators barely change between daily rescrapes, yet a full Instagram
+rescrape costs a profile call, a posts call and a media re-upload. This
+module decides per creator whether the next rescrape can be "light"
+(profile call only: followers_count, followers_change, updated_at) or must
+be "full":
+- Full every RESCRAPE_FULL_EVERY-th cycle (1 turns light rescrapes off)
+- Full when followers moved more than RESCRAPE_FULL_FOLLOWER_CHANGE percent
+  since the last full rescrape
+- Full when there is no tier state yet (first cycle, or Redis state expired)
+
+Tier state (light rescrapes since the last full one, when and at what
+follower count the last full one ran) lives in Redis with a per-process
+fallback, like tombstones.py.
+"""
+
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from api_reliability_fix import client_loop, get_async_redis, mark_async_redis_failed, normalize_handle
+
+RESCRAPE_FULL_EVERY = int(os.getenv("RESCRAPE_FULL_EVERY", "4"))  # Every Nth rescrape is full (1 = always full)
+RESCRAPE_FULL_FOLLOWER_CHANGE = float(os.getenv("RESCRAPE_FULL_FOLLOWER_CHANGE", "5"))  # % move that forces a full rescrape
+RESCRAPE_TIER_STATE_TTL = 30 * 86400  # Forget tier state for creators not rescraped in 30 days
+
+class RescrapeTierStore:
+    """Per-creator tier state in Redis hashes; local dict when Redis is down. Runs on the client loop."""
+
+    KEY_PREFIX = "rescrape:tier:"
+
+    def __init__(self, ttl: int = RESCRAPE_TIER_STATE_TTL):
+        self.ttl = ttl
+        self._local = {}  # key -> (expires_at, state)
+
+    def key(self, platform: str, handle: str) -> str:
+        return f"{self.KEY_PREFIX}{platform.lower()}:{normalize_handle(handle)}"
+
+    async def get(self, platform: str, handle: str) -> Dict:
+        key = self.key(platform, handle)
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                return await redis_client.hgetall(key)
+            except Exception as e:
+                mark_async_redis_failed(e)
+        expires_at, state = self._local.get(key, (0, {}))
+        return state if time.time() < expires_at else {}
+
+    async def record(self, platform: str, handle: str, tier: str, followers: int):
+        key = self.key(platform, handle)
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    if tier == 'full':
+                        pipe.hset(key, mapping={
+                            'light_since_full': 0,
+                            'full_at': datetime.utcnow().isoformat(),
+                            'followers_at_full': followers,
+                        })
+                    else:
+                        pipe.hincrby(key, 'light_since_full', 1)
+                    pipe.expire(key, self.ttl)
+                    await pipe.execute()
+                return
+            except Exception as e:
+                mark_async_redis_failed(e)
+
+        expires_at, state = self._local.get(key, (0, {}))
+        state = dict(state) if time.time() < expires_at else {}
+        if tier == 'full':
+            state = {'light_since_full': 0, 'full_at': datetime.utcnow().isoformat(), 'followers_at_full': followers}
+        else:
+            state['light_since_full'] = int(state.get('light_since_full', 0)) + 1
+        self._local[key] = (time.time() + self.ttl, state)
+
+rescrape_tiers = RescrapeTierStore()
+
+async def plan_rescrape(platform: str, handle: str, stored_followers: Optional[int] = None) -> Dict:
+    """
+    Pick the tier for a creator's next rescrape.
+
+    Returns {'tier': 'light' | 'full', 'followers_at_full': int | None}; the
+    follower baseline lets a light rescrape escalate once it sees the new count.
+    """
+    if RESCRAPE_FULL_EVERY <= 1:
+        return {'tier': 'full', 'followers_at_full': None}
+    state = await client_loop.run(rescrape_tiers.get(platform, handle))
+    if not state:
+        return {'tier': 'full', 'followers_at_full': None}
+    followers_at_full = int(float(state.get('followers_at_full') or stored_followers or 0)) or None
+    tier = 'full' if int(state.get('light_since_full', 0)) >= RESCRAPE_FULL_EVERY - 1 else 'light'
+    return {'tier': tier, 'followers_at_full': followers_at_full}
+
+def follower_move_needs_full(followers_at_full: Optional[int], followers: int) -> bool:
+    """True when followers moved more than RESCRAPE_FULL_FOLLOWER_CHANGE percent since the last full rescrape."""
+    if not followers_at_full:
+        return True
+    return abs(followers - followers_at_full) / followers_at_full * 100 > RESCRAPE_FULL_FOLLOWER_CHANGE
+
+async def record_rescrape(platform: str, handle: str, tier: str, followers: int):
+    """Update tier state after a successful rescrape (best effort)."""
+    try:
+        await client_loop.run(rescrape_tiers.record(platform, handle, tier, followers))
+    except Exception as e:
+        print(f"⚠️ Failed to record {tier} rescrape for @{handle}: {e}")
@@ -0,0 +1,120 @@
+"""
+Field-Selective Parsing of ScrapeCreators Responses
+===================================================
+
+Posts and videos payloads carry every image candidate, carousel item and video
+version for each post, but the scrapers read about a dozen fields from the
+first 12 posts. This module decodes a response once (orjson when installed)
+and keeps only:
+- The first POSTS_TO_PARSE items of the posts/videos list
+- The fields the scrapers read from each item (see the *_FIELDS specs)
+
+Top-level keys and profile responses are passed through unchanged, so the
+parsed result has the same shape the scrapers already expect - just smaller.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    orjson = None
+    loads = json.loads
+
+POSTS_TO_PARSE = 12  # Scrapers only look at posts_data[:12]
+
+KEEP = True
+
+class First:
+    """Spec for a list where only the first element is needed."""
+
+    def __init__(self, spec=KEEP):
+        self.spec = spec
+
+# Fields read from each Instagram post (UnifiedScraper, UnifiedRescaper, simple_scraper)
+INSTAGRAM_POST_FIELDS = {
+    'caption': {'text': KEEP},
+    'like_count': KEEP,
+    'comment_count': KEEP,
+    'play_count': KEEP,
+    'view_count': KEEP,
+    'like_and_view_counts_disabled': KEEP,
+    'is_paid_partnership': KEEP,
+    'media_type': KEEP,
+    'carousel_media_count': KEEP,
+    'taken_at': KEEP,
+    'taken_at_timestamp': KEEP,
+    'display_uri': KEEP,
+    'display_url': KEEP,
+    'location': KEEP,
+    'usertags': {'in': {'user': {'username': KEEP}}},
+    'image_versions2': {
+        'candidates': First({'url': KEEP}),
+        'additional_candidates': {'igtv_first_frame': {'url': KEEP}},
+    },
+    'video_versions': First({'url': KEEP}),
+    'carousel_media': First({
+        'media_type': KEEP,
+        'display_uri': KEEP,
+        'video_versions': First({'url': KEEP}),
+        'image_versions2': {'candidates': First({'url': KEEP})},
+    }),
+}
+
+# Fields read from each TikTok video (the first video's author doubles as the profile)
+TIKTOK_VIDEO_FIELDS = {
+    'desc': KEEP,
+    'create_time': KEEP,
+    'region': KEEP,
+    'statistics': KEEP,
+    'author': {
+        'unique_id': KEEP,
+        'nickname': KEEP,
+        'signature': KEEP,
+        'follower_count': KEEP,
+        'following_count': KEEP,
+        'avatar_thumb': {'url_list': First()},
+    },
+    'video': {
+        'play_addr': {'url_list': First()},
+        'ai_dynamic_cover': {'url_list': First()},
+    },
+    'commerce_info': {'bc_label_test_text': KEEP},
+}
+
+# Endpoint name -> (list key, per-item spec)
+LIST_PROJECTIONS = {
+    'instagram_posts': ('items', INSTAGRAM_POST_FIELDS),
+    'tiktok_videos': ('aweme_list', TIKTOK_VIDEO_FIELDS),
+}
+
+def project(value: Any, spec) -> Any:
+    """Copy only the parts of a decoded JSON value named by spec."""
+    if spec is KEEP:
+        return value
+    if isinstance(spec, First):
+        if isinstance(value, list):
+            return [project(value[0], spec.spec)] if value else []
+        return project(value, spec.spec)
+    if isinstance(value, list):
+        return [project(item, spec) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], field_spec) for key, field_spec in spec.items() if key in value}
+    return value
+
+def parse_response(endpoint: Optional[str], body: bytes) -> Dict:
+    """
+    Decode a ScrapeCreators response body, keeping only what the scrapers use.
+
+    Raises json.JSONDecodeError (orjson's error subclasses it) on invalid JSON.
+    """
+    data = loads(body)
+    projection = LIST_PROJECTIONS.get(endpoint)
+    if projection and isinstance(data, dict):
+        list_key, item_spec = projection
+        items = data.get(list_key)
+        if isinstance(items, list):
+            data[list_key] = [project(item, item_spec) for item in items[:POSTS_TO_PARSE]]
+    return data
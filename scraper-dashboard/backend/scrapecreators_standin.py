@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Local ScrapeCreators Stand-in Server
+====================================
+
+Serves the three ScrapeCreators endpoints the scrapers use from recorded
+fixtures, so rescrape throughput can be load-tested without spending credits:
+- Replays fixtures/scrapecreators/<endpoint>/<handle>.json, falling back to
+  the endpoint's _default.json ({{handle}} and {{base_url}} are filled in)
+- Scripted latency distributions, 429 bursts, 5xx, timeouts, connection
+  resets, malformed bodies and 404s from a scenario file, per endpoint and
+  per handle (or handle pattern)
+- Record mode: handles without a fixture are fetched from the real API once
+  and saved as fixtures
+- /_standin/stats for request counts and throughput, /_standin/reset to clear them
+
+Usage:
+    python scrapecreators_standin.py --port 8099 --scenario fixtures/scrapecreators/scenarios/flaky.json
+    SCRAPECREATORS_BASE_URL=http://127.0.0.1:8099 SCRAPECREATORS_CACHE=off python start.py
+
+    # Capture real responses (uses SCRAPECREATORS_API_KEY, costs one credit per new fixture)
+    python scrapecreators_standin.py --record
+
+Scenario file (every section optional; the format is shared with chaos mode,
+see api_reliability_fix.Scenario for the details):
+    {
+      "default":   {"latency": {"lognormal": {"median": 0.8, "p95": 3.0}},
+                    "faults": [{"status": 429, "burst": {"every": 60, "duration": 5}, "retry_after": 5}]},
+      "endpoints": {"instagram_posts": {"faults": [{"status": 503, "rate": 0.05}]}},
+      "handles":   {"deleted_creator": {"faults": [{"status": 404}]},
+                    "slow_*": {"faults": [{"timeout": true, "first": 2}]}}
+    }
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from typing import Optional
+
+import aiohttp
+from aiohttp import web
+
+from api_reliability_fix import CHAOS_MALFORMED_BODY, ENDPOINTS, Scenario, normalize_handle
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "scrapecreators")
+DEFAULT_PORT = int(os.getenv("SCRAPECREATORS_STANDIN_PORT", "8099"))
+UPSTREAM_BASE_URL = "https://api.scrapecreators.com"
+TIMEOUT_HANG_SECONDS = 120  # How long a scripted timeout holds the connection (beyond any client timeout)
+
+# 1x1 transparent PNG served for avatar and thumbnail URLs in the default fixtures
+PLACEHOLDER_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+class StandInServer:
+    """aiohttp application replaying (and optionally recording) ScrapeCreators responses."""
+
+    def __init__(self, fixtures_dir: str = DEFAULT_FIXTURES_DIR, scenario: Optional[Scenario] = None,
+                 record: bool = False, upstream: str = UPSTREAM_BASE_URL, api_key: Optional[str] = None):
+        self.fixtures_dir = fixtures_dir
+        self.scenario = scenario or Scenario()
+        self.record = record
+        self.upstream = upstream.rstrip('/')
+        self.api_key = api_key
+        self._fixtures = {}
+        self._upstream_session = None
+        self.reset()
+
+    def reset(self):
+        self.started_at = time.time()
+        self.call_numbers = Counter()  # (endpoint, handle) -> calls so far
+        self.requests = Counter()
+        self.statuses = Counter()
+        self.recorded = 0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        for endpoint, path in ENDPOINTS.items():
+            app.router.add_get(path, self._endpoint_handler(endpoint))
+        app.router.add_get('/_standin/stats', self.stats)
+        app.router.add_post('/_standin/reset', self.reset_handler)
+        app.router.add_get('/_standin/media/{name}', self.media)
+        app.on_cleanup.append(self._close_upstream)
+        return app
+
+    def _fixture_path(self, endpoint: str, name: str) -> str:
+        return os.path.join(self.fixtures_dir, endpoint, f"{name}.json")
+
+    def _read_fixture(self, path: str) -> Optional[bytes]:
+        if path not in self._fixtures:
+            if not os.path.exists(path):
+                return None
+            with open(path, 'rb') as f:
+                self._fixtures[path] = f.read()
+        return self._fixtures[path]
+
+    def _fixture(self, endpoint: str, handle: str, base_url: str) -> Optional[bytes]:
+        """Recorded body for a handle, or the endpoint's default filled in for it."""
+        body = self._read_fixture(self._fixture_path(endpoint, handle))
+        if body is not None:
+            return body
+        default = self._read_fixture(self._fixture_path(endpoint, '_default'))
+        if default is None:
+            return None
+        return default.replace(b'{{handle}}', handle.encode()).replace(b'{{base_url}}', base_url.encode())
+
+    async def _record_fixture(self, endpoint: str, handle: str, query: str) -> web.Response:
+        """Fetch from the real API and save successful responses as the handle's fixture."""
+        if self._upstream_session is None:
+            self._upstream_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60))
+        url = f"{self.upstream}{ENDPOINTS[endpoint]}?{query}"
+        async with self._upstream_session.get(url, headers={"x-api-key": self.api_key or ""}) as response:
+            body = await response.read()
+            status = response.status
+        if status == 200:
+            path = self._fixture_path(endpoint, handle)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+            self._fixtures[path] = body
+            self.recorded += 1
+            print(f"💾 Recorded {endpoint} fixture for @{handle} ({len(body) / 1024:.0f} KB)")
+        else:
+            print(f"⚠️ Upstream returned {status} for {endpoint} @{handle} - not recorded")
+        return web.Response(body=body, status=status, content_type='application/json')
+
+    async def _close_upstream(self, app):
+        if self._upstream_session is not None:
+            await self._upstream_session.close()
+
+    def _endpoint_handler(self, endpoint: str):
+        async def handler(request: web.Request) -> web.Response:
+            response = await self._respond(endpoint, request)
+            self.requests[endpoint] += 1
+            self.statuses[str(response.status)] += 1
+            return response
+        return handler
+
+    async def _respond(self, endpoint: str, request: web.Request) -> web.Response:
+        raw_handle = request.query.get('handle')
+        if not raw_handle:
+            return web.json_response({'success': False, 'message': 'handle is required'}, status=400)
+        handle = normalize_handle(raw_handle)
+        self.call_numbers[(endpoint, handle)] += 1
+        call_number = self.call_numbers[(endpoint, handle)]
+
+        delay = self.scenario.latency(endpoint, handle)
+        if delay:
+            await asyncio.sleep(delay)
+
+        fault = self.scenario.fault(endpoint, handle, call_number)
+        if fault:
+            if fault.get('timeout'):
+                await asyncio.sleep(fault.get('hang', TIMEOUT_HANG_SECONDS))
+                return web.json_response({'success': False, 'message': 'Scripted timeout'}, status=504)
+            if fault.get('reset'):
+                request.transport.abort()
+                return web.Response(status=500)
+            if fault.get('malformed'):
+                return web.Response(body=CHAOS_MALFORMED_BODY, content_type='application/json')
+            status = fault.get('status', 500)
+            headers = {'Retry-After': str(fault['retry_after'])} if 'retry_after' in fault else None
+            return web.json_response({'success': False, 'message': f'Scripted {status}'},
+                                     status=status, headers=headers)
+
+        if self.record and not os.path.exists(self._fixture_path(endpoint, handle)):
+            return await self._record_fixture(endpoint, handle, request.query_string)
+
+        body = self._fixture(endpoint, handle, f"{request.scheme}://{request.host}")
+        if body is None:
+            return web.json_response({'success': False, 'message': f'No fixture for @{handle}'}, status=404)
+        return web.Response(body=body, content_type='application/json')
+
+    async def stats(self, request: web.Request) -> web.Response:
+        elapsed = time.time() - self.started_at
+        total = sum(self.requests.values())
+        return web.json_response({
+            'elapsed_seconds': round(elapsed, 1),
+            'requests': total,
+            'requests_per_second': round(total / elapsed, 2) if elapsed else 0,
+            'by_endpoint': dict(self.requests),
+            'by_status': dict(self.statuses),
+            'unique_handles': len({handle for _, handle in self.call_numbers}),
+            'recorded': self.recorded,
+        })
+
+    async def reset_handler(self, request: web.Request) -> web.Response:
+        self.reset()
+        self.scenario.started_at = time.time()
+        return web.json_response({'reset': True})
+
+    async def media(self, request: web.Request) -> web.Response:
+        return web.Response(body=PLACEHOLDER_PNG, content_type='image/png')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='Fixture directory')
+    parser.add_argument('--scenario', help='Scenario JSON with scripted latency and faults')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible latency and fault sequences')
+    parser.add_argument('--record', action='store_true', help='Fetch and save fixtures for unrecorded handles')
+    parser.add_argument('--upstream', default=UPSTREAM_BASE_URL, help='Real API base URL for record mode')
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    api_key = os.getenv("SCRAPECREATORS_API_KEY")
+    if args.record and not api_key:
+        parser.error("--record needs SCRAPECREATORS_API_KEY set")
+
+    server = StandInServer(args.fixtures, Scenario.load(args.scenario), args.record, args.upstream, api_key)
+    print(f"🧪 ScrapeCreators stand-in on http://{args.host}:{args.port} "
+          f"({'record' if args.record else 'replay'} mode, fixtures: {args.fixtures})")
+    print(f"   Point the backend at it: SCRAPECREATORS_BASE_URL=http://{args.host}:{args.port}")
+    web.run_app(server.app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
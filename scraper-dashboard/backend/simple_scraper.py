@@ -19,13 +19,14 @@ sys.path.insert(0, parent_dir)
 
 # Import API reliability functions
 try:
-    from api_reliability_fix import make_instagram_api_call, make_tiktok_api_call
+    from api_reliability_fix import make_instagram_api_call, make_tiktok_api_call, run_api_call
     print("✅ Imported API reliability functions")
 except ImportError as e:
     print(f"⚠️ Could not import API reliability: {e}")
     # Fallback to basic requests
     make_instagram_api_call = None
     make_tiktok_api_call = None
+    run_api_call = None
 
 # Import existing calculation functions
 try:
@@ -71,7 +72,7 @@ class SimpleScraper:
         try:
             # Get profile data
             if make_instagram_api_call:
-                profile_result = make_instagram_api_call(username, self.api_key, "profile")
+                profile_result = run_api_call(make_instagram_api_call(username, self.api_key, "profile"))
                 if not profile_result['success']:
                     error_type = profile_result['error_type']
                     print(f"❌ Profile failed for @{username}: {error_type}")
@@ -85,7 +86,7 @@ class SimpleScraper:
                 return None
             
             # Get posts data
-            posts_result = make_instagram_api_call(username, self.api_key, "posts")
+            posts_result = run_api_call(make_instagram_api_call(username, self.api_key, "posts"))
             if not posts_result['success']:
                 error_type = posts_result['error_type']
                 print(f"⚠️ Posts failed for @{username}: {error_type}")
@@ -120,7 +121,7 @@ class SimpleScraper:
         
         try:
             if make_tiktok_api_call:
-                result = make_tiktok_api_call(username, self.api_key)
+                result = run_api_call(make_tiktok_api_call(username, self.api_key))
                 if not result['success']:
                     error_type = result['error_type']
                     print(f"❌ TikTok failed for @{username}: {error_type}")
@@ -2,7 +2,11 @@ import os
 import sys
 import json
 import asyncio
+import heapq
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import redis
 from supabase import create_client, Client
@@ -20,7 +24,15 @@ if parent_dir not in sys.path:
 # Import the unified scrapers with better error handling
 try:
     from UnifiedScraper import process_instagram_user, process_tiktok_account, process_creator_media
-    from UnifiedRescaper import rescrape_and_update_creator, get_existing_creators
+    from UnifiedRescaper import (
+        rescrape_and_update_creator, process_creators_adaptive, stream_existing_creators, count_existing_creators,
+        stream_creators_by_id, utc_timestamp
+    )
+    from adaptive_concurrency import AIMDController
+    from api_reliability_fix import (
+        api_call_scope, MAX_REQUEUES, requeue_delay, record_job_outcome, get_job_api_usage, run_api_call,
+        get_api_latency_report, get_chaos_report
+    )
     print("✅ Successfully imported scraper functions")
 except ImportError as e:
     print(f"❌ CRITICAL: Could not import scrapers: {e}")
@@ -65,6 +77,22 @@ def update_job_status(job_id: str, status: str, **kwargs):
     except Exception as e:
         print(f"Error updating job {job_id}: {e}")
 
+# Job status writes from rescrape result callbacks run here, off the pipeline's event loop;
+# one thread keeps them in order
+job_status_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-status")
+
+def submit_job_update(func, *args, **kwargs):
+    """Queue a blocking job status write from code running on an event loop."""
+    return job_status_writer.submit(func, *args, **kwargs)
+
+def wait_for_job_updates():
+    """Wait for queued job status writes, so a late 'running' write cannot follow the final status."""
+    job_status_writer.submit(lambda: None).result()
+
+def results_snapshot(results: dict) -> dict:
+    """Copy of a job's results that later callbacks can keep appending to while it is written."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in results.items()}
+
 def update_job_progress(job_id: str, processed_items: int, failed_items: int = 0):
     """Update job progress."""
     try:
@@ -78,6 +106,15 @@ def update_job_progress(job_id: str, processed_items: int, failed_items: int = 0
 
 # ==================== TASK FUNCTIONS ====================
 
+# Rescrape result status -> outcome name in the API ledger
+RESCRAPE_OUTCOMES = {'success': 'updated', 'deleted': 'inactive', 'skipped': 'tombstoned'}
+
+def rescrape_outcome(result: dict) -> str:
+    """Ledger outcome for a rescrape result (light and unchanged rescrapes are 'refreshed')."""
+    if result['status'] == 'success' and result.get('tier') in ('light', 'unchanged'):
+        return 'refreshed'
+    return RESCRAPE_OUTCOMES.get(result['status'], 'failed')
+
 def load_checkpoint(job_id: str):
     """Load checkpoint data for job resume"""
     try:
@@ -88,8 +125,49 @@ def load_checkpoint(job_id: str):
         print(f"⚠️ Failed to load checkpoint: {e}")
     return None
 
+# New-creator jobs scrape this many creators at once as tasks on the job's loop
+NEW_CREATOR_WORKERS = int(os.getenv("NEW_CREATOR_WORKERS", "2"))
+
+# Media for new creators is re-hosted in the background on the job's loop; at most this many at once
+NEW_CREATOR_MEDIA_BACKLOG = int(os.getenv("NEW_CREATOR_MEDIA_BACKLOG", "4"))
+
+async def schedule_creator_media(media_tasks: set, creator_id: str, username: str, creator_data: dict):
+    """Start re-hosting a new creator's media as a task on the job's event loop."""
+    while len(media_tasks) >= NEW_CREATOR_MEDIA_BACKLOG:
+        await asyncio.wait(media_tasks, return_when=asyncio.FIRST_COMPLETED)
+    
+    def finished(task):
+        media_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"⚠️ Media processing failed for @{username}: {task.exception()}")
+    
+    task = asyncio.get_running_loop().create_task(process_creator_media(creator_id, username, creator_data))
+    task.add_done_callback(finished)
+    media_tasks.add(task)
+
+def close_job_loop(loop, media_tasks: set):
+    """Let outstanding media tasks finish, then close the job's event loop."""
+    if loop.is_closed():
+        return
+    try:
+        if media_tasks:
+            print(f"⏳ Waiting for media of {len(media_tasks)} creators")
+            loop.run_until_complete(asyncio.gather(*media_tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
 def process_new_creators(job_id: str, resume_from_index: int = 0):
-    """Process new creators from CSV data with resume functionality."""
+    """Process new creators from CSV data with resume functionality.
+
+    The whole job runs on one event loop: NEW_CREATOR_WORKERS creators are
+    scraped at once as tasks on it, deferred creators are awaited with
+    asyncio.sleep, and media uploads continue as background tasks while the
+    next creators are scraped.
+    """
+    loop = asyncio.new_event_loop()
+    media_tasks = set()
     try:
         print(f"Starting job {job_id}: process_new_creators")
         
@@ -141,78 +219,157 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
         
         print(f"Processing {len(csv_data)} creators (starting from {resume_from_index + 1}/{total_items})")
         
-        for i, creator_data in enumerate(csv_data):
+        # Work queue of (index, creator). Creators that hit a retryable API failure go to
+        # `deferred` with a not-before time and the job moves on instead of sleeping.
+        pending = deque((resume_from_index + i, creator_data) for i, creator_data in enumerate(csv_data))
+        deferred = []  # heap of (not_before, index, creator_data)
+        requeues = {}  # index -> requeue count
+        completed = 0
+        
+        # Creators that were still deferred when the checkpoint was written are due immediately
+        if checkpoint and resume_from_index == checkpoint.get("resume_from_index") and checkpoint.get("deferred"):
+            for item in checkpoint["deferred"]:
+                heapq.heappush(deferred, (0, item["index"], item["creator"]))
+                requeues[item["index"]] = item.get("requeues", 0)
+            processed_items -= len(deferred)
+            print(f"🔁 Restored {len(deferred)} deferred creators from checkpoint")
+        
+        in_flight = {}  # index -> creator_data being scraped right now
+        stopped = False
+        
+        def save_checkpoint(done_index: int):
+            """Checkpoint the queue; creators that are still deferred or in flight are redone on resume."""
+            intermediate_results = {
+                "added": results["added"].copy(),
+                "failed": results["failed"].copy(), 
+                "skipped": results["skipped"].copy(),
+                "filtered": results["filtered"].copy(),
+                "niche_stats": json.loads(json.dumps(niche_stats))
+            }
+            next_index = total_items - len(pending)
+            redo = [(idx, data) for _, idx, data in sorted(deferred)]
+            redo += [(idx, data) for idx, data in in_flight.items() if idx != done_index]
+            checkpoint_data = {
+                "resume_from_index": next_index,
+                "deferred": [
+                    {"index": idx, "creator": data, "requeues": requeues.get(idx, 0)}
+                    for idx, data in redo
+                ],
+                "processed_items": processed_items,
+                "failed_items": failed_items,
+                "results": intermediate_results,
+                "niche_stats": intermediate_results["niche_stats"]
+            }
+            progress = (processed_items, failed_items)
+            
+            def write_checkpoint():
+                try:
+                    redis_client.setex(f"checkpoint:{job_id}", 3600, json.dumps(checkpoint_data))  # 1 hour expiry
+                    print(f"💾 Checkpoint saved at creator {next_index} ({len(redo)} deferred)")
+                except Exception as checkpoint_error:
+                    print(f"⚠️ Failed to save checkpoint: {checkpoint_error}")
+                
+                update_job_status(
+                    job_id,
+                    "running",
+                    processed_items=progress[0],
+                    failed_items=progress[1],
+                    results={
+                        **intermediate_results,
+                        "api_usage": get_job_api_usage(job_id),
+                        "api_latency": get_api_latency_report()
+                    }
+                )
+                print(f"📊 PROGRESS UPDATE: {progress[0]}/{total_items} creators processed ({progress[1]} failed)")
+            
+            submit_job_update(write_checkpoint)
+        
+        async def next_creator():
+            """Take the next creator, waiting (without blocking the loop) when only deferred ones are left."""
+            while pending or deferred:
+                if deferred and (not pending or deferred[0][0] <= time.time()):
+                    wait_time = deferred[0][0] - time.time()
+                    if wait_time > 0:
+                        # Only deferred creators left - wait for the earliest one; media tasks keep running
+                        print(f"⏳ Waiting {wait_time:.0f}s for {len(deferred)} deferred creators")
+                        await asyncio.sleep(wait_time)
+                        continue  # another worker may have taken it meanwhile
+                    _, index, creator_data = heapq.heappop(deferred)
+                    return index, creator_data, True
+                index, creator_data = pending.popleft()
+                return index, creator_data, False
+            return None
+        
+        async def process_creator(index: int, creator_data: dict, requeued: bool):
+            nonlocal processed_items, failed_items, completed, last_progress_time
             username = "unknown"  # Initialize username for error handling
             try:
-                # Check job-level timeout
-                current_time = time.time()
-                if current_time - job_start_time > job_timeout:
-                    print(f"🚨 JOB TIMEOUT: Job exceeded {job_timeout/3600:.1f} hour limit")
-                    results["failed"].append(f"Job timeout after {(current_time - job_start_time)/3600:.1f} hours")
-                    break
-                
-                # Check for stuck job (no progress for 10 minutes)
-                if current_time - last_progress_time > 600:  # 10 minutes
-                    print(f"🚨 STUCK JOB DETECTED: No progress for {(current_time - last_progress_time)/60:.1f} minutes")
-                    results["failed"].append(f"Job stuck - no progress for {(current_time - last_progress_time)/60:.1f} minutes")
-                    break
-                
                 username = creator_data['username'].strip()
                 platform = creator_data['platform'].lower()
-                current_index = resume_from_index + i
+                current_index = index
                 
                 print(f"Processing {current_index + 1}/{total_items}: @{username} ({platform})")
-                last_progress_time = current_time  # Update progress time
+                last_progress_time = time.time()  # Update progress time
                 
                 # Check if creator already exists
-                existing = supabase.table("creatordata").select("id", "platform", "primary_niche").eq("handle", username).execute()
+                existing = await asyncio.to_thread(
+                    supabase.table("creatordata").select("id", "platform", "primary_niche").eq("handle", username).execute
+                )
                 if existing.data:
                     existing_creator = existing.data[0]
                     existing_platform = existing_creator.get('platform', 'Unknown')
                     existing_niche = existing_creator.get('primary_niche', 'Unknown')
                     results["skipped"].append(f"@{username} - Already exists in database ({existing_platform}, {existing_niche} niche)")
                     processed_items += 1
-                    continue
+                    return
                 
                 # Process based on platform with timeout protection and better error handling
                 start_time = time.time()
+                cancelled = threading.Event()
                 try:
                     if platform == 'instagram':
-                        # Use asyncio.wait_for with timeout protection (increased for retry logic)
-                        result = asyncio.run(
-                            asyncio.wait_for(
-                                asyncio.to_thread(process_instagram_user, username),
-                                timeout=300  # 5 minute timeout per creator
-                            )
-                        )
+                        scrape = asyncio.to_thread(process_instagram_user, username)
                     elif platform == 'tiktok':
-                        # Use asyncio.wait_for with timeout protection  
-                        result = asyncio.run(
-                            asyncio.wait_for(
-                                asyncio.to_thread(process_tiktok_account, username, SCRAPECREATORS_API_KEY),
-                                timeout=300  # 5 minute timeout per creator
-                            )
-                        )
+                        scrape = asyncio.to_thread(process_tiktok_account, username, SCRAPECREATORS_API_KEY)
                     else:
                         print(f"❌ Unknown platform: {platform}")
                         results["failed"].append(f"@{username} - unknown platform: {platform}")
                         failed_items += 1
                         processed_items += 1
-                        continue
+                        return
+                    # Retryable API failures come back as 'retry_later' instead of sleeping
+                    with api_call_scope(defer_retries=True, job_id=job_id, requeued=requeued, cancelled=cancelled):
+                        result = await asyncio.wait_for(scrape, timeout=300)  # 5 minute timeout per creator
                 except asyncio.TimeoutError:
+                    # The scrape thread can't be interrupted - stop it from making more API calls
+                    cancelled.set()
                     processing_time = time.time() - start_time
-                    print(f"⏰ TIMEOUT: @{username} processing exceeded 3 minutes ({processing_time:.2f}s)")
+                    print(f"⏰ TIMEOUT: @{username} processing exceeded 5 minutes ({processing_time:.2f}s)")
                     results["failed"].append(f"@{username} - Processing timeout after {processing_time:.2f}s")
                     failed_items += 1
                     processed_items += 1
-                    continue
+                    return
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
                 except Exception as e:
                     processing_time = time.time() - start_time
                     print(f"❌ CRITICAL ERROR: @{username} processing failed after {processing_time:.2f}s: {e}")
                     results["failed"].append(f"@{username} - Critical error: {str(e)}")
                     failed_items += 1
                     processed_items += 1
-                    continue
+                    return
+                
+                # Requeue retryable failures with a not-before time
+                if isinstance(result, dict) and result.get('error') == 'retry_later':
+                    count = requeues.get(index, 0)
+                    if count < MAX_REQUEUES:
+                        delay = requeue_delay(result.get('retry_after'), count)
+                        requeues[index] = count + 1
+                        heapq.heappush(deferred, (time.time() + delay, index, creator_data))
+                        print(f"🔁 Requeued @{username} (attempt {count + 2}) - not before {delay:.0f}s from now")
+                        return
+                    result = {**result, 'message': f"{result.get('message')} (gave up after {MAX_REQUEUES} requeues)"}
                 
                 # Process the result
                 if platform == 'instagram':
@@ -221,12 +378,15 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
                             # Handle different error types
                             if result['error'] == 'filtered':
                                 results["filtered"].append(f"@{username} - {result['message']}")
+                            elif result['error'] == 'tombstoned':
+                                # Known-dead handle: the scraper skipped it without an API call
+                                results["skipped"].append(f"@{username} - {result['message']}")
                             else:
                                 results["failed"].append(f"@{username} - {result['message']}")
                                 failed_items += 1
                         elif 'creator_id' in result:
-                            # Process media asynchronously
-                            asyncio.run(process_creator_media(result['creator_id'], username, result['data']))
+                            # Process media in the background while the next creator is scraped
+                            await schedule_creator_media(media_tasks, result['creator_id'], username, result['data'])
                             results["added"].append(f"@{username} (Instagram)")
                             
                             # Track niche statistics
@@ -252,16 +412,19 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
                             # Handle different error types
                             if result['error'] == 'filtered':
                                 results["filtered"].append(f"@{username} - {result['message']}")
+                            elif result['error'] == 'tombstoned':
+                                # Known-dead handle: the scraper skipped it without an API call
+                                results["skipped"].append(f"@{username} - {result['message']}")
                             else:  # api_error or other errors
                                 results["failed"].append(f"@{username} - {result['message']}")
                                 failed_items += 1
                         else:
                             # Successfully processed - insert into database
-                            response = supabase.table("creatordata").insert(result).execute()
+                            response = await asyncio.to_thread(supabase.table("creatordata").insert(result).execute)
                             if response.data:
                                 creator_id = response.data[0].get('id')
                                 if creator_id:
-                                    asyncio.run(process_creator_media(creator_id, username, result))
+                                    await schedule_creator_media(media_tasks, creator_id, username, result)
                             results["added"].append(f"@{username} (TikTok)")
                             
                             # Track niche statistics
@@ -276,50 +439,24 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
                         results["failed"].append(f"@{username} - failed to process")
                         failed_items += 1
                 
+                # Attribute this creator's API calls to its outcome in the ledger
+                if not result:
+                    outcome = 'failed'
+                elif isinstance(result, dict) and 'error' in result:
+                    outcome = result['error'] if result['error'] in ('filtered', 'tombstoned') else 'failed'
+                else:
+                    outcome = 'added'
+                record_job_outcome(job_id, username, outcome)
+                
                 processed_items += 1
+                completed += 1
                 
-                                # Update progress every item for better monitoring
-                update_job_progress(job_id, processed_items, failed_items)
-
-                # Add intelligent rate limiting - less delay for successful API calls
-                if result and isinstance(result, dict) and result.get("error") != "api_error":
-                    time.sleep(0.5)  # Shorter delay for successful calls
-                else:
-                    time.sleep(2)  # Longer delay after API errors to prevent rate limiting
+                # Update progress every item for better monitoring
+                submit_job_update(update_job_progress, job_id, processed_items, failed_items)
 
                 # Store intermediate results every 5 items
-                if i % 5 == 0:
-                    # Store intermediate results including niche stats
-                    intermediate_results = {
-                        "added": results["added"].copy(),
-                        "failed": results["failed"].copy(), 
-                        "skipped": results["skipped"].copy(),
-                        "filtered": results["filtered"].copy(),
-                        "niche_stats": niche_stats.copy()
-                    }
-                    
-                    # Save checkpoint for resume functionality
-                    checkpoint_data = {
-                        "resume_from_index": resume_from_index + i + 1,
-                        "processed_items": processed_items,
-                        "failed_items": failed_items,
-                        "results": results,
-                        "niche_stats": niche_stats
-                    }
-                    try:
-                        redis_client.setex(f"checkpoint:{job_id}", 3600, json.dumps(checkpoint_data))  # 1 hour expiry
-                        print(f"💾 Checkpoint saved at creator {resume_from_index + i + 1}")
-                    except Exception as checkpoint_error:
-                        print(f"⚠️ Failed to save checkpoint: {checkpoint_error}")
-                    
-                    update_job_status(
-                        job_id,
-                        "running",
-                        processed_items=processed_items,
-                        failed_items=failed_items,
-                        results=intermediate_results
-                    )
-                    print(f"📊 PROGRESS UPDATE: {processed_items}/{total_items} creators processed ({failed_items} failed)")
+                if completed % 5 == 1:
+                    save_checkpoint(index)
                 
             except Exception as e:
                 print(f"Error processing @{username}: {e}")
@@ -327,6 +464,45 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
                 failed_items += 1
                 processed_items += 1
         
+        async def creator_worker():
+            nonlocal stopped
+            while not stopped:
+                # Check job-level timeout
+                current_time = time.time()
+                if current_time - job_start_time > job_timeout:
+                    print(f"🚨 JOB TIMEOUT: Job exceeded {job_timeout/3600:.1f} hour limit")
+                    results["failed"].append(f"Job timeout after {(current_time - job_start_time)/3600:.1f} hours")
+                    stopped = True
+                    return
+                
+                # Check for stuck job (no progress for 10 minutes)
+                if current_time - last_progress_time > 600:  # 10 minutes
+                    print(f"🚨 STUCK JOB DETECTED: No progress for {(current_time - last_progress_time)/60:.1f} minutes")
+                    results["failed"].append(f"Job stuck - no progress for {(current_time - last_progress_time)/60:.1f} minutes")
+                    stopped = True
+                    return
+                
+                item = await next_creator()
+                if item is None or stopped:
+                    return
+                index, creator_data, requeued = item
+                in_flight[index] = creator_data
+                try:
+                    await process_creator(index, creator_data, requeued)
+                finally:
+                    in_flight.pop(index, None)
+        
+        async def run_creators():
+            workers = [asyncio.create_task(creator_worker()) for _ in range(NEW_CREATOR_WORKERS)]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+        
+        loop.run_until_complete(run_creators())
+        close_job_loop(loop, media_tasks)
+        
         # Clean up Redis data
         redis_client.delete(f"job_data:{job_id}")
         
@@ -346,8 +522,14 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
         
         # Add niche stats to results for frontend display
         results["niche_stats"] = niche_stats
-        
-        # Final job completion update
+        results["api_usage"] = get_job_api_usage(job_id)
+        results["api_latency"] = get_api_latency_report()
+        chaos_report = get_chaos_report()
+        if chaos_report:
+            results["chaos"] = chaos_report
+        
+        # Final job completion update (after any queued progress writes)
+        wait_for_job_updates()
         update_job_status(
             job_id,
             "completed",
@@ -372,8 +554,11 @@ def process_new_creators(job_id: str, resume_from_index: int = 0):
         
     except Exception as e:
         print(f"Job {job_id} failed: {e}")
+        wait_for_job_updates()
         update_job_status(job_id, "failed", error_message=str(e))
         raise
+    finally:
+        close_job_loop(loop, media_tasks)
 
 def rescrape_all_creators(job_id: str):
     """Rescrape all creators in the database."""
@@ -392,48 +577,57 @@ def rescrape_all_creators(job_id: str):
             print(f"⚠️ Failed to load auto-rescrape data: {e}")
         
         if auto_rescrape_data:
-            # Auto-rescrape specific creators
-            existing_creators = auto_rescrape_data
+            # Auto-rescrape specific creators, with their stored rows loaded as the job goes
+            existing_creators = stream_creators_by_id(auto_rescrape_data)
+            total_items = len(auto_rescrape_data)
         else:
-            # Get all creators (legacy behavior)
-            existing_creators = get_existing_creators()
+            # All creators (legacy behavior), streamed page by page as the job runs
+            started = utc_timestamp()
+            existing_creators = stream_existing_creators(started=started)
+            total_items = count_existing_creators(started=started)
             
-        total_items = len(existing_creators)
         processed_items = 0
         failed_items = 0
-        results = {"updated": [], "deleted": [], "failed": []}
+        results = {"updated": [], "deleted": [], "skipped": [], "failed": []}
         
         print(f"Rescraping {total_items} creators")
         
-        for i, creator in enumerate(existing_creators):
-            try:
-                handle = creator.get('handle')
-                platform = creator.get('platform')
-                
-                print(f"Rescraping {i+1}/{total_items}: @{handle} ({platform})")
-                
-                # Rescrape the creator
-                result = asyncio.run(rescrape_and_update_creator(creator))
-                
-                if result['status'] == 'success':
-                    results["updated"].append(f"@{handle}")
-                elif result['status'] == 'deleted':
-                    results["deleted"].append(f"@{handle} - inactive")
-                else:
-                    results["failed"].append(f"@{handle} - {result.get('error', 'unknown error')}")
-                    failed_items += 1
-                
-                processed_items += 1
-                
-                # Update progress every 10 items
-                if i % 10 == 0:
-                    update_job_progress(job_id, processed_items, failed_items)
-                
-            except Exception as e:
-                print(f"Error rescraping @{creator.get('handle', 'unknown')}: {e}")
-                results["failed"].append(f"@{creator.get('handle', 'unknown')} - {str(e)}")
+        # Creators in flight adapt to API health (AIMD)
+        controller = AIMDController()
+        
+        def handle_result(creator, result):
+            nonlocal processed_items, failed_items
+            handle = creator.get('handle')
+            
+            if result['status'] == 'success':
+                results["updated"].append(f"@{handle} ({result['tier']})" if result.get('tier') in ('light', 'unchanged') else f"@{handle}")
+            elif result['status'] == 'deleted':
+                results["deleted"].append(f"@{handle} - inactive")
+            elif result['status'] == 'skipped':
+                results["skipped"].append(f"@{handle} - {result.get('reason')}")
+            else:
+                results["failed"].append(f"@{handle} - {result.get('error', 'unknown error')}")
                 failed_items += 1
-                processed_items += 1
+            record_job_outcome(job_id, handle, rescrape_outcome(result))
+            
+            processed_items += 1
+            print(f"Rescraped {processed_items}/{total_items}: @{handle} ({creator.get('platform')}) [window {controller.window}]")
+            
+            # Update progress every 10 items (off the pipeline's loop)
+            if processed_items % 10 == 1:
+                submit_job_update(update_job_progress, job_id, processed_items, failed_items)
+        
+        # Auto-rescrapes are the daily schedule; a full-table sweep yields to everything else
+        with api_call_scope(job_id=job_id, priority='scheduled' if auto_rescrape_data else 'backfill'):
+            asyncio.run(process_creators_adaptive(existing_creators, controller, on_result=handle_result,
+                                                  on_stats=lambda stats: results.update(pipeline=stats)))
+        wait_for_job_updates()
+        results["concurrency"] = controller.snapshot()
+        results["api_usage"] = get_job_api_usage(job_id)
+        results["api_latency"] = get_api_latency_report()
+        chaos_report = get_chaos_report()
+        if chaos_report:
+            results["chaos"] = chaos_report
         
         # Final update
         update_job_status(
@@ -444,7 +638,7 @@ def rescrape_all_creators(job_id: str):
             results=results
         )
         
-        print(f"Job {job_id} completed: {len(results['updated'])} updated, {len(results['deleted'])} deleted, {len(results['failed'])} failed")
+        print(f"Job {job_id} completed: {len(results['updated'])} updated, {len(results['deleted'])} deleted, {len(results['skipped'])} skipped, {len(results['failed'])} failed")
         
         # Start next queued job
         try:
@@ -462,88 +656,83 @@ def rescrape_all_creators(job_id: str):
         
     except Exception as e:
         print(f"Job {job_id} failed: {e}")
+        wait_for_job_updates()
         update_job_status(job_id, "failed", error_message=str(e))
         raise
 
-def rescrape_platform_creators(job_id: str, platform: str, resume_from_index: int = 0):
-    """Rescrape creators for a specific platform with resume functionality."""
+def rescrape_platform_creators(job_id: str, platform: str):
+    """Rescrape creators for a specific platform with resume functionality.
+
+    The creator stream only includes rows not updated since the job started.
+    The checkpoint records that start time, so a resumed job streams with the
+    same cutoff: creators the first run refreshed drop out, and the ones it
+    never reached (or that failed or were skipped) are still ahead.
+    """
     try:
         print(f"Starting job {job_id}: rescrape_platform_creators ({platform})")
-        if resume_from_index > 0:
-            print(f"🔄 RESUMING from index {resume_from_index}")
         
         update_job_status(job_id, "running")
         
-        # Get creators for the platform
-        target_niches = ['Trading', 'Crypto', 'Finance']
-        response = supabase.table("creatordata").select("*").in_('primary_niche', target_niches).eq('platform', platform.title()).execute()
-        all_creators = response.data
-        
-        # Resume from specific index if provided
-        creators = all_creators[resume_from_index:] if resume_from_index > 0 else all_creators
+        checkpoint = load_checkpoint(job_id)
+        if checkpoint and checkpoint.get("started"):
+            started = checkpoint["started"]
+            total_items = checkpoint["total_items"]
+            processed_items = checkpoint["settled_items"]  # Failed and skipped creators come round again
+            print(f"🔄 RESUMING from checkpoint: {processed_items}/{total_items} settled, cutoff {started}")
+        else:
+            started = utc_timestamp()
+            total_items = count_existing_creators(platform, started)  # Total for progress tracking
+            processed_items = 0
+        resumed_from = processed_items
         
-        total_items = len(all_creators)  # Total for progress tracking
-        processed_items = resume_from_index  # Start from resume point
+        # Creators for the platform, streamed page by page as the job runs
+        creators = stream_existing_creators(platform, started=started)
         failed_items = 0
-        results = {"updated": [], "deleted": [], "failed": []}
+        results = {"updated": [], "deleted": [], "skipped": [], "failed": []}
         
         # Job-level timeout protection (6 hours max for rescraper)
         job_start_time = time.time()
         job_timeout = 6 * 60 * 60  # 6 hours in seconds
         last_progress_time = job_start_time
         
-        print(f"Rescraping {len(creators)} {platform} creators (starting from {resume_from_index + 1}/{total_items})")
+        print(f"Rescraping {total_items - resumed_from} {platform} creators (starting from {resumed_from + 1}/{total_items})")
+        
+        # Creators in flight adapt to API health (AIMD) instead of a fixed delay between creators
+        controller = AIMDController()
         
-        for i, creator in enumerate(creators):
+        def should_stop():
+            current_time = time.time()
+            # Check job-level timeout
+            if current_time - job_start_time > job_timeout:
+                print(f"🚨 JOB TIMEOUT: Rescraper exceeded {job_timeout/3600:.1f} hour limit")
+                results["failed"].append(f"Job timeout after {(current_time - job_start_time)/3600:.1f} hours")
+                return True
+            
+            # Check for stuck job (no creator finished for 10 minutes)
+            if current_time - last_progress_time > 600:  # 10 minutes
+                print(f"🚨 STUCK JOB DETECTED: No progress for {(current_time - last_progress_time)/60:.1f} minutes")
+                results["failed"].append(f"Job stuck - no progress for {(current_time - last_progress_time)/60:.1f} minutes")
+                return True
+            return False
+        
+        progress_write = None  # Last queued progress write
+        
+        def handle_result(creator, result):
+            nonlocal processed_items, failed_items, last_progress_time, progress_write
             try:
-                # Check job-level timeout
-                current_time = time.time()
-                if current_time - job_start_time > job_timeout:
-                    print(f"🚨 JOB TIMEOUT: Rescraper exceeded {job_timeout/3600:.1f} hour limit")
-                    results["failed"].append(f"Job timeout after {(current_time - job_start_time)/3600:.1f} hours")
-                    break
-                
-                # Check for stuck job (no progress for 10 minutes)
-                if current_time - last_progress_time > 600:  # 10 minutes
-                    print(f"🚨 STUCK JOB DETECTED: No progress for {(current_time - last_progress_time)/60:.1f} minutes")
-                    results["failed"].append(f"Job stuck - no progress for {(current_time - last_progress_time)/60:.1f} minutes")
-                    break
-                
                 handle = creator.get('handle')
-                current_index = resume_from_index + i
-                
-                print(f"Rescraping {current_index + 1}/{total_items}: @{handle} ({platform})")
-                last_progress_time = current_time  # Update progress time
+                last_progress_time = time.time()  # Update progress time
                 
-                # Add rate limiting between creators
-                if i > 0:  # Don't delay on the first creator
-                    time.sleep(1)  # 1 second between creators to avoid rate limits
-                
-                # Add timeout protection to individual creator processing
-                start_time = time.time()
-                try:
-                    # Use asyncio.wait_for with more aggressive timeout
-                    result = asyncio.run(
-                        asyncio.wait_for(
-                            rescrape_and_update_creator(creator), 
-                            timeout=120  # Reduced to 2 minute timeout per creator
-                        )
-                    )
-                except asyncio.TimeoutError:
-                    processing_time = time.time() - start_time
-                    print(f"⏰ TIMEOUT: @{handle} processing exceeded 2 minutes ({processing_time:.2f}s)")
-                    result = {'status': 'error', 'error': f'Processing timeout after {processing_time:.2f}s'}
-                except Exception as e:
-                    processing_time = time.time() - start_time
-                    print(f"❌ CRITICAL ERROR: @{handle} processing failed after {processing_time:.2f}s: {e}")
-                    result = {'status': 'error', 'error': f'Critical error: {str(e)}'}
+                print(f"Rescraped {processed_items + 1}/{total_items}: @{handle} ({platform}) [window {controller.window}]")
                 
                 if result['status'] == 'success':
-                    results["updated"].append(f"@{handle}")
-                    print(f"✅ SUCCESS: @{handle} processed successfully")
+                    results["updated"].append(f"@{handle} ({result['tier']})" if result.get('tier') in ('light', 'unchanged') else f"@{handle}")
+                    print(f"✅ SUCCESS: @{handle} processed successfully ({result.get('tier', 'full')} rescrape)")
                 elif result['status'] == 'deleted':
                     results["deleted"].append(f"@{handle} - inactive")
                     print(f"🗑️ DELETED: @{handle} removed (inactive)")
+                elif result['status'] == 'skipped':
+                    results["skipped"].append(f"@{handle} - {result.get('reason')}")
                 else:
                     error_msg = result.get('error', 'unknown error')
                     results["failed"].append(f"@{handle} - {error_msg}")
@@ -560,22 +749,37 @@ def rescrape_platform_creators(job_id: str, platform: str, resume_from_index: in
                         print(f"💾 DATABASE ERROR: @{handle}")
                     else:
                         print(f"❌ UNKNOWN ERROR: @{handle} - {error_msg}")
+                record_job_outcome(job_id, handle, rescrape_outcome(result))
                 
                 processed_items += 1
                 
-                # Update progress every item and checkpoint every 10
-                update_job_progress(job_id, processed_items, failed_items)
+                # Update progress every item (skipped while the previous write is still queued)
+                # and checkpoint every 10, off the pipeline's loop
+                if progress_write is None or progress_write.done():
+                    progress_write = submit_job_update(update_job_progress, job_id, processed_items, failed_items)
                 
-                if i % 10 == 0:
+                if (processed_items - resumed_from) % 10 == 1:
                     print(f"📊 CHECKPOINT: Processed {processed_items}/{total_items} creators ({failed_items} failed)")
-                    # Force database update for checkpoint
-                    update_job_status(
-                        job_id,
-                        "running",
-                        processed_items=processed_items,
-                        failed_items=failed_items,
-                        results=results
-                    )
+                    results["concurrency"] = controller.snapshot()
+                    results["api_latency"] = get_api_latency_report()
+                    checkpoint = results_snapshot(results)
+                    resume_point = {
+                        "started": started,
+                        "total_items": total_items,
+                        "settled_items": processed_items - failed_items - len(results["skipped"])
+                    }
+                    
+                    def write_checkpoint(processed=processed_items, failed=failed_items):
+                        try:
+                            redis_client.setex(f"checkpoint:{job_id}", 86400, json.dumps(resume_point))  # 1 day expiry
+                        except Exception as checkpoint_error:
+                            print(f"⚠️ Failed to save checkpoint: {checkpoint_error}")
+                        checkpoint["api_usage"] = get_job_api_usage(job_id)
+                        # Force database update for checkpoint
+                        update_job_status(job_id, "running", processed_items=processed, failed_items=failed,
+                                          results=checkpoint)
+                    
+                    submit_job_update(write_checkpoint)
                 
             except Exception as e:
                 print(f"❌ Critical error rescraping @{creator.get('handle', 'unknown')}: {e}")
@@ -583,6 +787,20 @@ def rescrape_platform_creators(job_id: str, platform: str, resume_from_index: in
                 failed_items += 1
                 processed_items += 1
         
+        with api_call_scope(job_id=job_id, priority='backfill'):
+            asyncio.run(process_creators_adaptive(
+                creators, controller, on_result=handle_result, should_stop=should_stop,
+                creator_timeout=120,  # 2 minute timeout per creator
+                on_stats=lambda stats: results.update(pipeline=stats)
+            ))
+        wait_for_job_updates()
+        results["concurrency"] = controller.snapshot()
+        results["api_usage"] = get_job_api_usage(job_id)
+        results["api_latency"] = get_api_latency_report()
+        chaos_report = get_chaos_report()
+        if chaos_report:
+            results["chaos"] = chaos_report
+        
         # Final update
         update_job_status(
             job_id,
@@ -591,8 +809,12 @@ def rescrape_platform_creators(job_id: str, platform: str, resume_from_index: in
             failed_items=failed_items,
             results=results
         )
+        try:
+            redis_client.delete(f"checkpoint:{job_id}")
+        except Exception as e:
+            print(f"⚠️ Failed to clear checkpoint: {e}")
         
-        print(f"Job {job_id} completed: {len(results['updated'])} updated, {len(results['deleted'])} deleted, {len(results['failed'])} failed")
+        print(f"Job {job_id} completed: {len(results['updated'])} updated, {len(results['deleted'])} deleted, {len(results['skipped'])} skipped, {len(results['failed'])} failed")
         
         # Start next queued job
         try:
@@ -610,6 +832,7 @@ def rescrape_platform_creators(job_id: str, platform: str, resume_from_index: in
         
     except Exception as e:
         print(f"Job {job_id} failed: {e}")
+        wait_for_job_updates()
         update_job_status(job_id, "failed", error_message=str(e))
         raise
 
@@ -0,0 +1,128 @@
+"""
+Offline tests for adaptive request timeouts
+===========================================
+
+Per-endpoint latency percentiles, the p99-based per-attempt timeout and its
+bounds, and the retry loop feeding both successes and timeouts back into the
+tracker. Requests go to a fake sender on a fake clock, and Redis is reported
+unavailable. Run with `python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import api_reliability_fix
+from api_reliability_fix import APIReliabilityManager, LatencyTracker
+
+ENDPOINT = 'instagram_profile'
+URL = 'https://api.scrapecreators.com/v1/instagram/profile?handle=steady'
+
+async def no_redis():
+    return None
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(api_reliability_fix, "get_async_redis", no_redis)
+    monkeypatch.setattr(api_reliability_fix, "time", SimpleNamespace(time=clock.time))
+    monkeypatch.setattr(api_reliability_fix, "client_loop", SimpleNamespace(get_session=lambda: None))
+    monkeypatch.setattr(api_reliability_fix, "api_ledger", SimpleNamespace(record=lambda *args, **kwargs: None))
+    return clock
+
+def observed(latencies, **tracker_options):
+    tracker = LatencyTracker(**tracker_options)
+    for latency in latencies:
+        tracker.observe(ENDPOINT, latency)
+    return tracker
+
+def manager_with_latency(seconds, samples=20):
+    manager = APIReliabilityManager("key")
+    for _ in range(samples):
+        manager.latency_tracker.observe(ENDPOINT, seconds)
+    return manager
+
+# ==================== LATENCY TRACKER ====================
+
+def test_no_percentile_until_enough_samples():
+    assert observed([1.0] * 19).percentile(ENDPOINT, 0.99) is None
+    assert observed([1.0] * 20).percentile(ENDPOINT, 0.99) == 1.0
+    assert observed([]).percentile('other', 0.5) is None
+
+def test_percentiles_over_the_recent_window():
+    tracker = observed([float(i) for i in range(1, 101)])
+    assert tracker.percentile(ENDPOINT, 0.5) == 51.0
+    assert tracker.percentile(ENDPOINT, 0.99) == 100.0
+    # Old samples fall out of the window
+    tracker = observed([100.0] * 20 + [1.0] * 20, window=20)
+    assert tracker.percentile(ENDPOINT, 0.99) == 1.0
+
+def test_snapshot_reports_percentiles_per_endpoint():
+    report = observed([float(i) for i in range(1, 101)]).snapshot()
+    assert report[ENDPOINT]['samples'] == 100
+    assert report[ENDPOINT]['p95'] == 96.0
+
+# ==================== REQUEST TIMEOUT ====================
+
+def test_timeout_is_the_ceiling_until_enough_samples():
+    manager = manager_with_latency(1.0, samples=5)
+    assert manager.request_timeout(ENDPOINT) == manager.timeout_max
+    assert manager.request_timeout(None) == manager.timeout_max
+
+def test_timeout_follows_the_p99_with_margin():
+    manager = manager_with_latency(10.0)
+    expected = 10.0 * api_reliability_fix.TIMEOUT_MARGIN_FACTOR + api_reliability_fix.TIMEOUT_MARGIN_SECONDS
+    assert manager.request_timeout(ENDPOINT) == pytest.approx(expected)
+    assert manager.latency_report()[ENDPOINT]['timeout'] == round(expected, 1)
+
+def test_timeout_stays_within_its_bounds():
+    assert manager_with_latency(0.1).request_timeout(ENDPOINT) == api_reliability_fix.TIMEOUT_MIN
+    manager = manager_with_latency(1000.0)
+    assert manager.request_timeout(ENDPOINT) == manager.timeout_max
+
+# ==================== RETRY LOOP ====================
+
+def fetch(manager, clock, latency=None):
+    """One deferred-retry fetch whose attempt takes `latency` seconds (None: runs into its timeout)."""
+    timeouts = []
+
+    async def send(session, url, timeout, endpoint, context, handle, attempt):
+        timeouts.append(timeout.total)
+        if latency is None:
+            clock.now += timeout.total
+            raise asyncio.TimeoutError()
+        clock.now += latency
+        return 200, None, b'{"success": true, "data": {"user": {"username": "steady"}}}'
+
+    manager._send = send
+    result = asyncio.run(manager._fetch_with_retries(URL, 'steady', 'profile', ENDPOINT, {'defer_retries': True},
+                                                     'steady', None))
+    return result, timeouts
+
+def test_each_attempt_gets_the_current_timeout(clock):
+    manager = manager_with_latency(10.0)
+    result, timeouts = fetch(manager, clock, latency=3.0)
+    assert result['success']
+    assert timeouts == [pytest.approx(manager.request_timeout(ENDPOINT))]
+    assert manager.latency_tracker.samples[ENDPOINT][-1] == 3.0
+
+def test_a_timed_out_attempt_is_recorded_at_the_time_waited(clock):
+    manager = manager_with_latency(10.0)
+    result, timeouts = fetch(manager, clock)
+    assert result['error_type'] == 'retry_later'
+    assert manager.latency_tracker.samples[ENDPOINT][-1] == pytest.approx(timeouts[0])
+
+def test_a_slowing_endpoint_pushes_its_own_timeout_up(clock):
+    manager = manager_with_latency(10.0)
+    first = manager.request_timeout(ENDPOINT)
+    for _ in range(3):
+        fetch(manager, clock)
+    assert manager.request_timeout(ENDPOINT) > first
@@ -0,0 +1,122 @@
+"""
+Offline tests for the ScrapeCreators circuit breaker
+====================================================
+
+closed -> open -> half-open probe -> closed/open on the in-process state
+(Redis reported unavailable, fake clock), the single probe shared by workers
+through Redis (fakeredis), and which errors count towards opening. Run with
+`python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import api_reliability_fix
+from api_reliability_fix import APIReliabilityManager, CircuitBreaker
+
+async def no_redis():
+    return None
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(api_reliability_fix, "get_async_redis", no_redis)
+    monkeypatch.setattr(api_reliability_fix, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+def fail(breaker, times=1):
+    return [asyncio.run(breaker.record_failure('instagram')) for _ in range(times)][-1]
+
+def allow(breaker):
+    return asyncio.run(breaker.allow('instagram'))
+
+def test_circuit_opens_after_the_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, reset_time=15, probe_timeout=50)
+    assert fail(breaker, 2) == 'closed'
+    assert allow(breaker) == (True, 'closed', 0)
+    assert fail(breaker) == 'open'
+    allowed, state, retry_after = allow(breaker)
+    assert (allowed, state) == (False, 'open')
+    assert retry_after == pytest.approx(15)
+
+def test_successes_pay_back_failures(clock):
+    breaker = CircuitBreaker(threshold=3, reset_time=15, probe_timeout=50)
+    fail(breaker, 2)
+    asyncio.run(breaker.record_success('instagram'))
+    assert fail(breaker) == 'closed'
+
+def test_one_probe_after_the_reset_time_closes_the_circuit(clock):
+    breaker = CircuitBreaker(threshold=1, reset_time=15, probe_timeout=50)
+    fail(breaker)
+    clock.now += 15
+    assert allow(breaker) == (True, 'probe', 0)
+    # Everyone else waits for the probe's answer
+    assert allow(breaker)[:2] == (False, 'half_open')
+    assert asyncio.run(breaker.record_success('instagram')) == 'recovered'
+    assert allow(breaker) == (True, 'closed', 0)
+
+def test_a_failed_probe_reopens_the_circuit(clock):
+    breaker = CircuitBreaker(threshold=1, reset_time=15, probe_timeout=50)
+    fail(breaker)
+    clock.now += 15
+    allow(breaker)
+    assert fail(breaker) == 'open'
+    assert allow(breaker)[:2] == (False, 'open')
+
+def test_a_lost_probe_is_replaced_after_the_probe_timeout(clock):
+    breaker = CircuitBreaker(threshold=1, reset_time=15, probe_timeout=50)
+    fail(breaker)
+    clock.now += 15
+    allow(breaker)
+    clock.now += 50
+    assert allow(breaker) == (True, 'probe', 0)
+
+def test_only_severe_errors_count_towards_opening(clock):
+    manager = APIReliabilityManager("key")
+    for _ in range(manager.circuit_breaker_threshold + 1):
+        asyncio.run(manager.record_failure('instagram_profile', 'rate_limited'))
+        asyncio.run(manager.record_failure('instagram_profile', 'timeout'))
+    assert asyncio.run(manager.is_circuit_open('instagram_profile')) == (False, 0)
+
+    for _ in range(manager.circuit_breaker_threshold):
+        asyncio.run(manager.record_failure('instagram_profile', 'server_error'))
+    is_open, retry_after = asyncio.run(manager.is_circuit_open('instagram_profile'))
+    assert is_open
+    assert retry_after == pytest.approx(manager.circuit_breaker_reset_time)
+
+def test_workers_share_one_half_open_probe_through_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+
+    async def scenario():
+        shared = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+        async def shared_redis():
+            return shared
+
+        monkeypatch.setattr(api_reliability_fix, "get_async_redis", shared_redis)
+        first = CircuitBreaker(threshold=2, reset_time=0.05, probe_timeout=50)
+        second = CircuitBreaker(threshold=2, reset_time=0.05, probe_timeout=50)
+        await first.record_failure('instagram')
+        opened = await second.record_failure('instagram')
+        blocked = await first.allow('instagram')
+        await asyncio.sleep(0.1)
+        probes = [await breaker.allow('instagram') for breaker in (first, second, first)]
+        recovered = await second.record_success('instagram')
+        return opened, blocked, probes, recovered, await first.allow('instagram')
+
+    opened, blocked, probes, recovered, after = asyncio.run(scenario())
+    assert opened == 'open'
+    assert blocked[:2] == (False, 'open')
+    assert [probe[:2] for probe in probes] == [(True, 'probe'), (False, 'half_open'), (False, 'half_open')]
+    assert recovered == 'recovered'
+    assert after == (True, 'closed', 0)
@@ -0,0 +1,97 @@
+"""
+Offline tests for the rescrape creator stream
+=============================================
+
+Keyset paging, the job's updated_at cutoff and resume, against an in-memory
+stand-in for the creatordata table. Run with `python -m pytest`.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from offline_stubs import FakeSupabase, stub_scraper_imports
+
+stub_scraper_imports()
+
+import UnifiedRescaper
+
+def creator(creator_id, updated_at, niche='Finance', platform='Instagram'):
+    return {'id': creator_id, 'handle': f'creator{creator_id}', 'platform': platform,
+            'primary_niche': niche, 'updated_at': updated_at}
+
+@pytest.fixture
+def creatordata(monkeypatch):
+    rows = [creator(i, f'2026-01-{1 + i % 5:02d}T00:00:00') for i in range(1, 24)]
+    rows += [creator(i, None) for i in range(24, 29)]
+    rows += [creator(40, '2026-01-01T00:00:00', niche='Food'),
+             creator(41, '2026-01-01T00:00:00', platform='Tiktok')]
+    fake = FakeSupabase(rows)
+    monkeypatch.setattr(UnifiedRescaper, "supabase", fake)
+    return fake.creatordata
+
+def streamed_ids(pages):
+    return [row['id'] for page in pages for row in page]
+
+# ==================== CREATOR STREAM ====================
+
+def test_pages_follow_the_keyset_stalest_first(creatordata):
+    pages = list(UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=4, started='2026-02-01T00:00:00'))
+    assert all(len(page) <= 4 for page in pages)
+
+    ids = streamed_ids(pages)
+    dated = [row for row in creatordata.rows if row['updated_at'] and row['primary_niche'] == 'Finance'
+             and row['platform'] == 'Instagram']
+    expected = [row['id'] for row in sorted(dated, key=lambda row: (row['updated_at'], row['id']))]
+    assert ids == expected + [24, 25, 26, 27, 28]
+
+def test_pages_leave_out_rows_updated_after_the_start(creatordata):
+    started = '2026-02-01T00:00:00'
+    pages = UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=4, started=started)
+    first = next(pages)
+    # The job refreshes the first page; those rows must not come round again
+    for row in first:
+        creatordata.by_id(row['id'])['updated_at'] = '2026-02-01T00:05:00'
+    rest = streamed_ids(pages)
+    assert not {row['id'] for row in first} & set(rest)
+    assert len(first) + len(rest) == 28
+
+def test_resume_with_the_original_start_visits_only_unfinished_creators(creatordata):
+    started = '2026-02-01T00:00:00'
+    total = UnifiedRescaper.count_existing_creators('instagram', started)
+    pages = UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=5, started=started)
+
+    refreshed = set()
+    for page in (next(pages), next(pages)):
+        for row in page[:-1]:  # the last creator of each page failed and was not written
+            creatordata.by_id(row['id'])['updated_at'] = '2026-02-01T00:10:00'
+            refreshed.add(row['id'])
+    # Rows never reached are bumped to the top of the order by an unrelated edit before the job died
+    creatordata.by_id(27)['updated_at'] = '2025-06-01T00:00:00'
+
+    resumed = streamed_ids(UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=5, started=started))
+    assert set(resumed) == set(range(1, 29)) - refreshed
+    assert resumed[0] == 27
+    assert total == 28
+
+def test_count_matches_the_stream_cutoff(creatordata):
+    started = '2026-01-03T00:00:00'
+    count = UnifiedRescaper.count_existing_creators('instagram', started)
+    streamed = streamed_ids(UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=7, started=started))
+    assert count == len(streamed)
+    assert {24, 25, 26, 27, 28} <= set(streamed)
+
+def test_default_cutoff_and_written_updated_at_are_both_utc(creatordata):
+    before = datetime.now(timezone.utc)
+    update = UnifiedRescaper.build_light_update({'handle': 'creator1', 'followers_count': 100}, {'followers_count': 110})
+    written = datetime.fromisoformat(update['updated_at'])
+    assert written.utcoffset() == timedelta(0)
+    assert before <= written <= datetime.now(timezone.utc)
+
+    # A row the job just wrote is past the default (now) cutoff of a job started after it...
+    creatordata.by_id(1)['updated_at'] = update['updated_at']
+    assert 1 in streamed_ids(UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=50))
+    # ...and not of the job that started before writing it, whatever the server's local zone
+    streamed = streamed_ids(UnifiedRescaper.iter_existing_creator_pages('instagram', page_size=50,
+                                                                      started=before.isoformat()))
+    assert 1 not in streamed
@@ -0,0 +1,103 @@
+"""
+Offline tests for hedged requests
+=================================
+
+When hedging is on, a request that outlives its endpoint's p95 is raced
+against a second copy, within HEDGE_BUDGET of all calls sent. Requests go
+to a fake sender instead of the API, and Redis is reported unavailable.
+Run with `python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import api_reliability_fix
+from api_reliability_fix import APIReliabilityManager
+
+ENDPOINT = 'instagram_profile'
+URL = 'https://api.scrapecreators.com/v1/instagram/profile?handle=steady'
+
+async def no_redis():
+    return None
+
+@pytest.fixture
+def ledger(monkeypatch):
+    """Attempt statuses recorded to the call ledger."""
+    statuses = []
+    monkeypatch.setattr(api_reliability_fix, "get_async_redis", no_redis)
+    monkeypatch.setattr(api_reliability_fix, "HEDGE_MIN_DELAY", 0.01)
+    monkeypatch.setattr(api_reliability_fix, "api_ledger",
+                        SimpleNamespace(record=lambda *args, **kwargs: statuses.append(args[4])))
+    return statuses
+
+def hedging_manager(p95=0.05, samples=20):
+    manager = APIReliabilityManager("key")
+    manager.hedging = True
+    manager.calls_sent = 100  # Plenty of hedge budget
+    for _ in range(samples):
+        manager.latency_tracker.observe(ENDPOINT, p95)
+    return manager
+
+def fake_sender(manager, latencies):
+    """Answer the n-th copy sent after latencies[n] seconds with its own body; returns the copies sent."""
+    sent = []
+
+    async def get(session, url, timeout):
+        copy = len(sent)
+        sent.append(copy)
+        await asyncio.sleep(latencies[copy])
+        return 200, None, f'copy{copy}'.encode()
+
+    manager._get = get
+    return sent
+
+def send(manager):
+    return asyncio.run(manager._send(None, URL, None, ENDPOINT, {}, 'steady', 1))
+
+def test_no_hedge_delay_without_hedging_or_samples():
+    manager = hedging_manager(samples=5)
+    assert manager.hedge_delay(ENDPOINT) is None
+    manager = hedging_manager()
+    manager.hedging = False
+    assert manager.hedge_delay(ENDPOINT) is None
+    assert hedging_manager().hedge_delay(None) is None
+
+def test_hedge_delay_is_the_p95_but_never_below_the_minimum(ledger):
+    manager = hedging_manager(p95=0.05)
+    assert manager.hedge_delay(ENDPOINT) == pytest.approx(0.05)
+    manager = hedging_manager(p95=0.001)
+    assert manager.hedge_delay(ENDPOINT) == api_reliability_fix.HEDGE_MIN_DELAY
+
+def test_a_fast_primary_is_not_hedged(ledger):
+    manager = hedging_manager()
+    sent = fake_sender(manager, [0.001])
+    assert send(manager) == (200, None, b'copy0')
+    assert sent == [0]
+    assert manager.hedges_sent == 0
+
+def test_a_slow_primary_loses_to_its_hedge(ledger):
+    manager = hedging_manager()
+    sent = fake_sender(manager, [1.0, 0.001])
+    assert send(manager) == (200, None, b'copy1')
+    assert sent == [0, 1]
+    assert (manager.hedges_sent, manager.hedges_won) == (1, 1)
+    # The cancelled primary was still billed
+    assert ledger == ['hedge_cancelled']
+
+def test_the_primary_can_still_win_after_a_hedge(ledger):
+    manager = hedging_manager()
+    fake_sender(manager, [0.1, 1.0])
+    assert send(manager) == (200, None, b'copy0')
+    assert (manager.hedges_sent, manager.hedges_won) == (1, 0)
+
+def test_hedges_stay_within_the_budget(ledger):
+    manager = hedging_manager()
+    manager.hedges_sent = 1
+    manager.calls_sent = int(1 / api_reliability_fix.HEDGE_BUDGET) - 1
+    sent = fake_sender(manager, [0.2, 0.001])
+    # This call brings calls_sent to exactly the budget for one hedge, which is already spent
+    assert send(manager) == (200, None, b'copy0')
+    assert sent == [0]
+    assert manager.hedges_sent == 1
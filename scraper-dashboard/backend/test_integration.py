@@ -28,7 +28,7 @@ def test_instagram_integration():
     
     print(f"📱 Testing Instagram: @{test_username}")
     try:
-        result = scrape_instagram_user_data(test_username)
+        result = asyncio.run(scrape_instagram_user_data(test_username))
         
         if result is None:
             print(f"❌ Instagram test failed: No data returned")
@@ -60,7 +60,7 @@ def test_tiktok_integration():
     
     print(f"🎵 Testing TikTok: @{test_username}")
     try:
-        result = scrape_tiktok_user_data(test_username)
+        result = asyncio.run(scrape_tiktok_user_data(test_username))
         
         if result is None:
             print(f"❌ TikTok test failed: No data returned")
@@ -0,0 +1,66 @@
+"""
+Offline tests for unchanged-creator detection
+=============================================
+
+A full rescrape that found the same posts and barely moving metrics is
+written as an 'unchanged' update (counters only). Creators without a stored
+baseline for a metric are always treated as changed. Run with
+`python -m pytest`.
+"""
+
+import pytest
+
+from offline_stubs import stub_scraper_imports
+
+stub_scraper_imports()
+
+import UnifiedRescaper
+
+POSTS = {f'recent_post_{i}': {'created_at': f'2026-01-{i:02d}T12:00:00', 'views': 1000} for i in range(1, 4)}
+
+def stored(**metrics):
+    return {'id': 7, 'handle': 'steady', 'platform': 'Instagram', 'followers_count': 20_000,
+            'engagement_rate': 1.5, 'average_views': 5_000, **POSTS, **metrics}
+
+def fresh(**metrics):
+    return {'followers_count': 20_100, 'engagement_rate': 1.51, 'average_views': 5_050,
+            'average_likes': {'avg_value': 300}, 'average_comments': 12, **POSTS, **metrics}
+
+def test_same_posts_and_small_movement_is_unchanged():
+    assert UnifiedRescaper.no_material_change(stored(), fresh())
+
+def test_new_posts_are_a_material_change():
+    new_posts = {**POSTS, 'recent_post_1': {'created_at': '2026-02-01T12:00:00', 'views': 10}}
+    assert not UnifiedRescaper.no_material_change(stored(), fresh(**new_posts))
+
+@pytest.mark.parametrize('metric', UnifiedRescaper.MATERIAL_METRICS)
+def test_movement_over_the_threshold_is_a_material_change(metric):
+    moved = fresh(**{metric: stored()[metric] * 1.5})
+    assert not UnifiedRescaper.no_material_change(stored(), moved)
+
+@pytest.mark.parametrize('metric', UnifiedRescaper.MATERIAL_METRICS)
+@pytest.mark.parametrize('baseline', [None, 0, ''])
+def test_a_missing_or_zero_baseline_is_never_unchanged(metric, baseline):
+    # calculate_change reports 0% movement against these, which must not read as "no change"
+    assert UnifiedRescaper.calculate_change(fresh()[metric], baseline)[0] == 0
+    assert not UnifiedRescaper.no_material_change(stored(**{metric: baseline}), fresh())
+
+@pytest.mark.parametrize('metric', UnifiedRescaper.MATERIAL_METRICS)
+def test_a_missing_fresh_value_is_never_unchanged(metric):
+    assert not UnifiedRescaper.no_material_change(stored(), fresh(**{metric: None}))
+
+def test_metric_value_reads_average_dicts():
+    assert UnifiedRescaper.metric_value({'avg_value': 300, 'median_value': 250}) == 300.0
+    assert UnifiedRescaper.metric_value('1.5') == 1.5
+    assert UnifiedRescaper.metric_value({'median_value': 250}) is None
+    assert UnifiedRescaper.metric_value(None) is None
+
+def test_build_creator_update_writes_counters_only_when_unchanged():
+    write, failure = UnifiedRescaper.build_creator_update(stored(), fresh())
+    assert failure is None
+    assert write['action'] == 'unchanged'
+    assert set(write['payload']) <= set(UnifiedRescaper.UNCHANGED_UPDATE_COLUMNS)
+
+def test_build_creator_update_writes_everything_without_a_baseline():
+    write, _ = UnifiedRescaper.build_creator_update(stored(engagement_rate=None), fresh())
+    assert write['action'] == 'full'
@@ -0,0 +1,123 @@
+"""
+Offline tests for the priority gate
+===================================
+
+In-process connection slots handed out highest lane first, with the last
+slots reserved for interactive calls. Run with `python -m pytest`.
+"""
+
+import asyncio
+
+from api_reliability_fix import PriorityGate
+
+async def settle():
+    """Let every runnable task take its next step."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+async def hold(gate, priority, name, order, release):
+    """Take a slot, note when it was granted, and keep it until `release` is set."""
+    async with gate.slot(priority):
+        order.append(name)
+        await release.wait()
+
+def test_bulk_lanes_leave_the_reserved_slots_to_interactive_calls():
+    async def scenario():
+        gate = PriorityGate(slots=3, reserved=1)
+        order, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(hold(gate, lane, name, order, release))
+                 for lane, name in (('scheduled', 's1'), ('backfill', 'b1'), ('scheduled', 's2'),
+                                    ('interactive', 'i1'))]
+        await settle()
+        granted = list(order)
+        release.set()
+        await asyncio.gather(*tasks)
+        return gate, granted, order
+
+    gate, granted, order = asyncio.run(scenario())
+    # s2 had to wait: the third slot is interactive-only
+    assert granted == ['s1', 'b1', 'i1']
+    assert order[-1] == 's2'
+    assert gate.waits['scheduled'] == 1
+    assert gate.in_use == 0
+
+def test_waiters_are_served_by_lane_then_arrival():
+    async def scenario():
+        gate = PriorityGate(slots=1, reserved=0)
+        order = []
+        release = {name: asyncio.Event() for name in ('first', 'b1', 's1', 'b2', 'i1', 's2')}
+        tasks = [asyncio.create_task(hold(gate, 'scheduled', 'first', order, release['first']))]
+        await settle()
+        for lane, name in (('backfill', 'b1'), ('scheduled', 's1'), ('backfill', 'b2'), ('interactive', 'i1'),
+                           ('scheduled', 's2')):
+            tasks.append(asyncio.create_task(hold(gate, lane, name, order, release[name])))
+            await settle()
+        for name in ('first', 'i1', 's1', 's2', 'b1', 'b2'):
+            release[name].set()
+            await settle()
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(scenario()) == ['first', 'i1', 's1', 's2', 'b1', 'b2']
+
+def test_an_interactive_call_goes_ahead_of_queued_bulk_work():
+    async def scenario():
+        gate = PriorityGate(slots=2, reserved=1)
+        order, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(hold(gate, 'scheduled', 's1', order, release))]
+        await settle()
+        tasks.append(asyncio.create_task(hold(gate, 'scheduled', 's2', order, release)))
+        await settle()
+        tasks.append(asyncio.create_task(hold(gate, 'interactive', 'i1', order, release)))
+        await settle()
+        granted = list(order)
+        release.set()
+        await asyncio.gather(*tasks)
+        return granted, order
+
+    granted, order = asyncio.run(scenario())
+    # s2 is queued for the one bulk slot; i1 takes the reserved one straight away
+    assert granted == ['s1', 'i1']
+    assert order == ['s1', 'i1', 's2']
+
+def test_a_cancelled_waiter_passes_its_slot_on():
+    async def scenario():
+        gate = PriorityGate(slots=1, reserved=0)
+        order = []
+        first_done, second_done = asyncio.Event(), asyncio.Event()
+        first = asyncio.create_task(hold(gate, 'scheduled', 'first', order, first_done))
+        await settle()
+        cancelled = asyncio.create_task(hold(gate, 'interactive', 'cancelled', order, asyncio.Event()))
+        second = asyncio.create_task(hold(gate, 'scheduled', 'second', order, second_done))
+        await settle()
+        cancelled.cancel()
+        first_done.set()
+        await settle()
+        second_done.set()
+        await asyncio.gather(first, second)
+        return gate, order
+
+    gate, order = asyncio.run(scenario())
+    assert order == ['first', 'second']
+    assert gate.in_use == 0
+
+def test_a_waiter_cancelled_after_being_handed_a_slot_releases_it():
+    async def scenario():
+        gate = PriorityGate(slots=1, reserved=0)
+        order, second_done = [], asyncio.Event()
+        await gate.acquire('scheduled')
+        handed = asyncio.create_task(gate.acquire('interactive'))
+        second = asyncio.create_task(hold(gate, 'scheduled', 'second', order, second_done))
+        await settle()
+        # The slot goes to `handed`, which is cancelled before it gets to run
+        gate.release()
+        handed.cancel()
+        await settle()
+        granted = list(order)
+        second_done.set()
+        await second
+        return gate, granted
+
+    gate, granted = asyncio.run(scenario())
+    assert granted == ['second']
+    assert gate.in_use == 0
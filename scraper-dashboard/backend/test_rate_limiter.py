@@ -0,0 +1,113 @@
+"""
+Offline tests for the ScrapeCreators token bucket
+=================================================
+
+Reservations, refill, priority lanes and 429 penalties on the in-process
+bucket (Redis reported unavailable, fake clock), and the shared Redis bucket
+against fakeredis. Run with `python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import api_reliability_fix
+from api_reliability_fix import TokenBucketLimiter
+
+RATE, BURST = 2.0, 4.0
+LIMITS = {'instagram_profile': (RATE, BURST)}
+
+async def no_redis():
+    return None
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(api_reliability_fix, "get_async_redis", no_redis)
+    monkeypatch.setattr(api_reliability_fix, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+def reserve(limiter, priority='scheduled', endpoint='instagram_profile'):
+    return asyncio.run(limiter._reserve(endpoint, 1, priority))
+
+def test_burst_is_free_then_callers_are_spaced_at_the_rate(clock):
+    limiter = TokenBucketLimiter(LIMITS)
+    assert [reserve(limiter) for _ in range(4)] == [0, 0, 0, 0]
+    assert reserve(limiter) == pytest.approx(1 / RATE)
+    assert reserve(limiter) == pytest.approx(2 / RATE)
+
+def test_bucket_refills_up_to_the_burst(clock):
+    limiter = TokenBucketLimiter(LIMITS)
+    for _ in range(6):
+        reserve(limiter)
+    clock.now += 60
+    assert [reserve(limiter) for _ in range(4)] == [0, 0, 0, 0]
+    assert reserve(limiter) > 0
+
+def test_interactive_calls_jump_queued_reservations(clock):
+    limiter = TokenBucketLimiter(LIMITS)
+    for _ in range(8):
+        reserve(limiter)
+    assert reserve(limiter, 'interactive') == pytest.approx(1 / RATE)
+    # A scheduled call waits behind the whole debt
+    assert reserve(limiter) > 2
+
+def test_backfill_leaves_part_of_the_burst_to_other_lanes(clock):
+    limiter = TokenBucketLimiter(LIMITS)
+    free = int(BURST * (1 - api_reliability_fix.BACKFILL_BUCKET_FLOOR))
+    assert [reserve(limiter, 'backfill') for _ in range(free)] == [0] * free
+    assert reserve(limiter, 'backfill') > 0
+    # Backfill waits once the bucket is down to its floor; a scheduled call still gets a token
+    assert reserve(limiter, 'scheduled') == 0
+
+def test_penalty_holds_every_lane(clock):
+    limiter = TokenBucketLimiter(LIMITS)
+    asyncio.run(limiter.penalize('instagram_profile', 10))
+    assert reserve(limiter, 'interactive') >= 10
+    assert reserve(limiter, 'scheduled') >= 10
+    clock.now += 10
+    assert reserve(limiter, 'interactive') == pytest.approx(1 / RATE)
+
+def test_unknown_endpoints_are_not_limited(clock):
+    limiter = TokenBucketLimiter(LIMITS)
+    assert asyncio.run(limiter.acquire('unknown')) == 0
+
+def test_acquire_sleeps_for_its_reservation(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(api_reliability_fix.asyncio, "sleep", fake_sleep)
+    limiter = TokenBucketLimiter(LIMITS)
+    waits = [asyncio.run(limiter.acquire('instagram_profile')) for _ in range(5)]
+    assert slept == [pytest.approx(1 / RATE)]
+    assert waits[-1] == slept[0]
+
+def test_workers_share_one_bucket_through_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+
+    async def scenario():
+        shared = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+        async def shared_redis():
+            return shared
+
+        monkeypatch.setattr(api_reliability_fix, "get_async_redis", shared_redis)
+        first, second = TokenBucketLimiter(LIMITS), TokenBucketLimiter(LIMITS)
+        drained = [await first._reserve('instagram_profile', 1) for _ in range(int(BURST))]
+        return drained, await second._reserve('instagram_profile', 1)
+
+    drained, wait = asyncio.run(scenario())
+    assert drained == [0] * int(BURST)
+    # The second worker's bucket was emptied by the first (up to the time the reservations took)
+    assert 0.3 < wait <= 1 / RATE
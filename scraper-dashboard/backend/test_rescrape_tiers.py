@@ -0,0 +1,121 @@
+"""
+Offline tests for light / full rescrape tiers
+=============================================
+
+Tier planning and escalation, with Redis reported unavailable so the tier
+store uses its per-process fallback, and a light Instagram rescrape that
+escalates to a full one against a fake API. Run with `python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from offline_stubs import stub_scraper_imports
+
+stub_scraper_imports()
+
+import rescrape_tiers
+import UnifiedRescaper
+
+async def no_redis():
+    return None
+
+class DirectLoop:
+    """Stand-in for client_loop that runs coroutines on the caller's loop."""
+
+    async def run(self, coro):
+        return await coro
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rescrape_tiers, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+@pytest.fixture
+def offline(monkeypatch):
+    monkeypatch.setattr(rescrape_tiers, "get_async_redis", no_redis)
+    monkeypatch.setattr(rescrape_tiers, "client_loop", DirectLoop())
+    monkeypatch.setattr(rescrape_tiers, "rescrape_tiers", rescrape_tiers.RescrapeTierStore())
+
+# ==================== RESCRAPE TIERS ====================
+
+def test_plan_rescrape_is_full_without_state(offline):
+    assert asyncio.run(rescrape_tiers.plan_rescrape('instagram', 'new')) == {'tier': 'full', 'followers_at_full': None}
+
+def test_plan_rescrape_escalates_every_nth_cycle(offline, monkeypatch):
+    monkeypatch.setattr(rescrape_tiers, "RESCRAPE_FULL_EVERY", 4)
+    asyncio.run(rescrape_tiers.record_rescrape('instagram', 'steady', 'full', 20_000))
+
+    tiers = []
+    for _ in range(8):
+        plan = asyncio.run(rescrape_tiers.plan_rescrape('instagram', 'steady'))
+        tiers.append(plan['tier'])
+        asyncio.run(rescrape_tiers.record_rescrape('instagram', 'steady', plan['tier'], 20_000))
+    assert tiers == ['light', 'light', 'light', 'full'] * 2
+    assert plan['followers_at_full'] == 20_000
+
+def test_plan_rescrape_is_always_full_when_light_rescrapes_are_off(offline, monkeypatch):
+    monkeypatch.setattr(rescrape_tiers, "RESCRAPE_FULL_EVERY", 1)
+    asyncio.run(rescrape_tiers.record_rescrape('instagram', 'steady', 'full', 20_000))
+    assert asyncio.run(rescrape_tiers.plan_rescrape('instagram', 'steady'))['tier'] == 'full'
+
+def test_plan_rescrape_forgets_expired_state(offline, clock):
+    asyncio.run(rescrape_tiers.record_rescrape('instagram', 'stale', 'full', 20_000))
+    clock.now += rescrape_tiers.RESCRAPE_TIER_STATE_TTL + 1
+    assert asyncio.run(rescrape_tiers.plan_rescrape('instagram', 'stale'))['tier'] == 'full'
+
+def test_follower_move_escalates_past_threshold(monkeypatch):
+    monkeypatch.setattr(rescrape_tiers, "RESCRAPE_FULL_FOLLOWER_CHANGE", 5)
+    assert not rescrape_tiers.follower_move_needs_full(20_000, 20_900)
+    assert rescrape_tiers.follower_move_needs_full(20_000, 21_100)
+    assert rescrape_tiers.follower_move_needs_full(20_000, 18_900)
+    assert rescrape_tiers.follower_move_needs_full(None, 20_000)
+
+# ==================== LIGHT RESCRAPES ====================
+
+@pytest.fixture
+def instagram_api(monkeypatch):
+    """Fake profile and posts endpoints; returns the list of calls made."""
+    calls = []
+    followers = {'value': 20_000}
+
+    async def make_instagram_api_call(username, api_key, request_type):
+        calls.append(request_type)
+        if request_type == 'profile':
+            data = {'data': {'user': {'full_name': username, 'edge_followed_by': {'count': followers['value']}}}}
+        else:
+            data = {'items': []}
+        return {'success': True, 'data': data, 'error_type': None, 'error_message': None}
+
+    async def no_tombstone(platform, username):
+        return None
+
+    async def bury_handle(*args):
+        pass
+
+    monkeypatch.setattr(UnifiedRescaper, "make_instagram_api_call", make_instagram_api_call)
+    monkeypatch.setattr(UnifiedRescaper, "find_tombstone", no_tombstone)
+    monkeypatch.setattr(UnifiedRescaper, "bury_handle", bury_handle)
+    monkeypatch.setattr(rescrape_tiers, "RESCRAPE_FULL_FOLLOWER_CHANGE", 5)
+    return SimpleNamespace(calls=calls, followers=followers)
+
+def test_light_rescrape_makes_only_the_profile_call(instagram_api):
+    instagram_api.followers['value'] = 20_500
+    result = asyncio.run(UnifiedRescaper.scrape_instagram_light('steady', followers_at_full=20_000))
+    assert result == {'light': True, 'followers_count': 20_500}
+    assert instagram_api.calls == ['profile']
+
+def test_escalated_light_rescrape_reuses_the_profile(instagram_api):
+    instagram_api.followers['value'] = 30_000
+    asyncio.run(UnifiedRescaper.scrape_instagram_light('steady', followers_at_full=20_000))
+    assert instagram_api.calls == ['profile', 'posts']
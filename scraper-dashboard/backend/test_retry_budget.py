@@ -0,0 +1,116 @@
+"""
+Offline tests for the retry budget
+==================================
+
+Retries are capped at a share of first attempts over a sliding window, with
+a minimum always allowed. In-process counters (Redis reported unavailable,
+fake clock), the shared Redis window (fakeredis), and the retry loop giving
+up once the budget is spent. Run with `python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import api_reliability_fix
+from api_reliability_fix import APIReliabilityManager, RetryBudget
+
+async def no_redis():
+    return None
+
+async def no_sleep(seconds):
+    pass
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(api_reliability_fix, "get_async_redis", no_redis)
+    monkeypatch.setattr(api_reliability_fix, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+def attempts(budget, count):
+    async def record():
+        for _ in range(count):
+            await budget.record_attempt()
+    asyncio.run(record())
+
+def retries(budget, count):
+    async def spend():
+        return [await budget.try_retry() for _ in range(count)]
+    return asyncio.run(spend())
+
+def test_minimum_retries_are_always_allowed(clock):
+    budget = RetryBudget(percent=10, window=60, min_retries=3)
+    assert retries(budget, 4) == [True, True, True, False]
+    assert budget.rejected == 1
+
+def test_retries_scale_with_first_attempts(clock):
+    budget = RetryBudget(percent=10, window=60, min_retries=3)
+    attempts(budget, 100)
+    assert retries(budget, 11).count(True) == 10
+
+def test_spent_retries_come_back_as_the_window_slides(clock):
+    budget = RetryBudget(percent=10, window=60, min_retries=3, bucket_seconds=10)
+    retries(budget, 3)
+    assert retries(budget, 1) == [False]
+    clock.now += 30
+    assert retries(budget, 1) == [False]
+    clock.now += 40
+    assert retries(budget, 3) == [True, True, True]
+
+def test_first_attempts_expire_with_the_window(clock):
+    budget = RetryBudget(percent=10, window=60, min_retries=0, bucket_seconds=10)
+    attempts(budget, 50)
+    clock.now += 70
+    assert retries(budget, 1) == [False]
+
+def test_workers_share_one_budget_through_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+
+    async def scenario():
+        shared = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+        async def shared_redis():
+            return shared
+
+        monkeypatch.setattr(api_reliability_fix, "get_async_redis", shared_redis)
+        first = RetryBudget(percent=10, window=60, min_retries=2)
+        second = RetryBudget(percent=10, window=60, min_retries=2)
+        for _ in range(30):
+            await first.record_attempt()
+        spent = [await first.try_retry() for _ in range(2)]
+        return spent, [await second.try_retry() for _ in range(2)]
+
+    spent, shared_spend = asyncio.run(scenario())
+    # 30 attempts earn 3 retries between both workers
+    assert spent == [True, True]
+    assert shared_spend == [True, False]
+
+def test_the_retry_loop_stops_when_the_budget_is_spent(clock, monkeypatch):
+    monkeypatch.setattr(api_reliability_fix, "client_loop", SimpleNamespace(get_session=lambda: None))
+    monkeypatch.setattr(api_reliability_fix, "api_ledger", SimpleNamespace(record=lambda *args, **kwargs: None))
+    monkeypatch.setattr(api_reliability_fix.asyncio, "sleep", no_sleep)
+    manager = APIReliabilityManager("key")
+    manager.retry_budget = RetryBudget(percent=0, min_retries=1)
+    sent = []
+
+    async def send(session, url, timeout, endpoint, context, handle, attempt):
+        sent.append(attempt)
+        return 503, None, b'unavailable'
+
+    manager._send = send
+    url = 'https://api.scrapecreators.com/v1/instagram/profile?handle=steady'
+    result = asyncio.run(manager._fetch_with_retries(url, 'steady', 'profile', 'instagram_profile', {},
+                                                     'steady', None))
+    assert result['error_type'] == 'retry_budget'
+    # The first attempt and the one retry the budget allowed
+    assert sent == [0, 1]
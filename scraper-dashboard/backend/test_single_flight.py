@@ -0,0 +1,73 @@
+"""
+Offline tests for single-flight coalescing
+==========================================
+
+Concurrent fetches of one key share the leader's result only when it is the
+API's final answer. Redis is reported unavailable, so only in-process callers
+are coalesced. Run with `python -m pytest`.
+"""
+
+import asyncio
+
+import pytest
+
+import api_reliability_fix
+from api_reliability_fix import SingleFlight, shareable_result
+
+async def no_redis():
+    return None
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    monkeypatch.setattr(api_reliability_fix, "get_async_redis", no_redis)
+
+def api_result(error_type=None):
+    if error_type is None:
+        return {'success': True, 'data': {'user': 'steady'}, 'error_type': None, 'error_message': None}
+    return {'success': False, 'data': None, 'error_type': error_type, 'error_message': error_type}
+
+async def fetch_concurrently(flight, results, callers=3):
+    """Start `callers` fetches of one key; the leader returns results[0], later fetches the next ones."""
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        await asyncio.sleep(0.01)
+        return results[min(len(calls) - 1, len(results) - 1)]
+
+    answers = await asyncio.gather(*(flight.do('profile:steady', fetch, 5) for _ in range(callers)))
+    return answers, len(calls)
+
+def test_followers_share_a_successful_fetch():
+    answers, calls = asyncio.run(fetch_concurrently(SingleFlight(), [api_result()]))
+    assert calls == 1
+    assert [answer.get('coalesced', False) for answer in answers] == [False, True, True]
+    assert all(answer['success'] for answer in answers)
+
+def test_followers_share_a_final_not_found():
+    answers, calls = asyncio.run(fetch_concurrently(SingleFlight(), [api_result('profile_not_found')]))
+    assert calls == 1
+    assert all(answer['error_type'] == 'profile_not_found' for answer in answers)
+
+@pytest.mark.parametrize('error_type', ['retry_later', 'cancelled', 'retry_budget', 'circuit_breaker',
+                                        'max_retries_exceeded'])
+def test_followers_fetch_again_after_a_context_bound_failure(error_type):
+    answers, calls = asyncio.run(fetch_concurrently(SingleFlight(), [api_result(error_type), api_result()]))
+    assert answers[0]['error_type'] == error_type
+    # The followers did not get the leader's answer; one of them led a second fetch the other shared
+    assert calls == 2
+    assert all(answer['success'] for answer in answers[1:])
+
+def test_shareable_results():
+    assert shareable_result(api_result())
+    assert shareable_result(api_result('access_denied'))
+    assert not shareable_result(api_result('retry_later'))
+    assert not shareable_result(None)
+
+def test_callers_in_other_lanes_or_modes_do_not_coalesce():
+    key = api_reliability_fix.single_flight_key
+    base = key('profile', 'steady', {})
+    assert key('profile', 'steady', {'priority': 'scheduled', 'job_id': 'a'}) == base
+    assert key('profile', 'steady', {'priority': 'interactive'}) != base
+    assert key('profile', 'steady', {'defer_retries': True}) != base
+    assert key('profile', 'steady', {'force_refresh': True}) != base
@@ -0,0 +1,119 @@
+"""
+Offline tests for tombstones
+============================
+
+Tombstone expiry, and the scraper entry points skipping a tombstoned handle
+before any API call. Redis is reported unavailable, so the store uses its
+per-process fallback, and the ScrapeCreators API is faked. Run with
+`python -m pytest`.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from offline_stubs import stub_scraper_imports
+
+stub_scraper_imports()
+
+import tombstones
+import UnifiedRescaper
+import UnifiedScraper
+from api_reliability_fix import api_call_scope
+
+async def no_redis():
+    return None
+
+class DirectLoop:
+    """Stand-in for client_loop that runs coroutines on the caller's loop."""
+
+    async def run(self, coro):
+        return await coro
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(tombstones, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+@pytest.fixture
+def offline(monkeypatch):
+    monkeypatch.setattr(tombstones, "get_async_redis", no_redis)
+    monkeypatch.setattr(tombstones, "client_loop", DirectLoop())
+
+# ==================== TOMBSTONES ====================
+
+def test_tombstone_expires_after_its_class_ttl(offline, clock):
+    store = tombstones.TombstoneStore(ttls={'not_found': 100, 'private': 10})
+    asyncio.run(store.bury('Instagram', '@Gone', 'not_found', 'HTTP 404'))
+    asyncio.run(store.bury('instagram', 'locked', 'private'))
+
+    clock.now += 50
+    assert asyncio.run(store.get('instagram', 'gone'))['failure_class'] == 'not_found'
+    assert asyncio.run(store.get('instagram', 'locked')) is None
+
+    clock.now += 50
+    assert asyncio.run(store.get('instagram', 'gone')) is None
+
+def test_tombstone_keeps_first_seen_until_it_expires(offline, clock, monkeypatch):
+    store = tombstones.TombstoneStore(ttls={'inactive': 100})
+    stamps = iter(['2026-01-01T00:00:00', '2026-01-02T00:00:00', '2026-03-01T00:00:00'])
+    monkeypatch.setattr(tombstones, "datetime", SimpleNamespace(utcnow=lambda: SimpleNamespace(isoformat=lambda: next(stamps))))
+
+    asyncio.run(store.bury('tiktok', 'quiet', 'inactive'))
+    clock.now += 10
+    asyncio.run(store.bury('tiktok', 'quiet', 'inactive'))
+    record = asyncio.run(store.get('tiktok', 'quiet'))
+    assert record['first_seen'] == '2026-01-01T00:00:00'
+    assert record['last_seen'] == '2026-01-02T00:00:00'
+
+    clock.now += 200
+    asyncio.run(store.bury('tiktok', 'quiet', 'inactive'))
+    assert asyncio.run(store.get('tiktok', 'quiet'))['first_seen'] == '2026-03-01T00:00:00'
+
+def test_find_tombstone_is_bypassed_by_force_refresh(offline, monkeypatch):
+    monkeypatch.setattr(tombstones, "tombstones", tombstones.TombstoneStore())
+    asyncio.run(tombstones.bury_handle('instagram', 'gone', 'not_found'))
+    assert asyncio.run(tombstones.find_tombstone('instagram', 'gone'))
+
+    async def forced():
+        with api_call_scope(force_refresh=True):
+            return await tombstones.find_tombstone('instagram', 'gone')
+    assert asyncio.run(forced()) is None
+
+# ==================== SCRAPER ENTRY POINTS ====================
+
+@pytest.fixture
+def tiktok_api(offline, monkeypatch):
+    """A TikTok API that answers profile_not_found; returns the handles it was asked for."""
+    calls = []
+
+    async def make_tiktok_api_call(username, api_key):
+        calls.append(username)
+        return {'success': False, 'data': None, 'error_type': 'profile_not_found', 'error_message': 'HTTP 404'}
+
+    monkeypatch.setattr(tombstones, "tombstones", tombstones.TombstoneStore())
+    monkeypatch.setattr(UnifiedRescaper, "make_tiktok_api_call", make_tiktok_api_call)
+    monkeypatch.setattr(UnifiedScraper, "make_tiktok_api_call", make_tiktok_api_call)
+    monkeypatch.setattr(UnifiedScraper, "run_api_call", asyncio.run)
+    return calls
+
+def test_rescrape_buries_a_missing_handle_and_skips_it_next_time(tiktok_api):
+    assert asyncio.run(UnifiedRescaper.scrape_tiktok_user_data('gone')) is None
+    result = asyncio.run(UnifiedRescaper.scrape_tiktok_user_data('@gone'))
+    assert result['tombstoned']
+    assert tiktok_api == ['gone']
+
+def test_new_creator_scrape_skips_a_tombstoned_handle(tiktok_api):
+    asyncio.run(tombstones.bury_handle('tiktok', 'gone', 'not_found'))
+    result = UnifiedScraper.process_tiktok_account('gone', 'key')
+    assert result['error'] == 'tombstoned'
+    assert tiktok_api == []
@@ -0,0 +1,108 @@
+"""
+Offline tests for the rescrape write-behind buffer
+==================================================
+
+Flushing, grouping by column set, deleted-creator handling and the
+one-by-one fallback, against an in-memory stand-in for the creatordata table
+and its bulk_update_creators RPC. Run with `python -m pytest`.
+"""
+
+import asyncio
+
+import pytest
+
+from offline_stubs import FakeSupabase, stub_scraper_imports
+
+stub_scraper_imports()
+
+import UnifiedRescaper
+
+@pytest.fixture
+def creatordata(monkeypatch):
+    rows = [{'id': i, 'handle': f'creator{i}', 'platform': 'Instagram', 'followers_count': 0} for i in range(1, 6)]
+    fake = FakeSupabase(rows)
+    monkeypatch.setattr(UnifiedRescaper, "supabase", fake)
+    return fake.creatordata
+
+def row(creator_id, **columns):
+    return {'id': creator_id, 'handle': f'creator{creator_id}', **columns}
+
+async def buffer_rows(buffer, rows):
+    errors = {}
+    for update in rows:
+        async def on_done(error, creator_id=update['id']):
+            errors[creator_id] = error
+        await buffer.add(update, on_done)
+    return errors
+
+def test_buffer_flushes_when_a_batch_fills(creatordata):
+    async def scenario():
+        buffer = UnifiedRescaper.WriteBehindBuffer(batch_size=3, interval=60)
+        errors = await buffer_rows(buffer, [row(i, followers_count=i) for i in (1, 2, 3, 4)])
+        assert len(creatordata.writes('bulk_update')) == 1
+        assert buffer.snapshot()['buffered'] == 1
+        await buffer.close()
+        return buffer, errors
+
+    buffer, errors = asyncio.run(scenario())
+    assert errors == {1: None, 2: None, 3: None, 4: None}
+    assert [len(params['updates']) for params in creatordata.writes('bulk_update')] == [3, 1]
+    assert creatordata.by_id(4)['followers_count'] == 4
+    assert buffer.snapshot()['rows'] == 4
+
+def test_buffer_flushes_after_the_interval(creatordata):
+    async def scenario():
+        buffer = UnifiedRescaper.WriteBehindBuffer(batch_size=50, interval=0.05)
+        errors = await buffer_rows(buffer, [row(1, followers_count=10)])
+        assert not creatordata.writes('bulk_update')
+        await asyncio.sleep(0.2)
+        return errors
+
+    assert asyncio.run(scenario()) == {1: None}
+    assert creatordata.by_id(1)['followers_count'] == 10
+
+def test_buffer_groups_rows_by_column_set(creatordata):
+    async def scenario():
+        buffer = UnifiedRescaper.WriteBehindBuffer(batch_size=50, interval=60)
+        await buffer_rows(buffer, [
+            row(1, followers_count=1, updated_at='x'),
+            row(2, buzz_score=5, recent_post_1={}, updated_at='x'),
+            row(3, updated_at='x', followers_count=3),
+            row(4, recent_post_1={}, buzz_score=5, updated_at='x'),
+        ])
+        await buffer.close()
+
+    asyncio.run(scenario())
+    writes = creatordata.writes('bulk_update')
+    assert sorted(sorted(update['id'] for update in params['updates']) for params in writes) == [[1, 3], [2, 4]]
+    assert all('id' not in params['update_columns'] for params in writes)
+
+def test_buffer_does_not_recreate_deleted_creators(creatordata):
+    creatordata.rows.remove(creatordata.by_id(2))
+
+    async def scenario():
+        buffer = UnifiedRescaper.WriteBehindBuffer(batch_size=3, interval=60)
+        errors = await buffer_rows(buffer, [row(i, followers_count=i) for i in (1, 2, 3)])
+        return buffer, errors
+
+    buffer, errors = asyncio.run(scenario())
+    assert errors == {1: None, 2: UnifiedRescaper.CREATOR_ROW_GONE, 3: None}
+    assert 2 not in {existing['id'] for existing in creatordata.rows}
+    assert buffer.snapshot()['deleted_during_job'] == 1
+
+def test_buffer_retries_a_failed_bulk_update_one_by_one(creatordata):
+    creatordata.fail_bulk_updates = True
+    creatordata.rows.remove(creatordata.by_id(3))
+
+    async def scenario():
+        buffer = UnifiedRescaper.WriteBehindBuffer(batch_size=3, interval=60)
+        errors = await buffer_rows(buffer, [row(i, followers_count=i * 10) for i in (1, 2, 3)])
+        return buffer, errors
+
+    buffer, errors = asyncio.run(scenario())
+    assert errors == {1: None, 2: None, 3: UnifiedRescaper.CREATOR_ROW_GONE}
+    assert creatordata.writes('update') == [{'handle': f'creator{i}', 'followers_count': i * 10} for i in (1, 2, 3)]
+    # The fallback is update-only too: the deleted creator stays deleted
+    assert 3 not in {existing['id'] for existing in creatordata.rows}
+    assert creatordata.by_id(2)['followers_count'] == 20
+    assert buffer.snapshot()['retried_one_by_one'] == 3
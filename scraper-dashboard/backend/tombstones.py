@@ -0,0 +1,133 @@
+"""
+Tombstones for Permanently Failed Handles
+=========================================
+
+Negative cache of creators that keep failing the same way, so daily rescrapes
+and CSV uploads stop spending profile credits on them:
+- not_found: the API returned 404 (deleted or renamed account)
+- private: the API returned access_denied
+- follower_range: follower count outside the 10k–350k window
+- inactive: no posts in the last 45 days
+
+Each tombstone records the handle, platform, failure class, reason and
+first/last seen time, and expires after its class's TTL. Tombstones live in
+Redis (shared by every worker) with a per-process fallback, and are checked
+before any upstream call. An `api_call_scope(force_refresh=True)` bypasses
+the check.
+
+Async callers `await find_tombstone(...)` / `await bury_handle(...)`;
+synchronous code wraps them in `run_api_call(...)`.
+"""
+
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from api_reliability_fix import (
+    api_call_context, client_loop, get_async_redis, mark_async_redis_failed, normalize_handle
+)
+
+# Days a tombstone lasts per failure class (override with TOMBSTONE_TTL_DAYS_<CLASS>)
+DEFAULT_TOMBSTONE_TTL_DAYS = {
+    'not_found': 30,
+    'private': 7,
+    'follower_range': 14,
+    'inactive': 14,
+}
+
+def load_tombstone_ttls() -> Dict[str, int]:
+    """Read per-class tombstone lifetimes (in seconds) from the environment."""
+    return {
+        failure_class: int(float(os.getenv(f"TOMBSTONE_TTL_DAYS_{failure_class.upper()}", days)) * 86400)
+        for failure_class, days in DEFAULT_TOMBSTONE_TTL_DAYS.items()
+    }
+
+class TombstoneStore:
+    """Tombstones in Redis hashes with per-class expiry; local dict when Redis is down.
+
+    Methods run on the API client loop (they share its async Redis client).
+    """
+
+    KEY_PREFIX = "tombstone:"
+
+    def __init__(self, ttls: Optional[Dict[str, int]] = None):
+        self.ttls = ttls or load_tombstone_ttls()
+        self._local = {}  # key -> (expires_at, record)
+
+    def key(self, platform: str, handle: str) -> str:
+        return f"{self.KEY_PREFIX}{platform.lower()}:{normalize_handle(handle)}"
+
+    async def get(self, platform: str, handle: str) -> Optional[Dict]:
+        """Return the live tombstone for a handle, or None."""
+        key = self.key(platform, handle)
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                record = await redis_client.hgetall(key)
+                return record or None
+            except Exception as e:
+                mark_async_redis_failed(e)
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, record = entry
+        if time.time() >= expires_at:
+            del self._local[key]
+            return None
+        return record
+
+    async def bury(self, platform: str, handle: str, failure_class: str, reason: str = '') -> Dict:
+        """Record (or refresh) a tombstone; first_seen is kept across repeats."""
+        ttl = self.ttls[failure_class]
+        key = self.key(platform, handle)
+        now = datetime.utcnow().isoformat()
+        record = {
+            'handle': normalize_handle(handle),
+            'platform': platform.lower(),
+            'failure_class': failure_class,
+            'reason': reason or '',
+            'last_seen': now,
+        }
+        redis_client = await get_async_redis()
+        if redis_client is not None:
+            try:
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    pipe.hsetnx(key, 'first_seen', now)
+                    pipe.hset(key, mapping=record)
+                    pipe.expire(key, ttl)
+                    await pipe.execute()
+                return record
+            except Exception as e:
+                mark_async_redis_failed(e)
+
+        previous = self._local.get(key)
+        first_seen = previous[1]['first_seen'] if previous and time.time() < previous[0] else now
+        self._local[key] = (time.time() + ttl, {**record, 'first_seen': first_seen})
+        return record
+
+tombstones = TombstoneStore()
+
+async def find_tombstone(platform: str, handle: str) -> Optional[Dict]:
+    """Tombstone that should stop this handle from being fetched, or None to go ahead."""
+    if api_call_context.get().get('force_refresh', False):
+        return None
+    tombstone = await client_loop.run(tombstones.get(platform, handle))
+    if tombstone:
+        print(f"🪦 Skipping @{handle} ({platform}): tombstoned as {tombstone.get('failure_class')} "
+              f"since {tombstone.get('first_seen', '?')[:10]}")
+    return tombstone
+
+async def bury_handle(platform: str, handle: str, failure_class: str, reason: str = ''):
+    """Tombstone a handle after a permanent failure (best effort - failures are logged, not raised)."""
+    try:
+        await client_loop.run(tombstones.bury(platform, handle, failure_class, reason))
+        print(f"🪦 Tombstoned @{handle} ({platform}) as {failure_class}")
+    except Exception as e:
+        print(f"⚠️ Failed to tombstone @{handle}: {e}")
+
+def tombstone_message(tombstone: Dict) -> str:
+    """One-line description of a tombstone for job results."""
+    return (f"Tombstoned: {tombstone.get('failure_class')} "
+            f"(first seen {tombstone.get('first_seen', '?')[:10]}, last seen {tombstone.get('last_seen', '?')[:10]})")